@@ -2,6 +2,7 @@ import os
 import uuid
 import bcrypt
 import jwt
+import threading
 from datetime import datetime, UTC
 from datetime import timedelta
 from fastapi import (
@@ -11,6 +12,10 @@ from fastapi import (
     Request as FastAPIRequest,
 )
 
+from pydantic import ValidationError
+from sqlalchemy import event, insert, select, update as sa_update, delete as sa_delete
+from sqlalchemy.exc import DBAPIError
+
 from backend.database import Session
 from backend.models import *
 from backend.exceptions import (
@@ -21,46 +26,24 @@ from backend.exceptions import (
 from backend.helpers import decode_jwt_token
 
 
-def get_model_relationships(model_class, db_session):
+def _build_join_plan(model_class, relationships, model_map):
     """
-    Get relationships for a model based on metadata_relationships table.
-    
+    Turn the metadata relationships of a model into the `joins` and
+    `list_joins` arguments of `BaseModel.get_items`.
+
     Args:
         model_class: The SQLAlchemy model class
-        db_session: Database session
-        
+        relationships (list): Active MetadataRelationship rows whose source
+            is `model_class`
+        model_map (dict): Class name -> model class
+
     Returns:
         dict: Dictionary with 'joins' and 'list_joins' lists containing relationship information
     """
-    if not hasattr(model_class, '__name__'):
-        return {'joins': [], 'list_joins': []}
-    
-    class_name = model_class.__name__
-    
-    # Query metadata relationships where this model is the source
-    relationships = db_session.query(MetadataRelationship).filter(
-        MetadataRelationship.source_object_type == class_name,
-        MetadataRelationship.status == 'active'
-    ).all()
-    
+
     joins = []
     list_joins = []
-    
-    # Build model map dynamically from all imported models
-    import sys
-    current_module = sys.modules[__name__]
-    model_map = {}
-    
-    # Get all classes from the current module that inherit from BaseModel
-    for name in dir(current_module):
-        obj = getattr(current_module, name)
-        if (hasattr(obj, '__mro__') and 
-            hasattr(obj, '__tablename__') and 
-            BaseModel in obj.__mro__ and 
-            obj != BaseModel
-        ):
-            model_map[obj.__name__] = obj
-    
+
     for relationship in relationships:
         target_model_class = model_map.get(relationship.target_object_type)
         if not target_model_class:
@@ -117,6 +100,211 @@ def get_model_relationships(model_class, db_session):
     return {'joins': joins, 'list_joins': list_joins}
 
 
+class RelationshipRegistry:
+    """
+    Process-wide cache of the join plans derived from the
+    metadata_relationships table, keyed by model class.
+
+    The plans are built with a single query the first time they are needed
+    (or eagerly at startup via `build()`, or `load()` with the relationships
+    of the compiled route registry) and reused for every request after
+    that. Writes to MetadataRelationship through the ORM invalidate the
+    registry automatically; anything else that changes the table (e.g. the
+    `rebuild` CLI) should call `invalidate()`.
+
+    The returned plans are shared between requests and must be treated as
+    read-only.
+    """
+
+    def __init__(self):
+        self._plans = {}
+        self._model_map = None
+        self._is_built = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.version = 0
+
+    @property
+    def model_map(self):
+        """
+        Map of class name -> model class for every concrete model. Built once
+        because it walks the whole `backend.models` namespace.
+        """
+
+        if self._model_map is None:
+            import sys
+            current_module = sys.modules[__name__]
+            model_map = {}
+
+            # Get all classes from the current module that inherit from BaseModel
+            for name in dir(current_module):
+                obj = getattr(current_module, name)
+                if (hasattr(obj, '__mro__') and
+                    hasattr(obj, '__tablename__') and
+                    BaseModel in obj.__mro__ and
+                    obj != BaseModel
+                ):
+                    model_map[obj.__name__] = obj
+            self._model_map = model_map
+        return self._model_map
+
+    def build(self, db_session):
+        """
+        Load every active relationship in one query and compute the join
+        plan of all models.
+        """
+
+        relationships = db_session.query(MetadataRelationship).filter(
+            MetadataRelationship.status == 'active',
+        ).all()
+        self.load(relationships)
+
+    def load(self, relationships):
+        """
+        Compute the join plan of all models from already loaded active
+        relationships, e.g. the ones of the compiled route registry.
+
+        Args:
+            relationships (list): Objects with `source_object_type`,
+            `target_object_type` and `relationship_type`
+        """
+
+        relationships_by_source = {}
+        for relationship in relationships:
+            relationships_by_source.setdefault(
+                relationship.source_object_type, [],
+            ).append(relationship)
+
+        plans = {}
+        for class_name, model_class in self.model_map.items():
+            plans[model_class] = _build_join_plan(
+                model_class,
+                relationships_by_source.get(class_name, []),
+                self.model_map,
+            )
+
+        with self._lock:
+            self._plans = plans
+            self._is_built = True
+            self.version += 1
+
+    def get(self, model_class, db_session):
+        """
+        Return the join plan of `model_class`, building the registry on the
+        first call.
+        """
+
+        plan = self._plans.get(model_class)
+        if plan is not None:
+            self.hits += 1
+            return plan
+
+        self.misses += 1
+        with self._lock:
+            is_built = self._is_built
+        if not is_built:
+            self.build(db_session)
+            plan = self._plans.get(model_class)
+            if plan is not None:
+                return plan
+
+        # Not a model we know about (e.g. defined outside backend.models)
+        relationships = db_session.query(MetadataRelationship).filter(
+            MetadataRelationship.source_object_type == getattr(model_class, '__name__', None),
+            MetadataRelationship.status == 'active',
+        ).all()
+        plan = _build_join_plan(model_class, relationships, self.model_map)
+        with self._lock:
+            self._plans[model_class] = plan
+        return plan
+
+    def get_joined_models(self, model_class):
+        """
+        The models joined (or list joined) by the plan of `model_class`.
+
+        Returns:
+            set | None: None if the plan isn't built yet
+        """
+
+        plan = self._plans.get(model_class)
+        if plan is None:
+            return None
+        return {join['model'] for join in (*plan['joins'], *plan['list_joins'])}
+
+    def invalidate(self):
+        """Drop all cached plans. They are rebuilt on the next lookup."""
+
+        with self._lock:
+            self._plans = {}
+            self._is_built = False
+
+    def stats(self):
+        return {
+            'is_built': self._is_built,
+            'models': len(self._plans),
+            'hits': self.hits,
+            'misses': self.misses,
+            'version': self.version,
+        }
+
+
+relationship_registry = RelationshipRegistry()
+
+
+# The registry is only invalidated once the writes to metadata_relationships
+# are committed: invalidating it at flush time would let another request
+# rebuild it from the old rows, and keep those after the commit. Like the
+# response cache, a flush or statement marks the session, and only the end of
+# the outermost transaction acts on the mark (not a savepoint).
+@event.listens_for(Session, 'after_flush')
+def _mark_flushed_relationships(session, flush_context):
+    if any(isinstance(instance, MetadataRelationship) for instance in (*session.new, *session.dirty, *session.deleted)):
+        session.info['relationship_registry_changed'] = True
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _mark_relationship_statements(orm_execute_state):
+    is_write = orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete
+    mapper = orm_execute_state.bind_mapper
+    if is_write and mapper is not None and mapper.class_ is MetadataRelationship:
+        orm_execute_state.session.info['relationship_registry_changed'] = True
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_relationship_registry(session):
+    if session.in_nested_transaction():
+        return
+    if session.info.pop('relationship_registry_changed', False):
+        relationship_registry.invalidate()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _forget_relationship_changes(session):
+    if session.in_nested_transaction():
+        return
+    session.info.pop('relationship_registry_changed', None)
+
+
+def get_model_relationships(model_class, db_session):
+    """
+    Get relationships for a model based on metadata_relationships table.
+    The result comes from `relationship_registry`, so the table is only
+    queried when the registry is cold or has been invalidated.
+    
+    Args:
+        model_class: The SQLAlchemy model class
+        db_session: Database session
+        
+    Returns:
+        dict: Dictionary with 'joins' and 'list_joins' lists containing relationship information
+    """
+    if not hasattr(model_class, '__name__'):
+        return {'joins': [], 'list_joins': []}
+
+    return relationship_registry.get(model_class, db_session)
+
+
 class BackgroundJobActions:
     @staticmethod
     def do_dummy_job(payload: dict):
@@ -130,6 +318,111 @@ class BackgroundJobActions:
         }
 
 
+def _validate_bulk_items(items, pydantic_model, exclude_unset):
+    """
+    Validate every item of a bulk request with the generated pydantic model.
+
+    Returns:
+        tuple: ([(index, payload)] of the valid items, errors of the others)
+    """
+
+    valid_items = []
+    errors = []
+    for index, item in enumerate(items):
+        try:
+            payload = pydantic_model.model_validate(item).model_dump(exclude_unset=exclude_unset)
+        except ValidationError as e:
+            errors.extend(
+                {
+                    'index': index,
+                    'field': '.'.join(str(loc) for loc in error['loc']),
+                    'description': error['msg'],
+                }
+                for error in e.errors()
+            )
+            continue
+        valid_items.append((index, payload))
+    return valid_items, errors
+
+
+def _write_bulk(db_session, rows, write, atomic):
+    """
+    Write all rows with one statement. If that fails and the request isn't
+    atomic, write them one by one (each in its own savepoint) to find and
+    skip the rows that fail.
+
+    Args:
+        rows (list): (index, payload) of every row
+        write (callable): Writes a list of payloads, returns the written items
+        atomic (bool): Fail the whole request if any row fails
+
+    Returns:
+        tuple: (written items, errors)
+    """
+
+    if not rows:
+        return [], []
+
+    try:
+        with db_session.begin_nested():
+            return write([payload for _, payload in rows]), []
+    except DBAPIError as e:
+        if atomic:
+            raise InvalidRequestData(
+                message='Could not write the items',
+                errors=[{
+                    'field': 'items',
+                    'description': str(e.orig).strip(),
+                }],
+            ) from e
+
+    written_items = []
+    errors = []
+    for index, payload in rows:
+        try:
+            with db_session.begin_nested():
+                written_items.extend(write([payload]))
+        except DBAPIError as e:
+            errors.append({
+                'index': index,
+                'field': 'item',
+                'description': str(e.orig).strip(),
+            })
+    return written_items, errors
+
+
+def _get_written_items(model_class, items, db_session, return_mode):
+    """
+    The response items of a write, based on the `return` mode (see
+    WRITE_RETURN_MODES).
+
+    Args:
+        items (list): The written model instances
+    """
+
+    if return_mode == 'minimal':
+        return [{'id': item.id} for item in items]
+    if return_mode == 'representation':
+        return [item.to_dict() for item in items]
+
+    ids = [item.id for item in items]
+    if not ids:
+        return []
+    relationships = get_model_relationships(model_class, db_session)
+    item_dicts, _ = model_class.get_items(
+        db_session=db_session,
+        raw_filters=[model_class.id.in_(ids)],
+        details=True,
+        joins=relationships['joins'],
+        list_joins=relationships['list_joins'],
+        pagination={'count_mode': 'none'},
+        projection=True,
+        list_join_strategy='select_in',
+    )
+    item_dicts_by_id = {item_dict['id']: item_dict for item_dict in item_dicts}
+    return [item_dicts_by_id[id_item] for id_item in ids if id_item in item_dicts_by_id]
+
+
 class DynamicActions:
     @staticmethod
     def get_one(model_class, id_item, db_session):
@@ -142,6 +435,8 @@ class DynamicActions:
             details=True,
             joins=relationships['joins'],
             list_joins=relationships['list_joins'],
+            projection=True,
+            list_join_strategy='select_in',
         )
         if not item:
             raise ResourceNotFound(
@@ -172,11 +467,39 @@ class DynamicActions:
             pagination=pagination,
             joins=relationships['joins'],
             list_joins=relationships['list_joins'],
+            projection=True,
+            list_join_strategy='select_in',
         )
         return items, pagination
 
     @staticmethod
-    def create(model_class, data, db_session):
+    def get_validators(
+        model_class,
+        db_session,
+        id_item=None,
+        filters=None,
+        q=None,
+        secondary_models_map={},
+    ):
+        """
+        Validators of the get_one (with `id_item`) or get_all response, for
+        conditional GETs. See `BaseModel.get_validators`.
+        """
+
+        relationships = get_model_relationships(model_class, db_session)
+
+        return model_class.get_validators(
+            db_session=db_session,
+            id=id_item,
+            filters=filters,
+            q=q,
+            secondary_models_map=secondary_models_map,
+            joins=relationships['joins'],
+            list_joins=relationships['list_joins'],
+        )
+
+    @staticmethod
+    def create(model_class, data, db_session, return_mode='representation'):
         # Only allow columns marked as initializable during creation
         initializable_fields = [
             column.name
@@ -199,34 +522,14 @@ class DynamicActions:
 
         create_kwargs = {field: data[field] for field in initializable_fields if field in data}
 
-        try:
-            item = model_class(**create_kwargs)
-        except TypeError as exc:
-            raise InvalidRequestData(
-                message='Invalid payload for create request',
-                errors=[
-                    {
-                        'field': 'payload',
-                        'description': str(exc),
-                    }
-                ],
-            ) from exc
-
-        db_session.add(item)
-        db_session.flush()
-        db_session.refresh(item)
-
-        relationships = get_model_relationships(model_class, db_session)
-        return model_class.get_items(
-            db_session=db_session,
-            id=item.id,
-            details=True,
-            joins=relationships['joins'],
-            list_joins=relationships['list_joins'],
-        )
+        # The whole row comes back from the INSERT, no refresh needed
+        item = db_session.scalars(
+            insert(model_class).values(**create_kwargs).returning(model_class)
+        ).one()
+        return _get_written_items(model_class, [item], db_session, return_mode)[0]
 
     @staticmethod
-    def update(model_class, data, db_session, **identifiers):
+    def update(model_class, data, db_session, return_mode='representation', **identifiers):
         if not identifiers:
             raise InvalidRequestData(
                 message='Missing identifier for update request',
@@ -234,12 +537,6 @@ class DynamicActions:
 
         identifier_field, identifier_value = next(iter(identifiers.items()))
 
-        item = db_session.get(model_class, identifier_value)
-        if not item or getattr(item, 'deleted_at', None):
-            raise ResourceNotFound(
-                message=f"{model_class.__table__.info['name']} with {identifier_field} {identifier_value} not found",
-            )
-
         if hasattr(data, 'model_dump'):
             payload = data.model_dump(exclude_unset=True)
         elif hasattr(data, 'dict'):
@@ -261,19 +558,21 @@ class DynamicActions:
                 message='Invalid fields in update request',
             )
 
-        # Use the model's helper to apply the updates; it already validates fields
-        item.update(payload)
-        db_session.flush()
-        db_session.refresh(item)
+        # A single UPDATE ... RETURNING both finds and updates the item
+        conditions = [model_class.id == identifier_value]
+        if hasattr(model_class, 'deleted_at'):
+            conditions.append(model_class.deleted_at == None)
+        if payload:
+            statement = sa_update(model_class).where(*conditions).values(**payload).returning(model_class)
+        else:
+            statement = select(model_class).where(*conditions)
+        item = db_session.scalars(statement).one_or_none()
+        if not item:
+            raise ResourceNotFound(
+                message=f"{model_class.__table__.info['name']} with {identifier_field} {identifier_value} not found",
+            )
 
-        relationships = get_model_relationships(model_class, db_session)
-        return model_class.get_items(
-            db_session=db_session,
-            id=item.id,
-            details=True,
-            joins=relationships['joins'],
-            list_joins=relationships['list_joins'],
-        )
+        return _get_written_items(model_class, [item], db_session, return_mode)[0]
 
     @staticmethod
     def delete(model_class, db_session, **identifiers):
@@ -308,6 +607,253 @@ class DynamicActions:
             'deleted': True,
         }
 
+    @staticmethod
+    def bulk_create(
+        model_class,
+        items,
+        db_session,
+        pydantic_model,
+        atomic=True,
+        return_mode='representation',
+    ):
+        """
+        Create many items with one multi-row INSERT ... RETURNING.
+
+        Args:
+            items (list): Raw item dicts, validated here with `pydantic_model`
+            atomic (bool): If True, any invalid item fails the whole request.
+                Otherwise the valid items are created and the others are
+                reported in the errors.
+            return_mode (str): One of WRITE_RETURN_MODES
+
+        Returns:
+            tuple: (created items, per-item errors)
+        """
+
+        initializable_fields = {
+            column.name
+            for column in model_class.__table__.columns
+            if column.info.get('is_initializable')
+        }
+
+        valid_items, errors = _validate_bulk_items(items, pydantic_model, exclude_unset=False)
+        rows = []
+        for index, payload in valid_items:
+            invalid_fields = [field for field in payload if field not in initializable_fields]
+            if invalid_fields:
+                errors.extend(
+                    {
+                        'index': index,
+                        'field': field,
+                        'description': 'Field cannot be set during creation',
+                    }
+                    for field in invalid_fields
+                )
+                continue
+            rows.append((index, payload))
+
+        if errors and atomic:
+            raise InvalidRequestData(
+                errors=errors,
+                message='Invalid items in bulk create request',
+            )
+
+        statement = insert(model_class).returning(model_class, sort_by_parameter_order=True)
+        created_items, write_errors = _write_bulk(
+            db_session,
+            rows,
+            lambda payloads: db_session.scalars(statement, payloads).all(),
+            atomic,
+        )
+        errors.extend(write_errors)
+
+        return (
+            _get_written_items(model_class, created_items, db_session, return_mode),
+            sorted(errors, key=lambda error: error['index']),
+        )
+
+    @staticmethod
+    def bulk_update(
+        model_class,
+        items,
+        db_session,
+        pydantic_model,
+        atomic=True,
+        return_mode='representation',
+    ):
+        """
+        Update many items by their `id` with one executemany UPDATE.
+
+        Args:
+            items (list): Raw item dicts with an `id` and the fields to update
+            atomic (bool): If True, any invalid or missing item fails the
+                whole request. Otherwise the others are still updated.
+            return_mode (str): One of WRITE_RETURN_MODES
+
+        Returns:
+            tuple: (updated items, per-item errors)
+        """
+
+        errors = []
+        items_with_id = []
+        for index, item in enumerate(items):
+            id_item = item.get('id') if isinstance(item, dict) else None
+            if not isinstance(id_item, int) or isinstance(id_item, bool):
+                errors.append({
+                    'index': index,
+                    'field': 'id',
+                    'description': 'An integer id is required',
+                })
+                continue
+            items_with_id.append((index, id_item, item))
+
+        existing_ids = set()
+        ids = [id_item for _, id_item, _ in items_with_id]
+        if ids:
+            query = select(model_class.id).where(model_class.id.in_(ids))
+            if hasattr(model_class, 'deleted_at'):
+                query = query.where(model_class.deleted_at == None)
+            existing_ids = set(db_session.scalars(query))
+
+        updateable_fields = set(getattr(model_class, 'updateable_fields', []))
+        rows = []
+        for index, id_item, item in items_with_id:
+            if id_item not in existing_ids:
+                errors.append({
+                    'index': index,
+                    'field': 'id',
+                    'description': f"{model_class.__table__.info['name']} with id {id_item} not found",
+                })
+                continue
+
+            valid_items, item_errors = _validate_bulk_items(
+                [{key: value for key, value in item.items() if key != 'id'}],
+                pydantic_model,
+                exclude_unset=True,
+            )
+            if item_errors:
+                errors.extend({**error, 'index': index} for error in item_errors)
+                continue
+
+            payload = valid_items[0][1]
+            invalid_fields = [field for field in payload if field not in updateable_fields]
+            if invalid_fields:
+                errors.extend(
+                    {
+                        'index': index,
+                        'field': field,
+                        'description': 'Field cannot be updated',
+                    }
+                    for field in invalid_fields
+                )
+                continue
+            rows.append((index, {'id': id_item, **payload}))
+
+        if errors and atomic:
+            raise InvalidRequestData(
+                errors=errors,
+                message='Invalid items in bulk update request',
+            )
+
+        def write(payloads):
+            # Items without any field to update are left as they are
+            payloads = [payload for payload in payloads if len(payload) > 1]
+            if payloads:
+                db_session.execute(sa_update(model_class), payloads)
+            return []
+
+        _, write_errors = _write_bulk(db_session, rows, write, atomic)
+        errors.extend(write_errors)
+
+        failed_indexes = {error['index'] for error in write_errors}
+        updated_ids = [payload['id'] for index, payload in rows if index not in failed_indexes]
+        updated_items = []
+        if updated_ids:
+            # Bulk updates by primary key don't refresh the loaded objects
+            updated_items_by_id = {
+                item.id: item
+                for item in db_session.scalars(
+                    select(model_class)
+                    .where(model_class.id.in_(updated_ids))
+                    .execution_options(populate_existing=True)
+                )
+            }
+            updated_items = [updated_items_by_id[id_item] for id_item in updated_ids]
+
+        return (
+            _get_written_items(model_class, updated_items, db_session, return_mode),
+            sorted(errors, key=lambda error: error['index']),
+        )
+
+    @staticmethod
+    def bulk_delete(model_class, ids, db_session, atomic=True):
+        """
+        Delete many items by id with one statement. Soft deletes (sets
+        `deleted_at`) when the model has that column.
+
+        Args:
+            ids (list): IDs of the items to delete
+            atomic (bool): If True, a missing item fails the whole request.
+                Otherwise the others are still deleted.
+
+        Returns:
+            tuple: (deleted items, per-item errors)
+        """
+
+        has_deleted_at = hasattr(model_class, 'deleted_at')
+        query = select(model_class.id).where(model_class.id.in_(ids))
+        if has_deleted_at:
+            query = query.where(model_class.deleted_at == None)
+        existing_ids = set(db_session.scalars(query))
+
+        errors = [
+            {
+                'index': index,
+                'field': 'id',
+                'description': f"{model_class.__table__.info['name']} with id {id_item} not found",
+            }
+            for index, id_item in enumerate(ids)
+            if id_item not in existing_ids
+        ]
+        if errors and atomic:
+            raise InvalidRequestData(
+                errors=errors,
+                message='Invalid items in bulk delete request',
+            )
+
+        if not existing_ids:
+            return [], errors
+
+        if has_deleted_at:
+            deleted_at = datetime.now(UTC)
+            db_session.execute(
+                sa_update(model_class)
+                .where(model_class.id.in_(existing_ids))
+                .values(deleted_at=deleted_at),
+                execution_options={'synchronize_session': False},
+            )
+            deleted_items = [
+                {
+                    'id': id_item,
+                    'deleted': True,
+                    'deleted_at': deleted_at.isoformat(),
+                }
+                for id_item in sorted(existing_ids)
+            ]
+        else:
+            db_session.execute(
+                sa_delete(model_class).where(model_class.id.in_(existing_ids)),
+                execution_options={'synchronize_session': False},
+            )
+            deleted_items = [
+                {
+                    'id': id_item,
+                    'deleted': True,
+                }
+                for id_item in sorted(existing_ids)
+            ]
+        return deleted_items, errors
+
 
 class UserActions:
     @staticmethod
@@ -675,6 +1221,8 @@ class MetadataActions:
                     'limit': 500,
                 },
             ],
+            projection=True,
+            list_join_strategy='select_in',
         )
         return metadata_objects, pagination
 
@@ -0,0 +1,818 @@
+"""
+Bulk loading of the seed CSV files, for the `rebuild` CLI.
+
+A loader reads its CSV into a DataFrame and coerces it a column at a time
+(`map_columns` and the `to_*` functions), resolves its foreign keys with
+`map_ids`, drops the rows it can't load with `skip_rows` (and the rows
+already loaded with `skip_existing`), and writes what's left with
+`bulk_insert`:
+
+- COPY FROM STDIN on PostgreSQL (psycopg2)
+- batches of multi-row INSERTs anywhere else, or with BULK_LOAD_METHOD=insert
+
+The loaders are wrapped in `bulk_loader`, which times them and reports the
+rows/s of every table. `run_loaders` runs them on a pool of threads, each
+one once the loaders of the tables it depends on are done: the tables its
+table references with a foreign key, and the ones given in `depends_on`.
+
+For the `incremental` CLI, every loader also lists the CSV files it reads.
+The content hashes of the files last loaded are kept in SEED_HASH_FILE, and
+`get_dependent_loaders` gives the loaders to run again for the files that
+changed since: theirs, and the ones of the tables that depend on them.
+
+SEED_CSV_DIR is the directory of the CSV files (data/csv by default), and
+SEED_LOAD_WORKERS the number of tables loaded at the same time.
+"""
+
+import io
+import os
+import json
+import time
+import hashlib
+import functools
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+import numpy as np
+import pandas as pd
+
+from sqlalchemy import delete, insert, null, select, text, Integer, Boolean, JSON, ARRAY
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from backend.database import SessionLocal
+
+
+SEED_CSV_DIR = os.getenv('SEED_CSV_DIR', 'data/csv')
+
+# auto: COPY when the driver supports it, INSERTs otherwise
+BULK_LOAD_METHOD = os.getenv('BULK_LOAD_METHOD', 'auto')
+BULK_INSERT_BATCH_SIZE = int(os.getenv('BULK_INSERT_BATCH_SIZE', '5000'))
+# 1 loads the tables one after the other
+SEED_LOAD_WORKERS = int(os.getenv('SEED_LOAD_WORKERS', '4'))
+# What the database was last loaded from, for `incremental`
+SEED_HASH_FILE = os.getenv('SEED_HASH_FILE', 'data/seed_hashes.json')
+
+TRUE_VALUES = ('true', '1', 'yes', 'y')
+FALSE_VALUES = ('false', '0', 'no', 'n')
+
+# (label, table name, rows, seconds) of every load of this process
+load_stats = []
+
+
+def get_csv_path(file_name):
+    return os.path.join(SEED_CSV_DIR, file_name)
+
+
+def read_seed_csv(file_name, label):
+    """
+    Read a seed CSV file.
+
+    Args:
+        file_name (str): Name of the file in SEED_CSV_DIR
+        label (str): What the file holds, for the messages (e.g. 'buyers')
+
+    Returns:
+        DataFrame | None: None if the file is missing or unreadable
+    """
+
+    csv_path = get_csv_path(file_name)
+    if not os.path.exists(csv_path):
+        print(f"Info: {csv_path} not found, skipping {label} load")
+        return None
+
+    try:
+        return pd.read_csv(csv_path)
+    except Exception:
+        print(f"Warning: Failed to read {csv_path}, skipping {label} load")
+        return None
+
+
+def get_csv_column(df, csv_column, default=None):
+    """
+    A column of the CSV, or a column of `default` if the CSV doesn't have it.
+    """
+
+    if csv_column in df.columns:
+        return df[csv_column]
+    return pd.Series(default, index=df.index, dtype=object)
+
+
+def to_str(series):
+    """
+    Values as stripped strings.
+    """
+
+    return series.where(series.isna(), series.astype(str).str.strip())
+
+
+def strip_strings(series):
+    """
+    The strings stripped, the other values kept as they are.
+    """
+
+    if series.dtype != object:
+        return series
+    stripped = series.str.strip()
+    return series.where(stripped.isna(), stripped)
+
+
+def to_upper(series):
+    return series.where(series.isna(), series.astype(str).str.strip().str.upper())
+
+
+def to_lower(series):
+    return series.where(series.isna(), series.astype(str).str.strip().str.lower())
+
+
+def to_number(series, strip=''):
+    """
+    Floats, NaN where the value isn't a number.
+
+    Args:
+        strip (str): Characters removed before parsing (e.g. '£,' or '%')
+    """
+
+    if strip and series.dtype == object:
+        series = series.astype(str).str.strip()
+        for character in strip:
+            series = series.str.replace(character, '', regex=False)
+    return pd.to_numeric(series, errors='coerce')
+
+
+def to_int(series, default=None, strip=''):
+    """
+    Integers, truncated like `int()`. The values that aren't numbers
+    become `default`.
+    """
+
+    numbers = to_number(series, strip=strip)
+    result = pd.Series(np.trunc(numbers), index=series.index).astype('Int64')
+    return _fill_invalid(result, series, numbers, default)
+
+
+def to_float(series, default=None, strip=''):
+    """
+    Floats. The values that aren't numbers become `default`.
+    """
+
+    numbers = to_number(series, strip=strip)
+    return _fill_invalid(numbers.astype(object), series, numbers, default)
+
+
+def to_bool(series, true_values=TRUE_VALUES, false_values=None, default=False):
+    """
+    Booleans, from their usual spellings.
+
+    Args:
+        true_values: Lowercase values read as True
+        false_values: Lowercase values read as False. If None, everything
+        else is False, otherwise the values of neither become `default`.
+    """
+
+    normalized = series.astype(str).str.strip().str.lower()
+    is_true = normalized.isin(true_values)
+    result = pd.Series(is_true, index=series.index, dtype=object)
+    if false_values is not None:
+        result[~is_true & ~normalized.isin(false_values)] = default
+    return result.where(series.notna(), None)
+
+
+def to_datetime(series, utc=True):
+    """
+    Timestamps in any of the formats `pd.to_datetime` reads. Timestamps
+    without a time zone are taken as UTC. The invalid ones become NaT.
+    """
+
+    return pd.to_datetime(series, errors='coerce', utc=utc, format='mixed')
+
+
+def to_date(series):
+    return to_datetime(series).dt.date.where(lambda dates: dates.notna(), None)
+
+
+def to_json(series):
+    """
+    Decoded JSON strings, None where the JSON is invalid. Values that
+    aren't strings are kept as they are.
+    """
+
+    def decode(value):
+        if not isinstance(value, str):
+            return value
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return None
+
+    return series.map(decode, na_action='ignore')
+
+
+def to_choice(series, choices, default=None, normalize=to_lower):
+    """
+    Normalized values, `default` where they aren't one of `choices`
+    (missing values included).
+    """
+
+    normalized = normalize(series)
+    return normalized.where(normalized.isin(list(choices)), default)
+
+
+def fill_missing(series, value):
+    """
+    `value` where `series` is missing, e.g. for a default that isn't the
+    model's.
+    """
+
+    return series.where(series.notna(), value)
+
+
+def _fill_invalid(result, series, numbers, default):
+    invalid = series.notna() & numbers.isna()
+    if invalid.any():
+        result = result.astype(object)
+        result[invalid] = default
+    return result
+
+
+def map_columns(model_class, df, column_mapping, converters=None):
+    """
+    The columns of `df` renamed to the columns of the model and coerced.
+
+    A value missing from the CSV gets the default of the model's column,
+    like an attribute that isn't passed to the model. A value that can't
+    be converted gets whatever the converter returns for it.
+
+    Args:
+        model_class: The model the rows are for
+        df: The CSV
+        column_mapping (dict): CSV column -> model column. CSV columns
+        that don't exist are left out.
+        converters (dict): Model column -> function(Series) -> Series
+
+    Returns:
+        DataFrame
+    """
+
+    converters = converters or {}
+    table = model_class.__table__
+    frame = pd.DataFrame(index=df.index)
+    for csv_column, db_column in column_mapping.items():
+        if csv_column not in df.columns:
+            continue
+        values = df[csv_column]
+        converter = converters.get(db_column)
+        converted = converter(values) if converter else values.astype(object)
+        missing = values.isna()
+        if missing.any() and db_column in table.c:
+            default = _get_default_value(table.c[db_column])
+            converted = converted.astype(object)
+            converted[missing] = pd.Series([default] * missing.sum(), index=values.index[missing], dtype=object)
+        frame[db_column] = converted
+    return frame
+
+
+def map_ids(series, mapping):
+    """
+    Ids of the values of `series` (e.g. names) in `mapping`, NA for the
+    missing and unknown ones.
+
+    Args:
+        series: The values to resolve
+        mapping (dict): Value -> id
+
+    Returns:
+        Series: Nullable integers
+    """
+
+    keys = series.where(series.isna(), series.astype(str).str.strip())
+    return keys.map(mapping).astype('Int64')
+
+
+def skip_rows(frame, mask, message):
+    """
+    `frame` without the rows of `mask`, printing a warning for each.
+
+    Args:
+        frame: The rows
+        mask: Boolean Series, True for the rows to skip
+        message: The warning, or a function(row) -> warning
+
+    Returns:
+        DataFrame
+    """
+
+    mask = mask.fillna(False).astype(bool)
+    if not mask.any():
+        return frame
+    for _, row in frame[mask].iterrows():
+        print(message(row) if callable(message) else message)
+    return frame[~mask]
+
+
+def skip_invalid_ids(frame, column, valid_ids, entity_name, item_name, is_required=True):
+    """
+    `frame` without the rows whose `column` isn't one of `valid_ids` (not
+    checked if there are none), or is missing when `is_required`.
+
+    Args:
+        column (str): The id column
+        valid_ids (set): The existing ids
+        entity_name (str): What the ids are of, for the warnings
+        item_name (str): What the rows are, for the warnings
+    """
+
+    if is_required:
+        frame = skip_rows(
+            frame,
+            frame[column].isna(),
+            f"Warning: No {entity_name} ID provided, skipping {item_name}",
+        )
+    if valid_ids:
+        frame = skip_rows(
+            frame,
+            frame[column].notna() & ~frame[column].isin(valid_ids),
+            lambda row: f"Warning: {entity_name} ID {row[column]} not found, skipping {item_name}",
+        )
+    return frame
+
+
+def skip_existing(db_session, model_class, frame, column, item_name):
+    """
+    `frame` without the rows whose natural key is already in the table, so
+    that loading the same rows twice doesn't insert them twice. The
+    existing keys are fetched in one query. The rows repeating the key of
+    an earlier row are skipped too, with a warning.
+
+    Args:
+        db_session: Database session
+        model_class: The model of the table
+        frame: The rows
+        column (str): The natural key, a unique column of the model
+        item_name (str): What the rows are, for the warnings
+
+    Returns:
+        DataFrame
+    """
+
+    existing_keys = set(db_session.execute(select(model_class.__table__.c[column])).scalars())
+    frame = frame[~frame[column].isin(existing_keys)]
+    key_name = column.replace('_', ' ')
+    return skip_rows(
+        frame,
+        frame[column].duplicated(),
+        lambda row: f"Warning: Duplicate {key_name} {row[column]}, skipping {item_name}",
+    )
+
+
+def _get_default_value(column):
+    default = column.default
+    if default is None or not (default.is_scalar or default.is_callable):
+        return None
+    if default.is_callable:
+        return default.arg(None)
+    return default.arg
+
+
+def _with_defaults(table, frame):
+    # The Python defaults of the columns without values, since COPY only
+    # applies the server defaults
+    frame = frame.copy()
+    for column in table.columns:
+        if column.name in frame.columns or column.primary_key:
+            continue
+        if column.default is not None:
+            frame[column.name] = [_get_default_value(column)] * len(frame)
+    return frame
+
+
+def _to_copy_values(series, column_type):
+    # A column in the text format of COPY: \N for NULL, and the backslash,
+    # tab and newline characters escaped
+    missing = series.isna() if series.dtype != object else series.map(_is_missing)
+    if isinstance(column_type, Boolean):
+        values = series.map(_to_boolean_literal, na_action='ignore')
+    elif isinstance(column_type, Integer) and series.dtype.kind == 'f':
+        values = series.astype('Int64').astype(str)
+    elif series.dtype.kind == 'M':
+        values = series.dt.strftime('%Y-%m-%d %H:%M:%S.%f%z')
+    elif isinstance(column_type, ARRAY):
+        values = series.map(_to_array_literal, na_action='ignore')
+    elif isinstance(column_type, JSON):
+        values = series.map(json.dumps, na_action='ignore')
+    elif series.dtype == object:
+        values = series.map(str, na_action='ignore')
+    else:
+        values = series.astype(str)
+
+    values = values.astype(object)
+    values[missing] = None
+    if values.notna().any():
+        values = (
+            values.str.replace('\\', '\\\\', regex=False)
+            .str.replace('\t', '\\t', regex=False)
+            .str.replace('\n', '\\n', regex=False)
+            .str.replace('\r', '\\r', regex=False)
+        )
+    return values.fillna('\\N')
+
+
+def _is_missing(value):
+    # pd.isna() is elementwise on lists and dicts
+    return value is None or (not isinstance(value, (list, dict)) and pd.isna(value))
+
+
+def _to_boolean_literal(value):
+    if isinstance(value, (bool, np.bool_)):
+        return 't' if value else 'f'
+    return str(value)
+
+
+def _to_array_literal(values):
+    items = []
+    for value in values:
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"')
+        items.append(f'"{value}"')
+    return '{' + ','.join(items) + '}'
+
+
+def _get_copy_cursor(connection):
+    if BULK_LOAD_METHOD == 'insert' or connection.dialect.name != 'postgresql':
+        return None
+    cursor = connection.connection.driver_connection.cursor()
+    return cursor if hasattr(cursor, 'copy_expert') else None
+
+
+def _copy_rows(connection, cursor, table, frame):
+    preparer = connection.dialect.identifier_preparer
+    columns = list(frame.columns)
+    values = [_to_copy_values(frame[name], table.c[name].type) for name in columns]
+    lines = values[0].str.cat(values[1:], sep='\t') if len(values) > 1 else values[0]
+
+    buffer = io.StringIO()
+    buffer.write('\n'.join(lines))
+    buffer.write('\n')
+    buffer.seek(0)
+
+    column_names = ', '.join(preparer.quote(name) for name in columns)
+    cursor.copy_expert(f'COPY {preparer.format_table(table)} ({column_names}) FROM STDIN', buffer)
+
+
+def _to_records(table, frame):
+    # A None is bound as the JSON 'null' on JSON columns, COPY writes SQL NULL
+    json_columns = {
+        name for name in frame.columns
+        if isinstance(table.c[name].type, JSON)
+    }
+    records = frame.astype(object).where(frame.notna(), None).to_dict('records')
+    for record in records:
+        for key, value in record.items():
+            if isinstance(value, pd.Timestamp):
+                record[key] = value.to_pydatetime()
+            elif value is None and key in json_columns:
+                record[key] = null()
+    return records
+
+
+def _insert_rows(connection, table, frame):
+    for start in range(0, len(frame), BULK_INSERT_BATCH_SIZE):
+        records = _to_records(table, frame.iloc[start:start + BULK_INSERT_BATCH_SIZE])
+        connection.execute(insert(table), records)
+
+
+def bulk_insert(db_session, model_class, frame):
+    """
+    Insert the rows of `frame` in the table of the model, in the
+    transaction of `db_session`, without creating model instances. The
+    columns missing from `frame` get their defaults.
+
+    Args:
+        db_session: Database session, committed by the caller
+        model_class: The model of the table
+        frame: DataFrame with a column per model column
+
+    Returns:
+        int: The number of rows inserted
+    """
+
+    if frame is None or not len(frame):
+        return 0
+
+    table = model_class.__table__
+    frame = _with_defaults(table, frame)
+    connection = db_session.connection()
+    cursor = _get_copy_cursor(connection)
+    if cursor is not None:
+        with cursor:
+            _copy_rows(connection, cursor, table, frame)
+    else:
+        _insert_rows(connection, table, frame)
+    return len(frame)
+
+
+def insert_frame(model_class, frame):
+    """
+    `bulk_insert` in its own session, committed.
+
+    Returns:
+        int: The number of rows inserted
+    """
+
+    db_session = SessionLocal()
+    try:
+        total_rows = bulk_insert(db_session, model_class, frame)
+        db_session.commit()
+        return total_rows
+    finally:
+        db_session.close()
+
+
+def bulk_loader(model_class, label, depends_on=(), csv_files=None):
+    """
+    Decorator of the loaders of a table. A loader returns the number of
+    rows it inserted, or None if it had nothing to load. The load is
+    timed and reported with its rate.
+
+    Args:
+        model_class: The model of the table loaded
+        label (str): What the table holds, for the messages
+        depends_on: Models whose rows the loader needs, besides the ones
+        of the foreign keys of its table (e.g. for lookups by name)
+        csv_files: Names of the CSV files the loader reads, the one named
+        after its table by default
+    """
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start_time = time.perf_counter()
+            total_rows = function(*args, **kwargs)
+            if total_rows is None:
+                return None
+            duration = time.perf_counter() - start_time
+            load_stats.append((label, model_class.__tablename__, total_rows, duration))
+            rate = total_rows / duration if duration else 0
+            print(f"Loaded {total_rows} {label} into the database in {duration:.2f}s ({rate:,.0f} rows/s)")
+            return total_rows
+
+        wrapper.model_class = model_class
+        wrapper.label = label
+        wrapper.depends_on = tuple(depends_on)
+        wrapper.csv_files = (
+            tuple(csv_files) if csv_files is not None
+            else (f'{model_class.__tablename__}.csv',)
+        )
+        return wrapper
+
+    return decorator
+
+
+def get_loader_dependencies(loaders):
+    """
+    The loaders each loader has to wait for: the loaders of the tables its
+    table references with a foreign key, and of its `depends_on` models.
+
+    Args:
+        loaders: Functions decorated with `bulk_loader`
+
+    Returns:
+        dict: Loader -> list of loaders
+    """
+
+    loaders_by_table = {}
+    for loader in loaders:
+        loaders_by_table.setdefault(loader.model_class.__tablename__, []).append(loader)
+
+    dependencies = {}
+    for loader in loaders:
+        table = loader.model_class.__table__
+        table_names = {foreign_key.column.table.name for foreign_key in table.foreign_keys}
+        table_names.update(model_class.__tablename__ for model_class in loader.depends_on)
+        table_names.discard(table.name)
+        dependencies[loader] = [
+            dependency
+            for table_name in sorted(table_names)
+            for dependency in loaders_by_table.get(table_name, [])
+        ]
+    return dependencies
+
+
+def run_loaders(loaders, workers=SEED_LOAD_WORKERS):
+    """
+    Run the loaders on a pool of threads, each one as soon as the loaders
+    it depends on are done (in the order of `loaders` when several are
+    ready). Every loader uses its own session. The first error is raised
+    once the loaders already running are done, and nothing else is started.
+
+    Args:
+        loaders: Functions decorated with `bulk_loader`
+        workers (int): Number of loaders running at the same time
+
+    Returns:
+        float: The wall-clock seconds of the whole load
+    """
+
+    # SQLite only has one writer at a time
+    if SessionLocal.kw['bind'].dialect.name == 'sqlite':
+        workers = 1
+
+    dependencies = get_loader_dependencies(loaders)
+    pending = list(loaders)
+    done = set()
+    running = {}
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        while pending or running:
+            ready = [
+                loader for loader in pending
+                if all(dependency in done for dependency in dependencies[loader])
+            ]
+            for loader in ready:
+                pending.remove(loader)
+                running[executor.submit(loader)] = loader
+            if not running:
+                names = ', '.join(loader.__name__ for loader in pending)
+                raise ValueError(f'Circular dependencies between {names}')
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                loader = running.pop(future)
+                future.result()
+                done.add(loader)
+    return time.perf_counter() - start_time
+
+
+def print_load_summary(wall_time=None):
+    """
+    Rows, time and rate of the loads of this process, slowest first.
+
+    Args:
+        wall_time (float): Seconds the loads took together, if they ran in
+        parallel
+    """
+
+    if not load_stats:
+        return
+    total_rows = sum(rows for _, _, rows, _ in load_stats)
+    total_duration = sum(duration for _, _, _, duration in load_stats)
+    print(f"{'Table':40} {'Rows':>10} {'Seconds':>9} {'Rows/s':>12}")
+    for label, table_name, rows, duration in sorted(load_stats, key=lambda stat: -stat[3]):
+        rate = rows / duration if duration else 0
+        print(f"{table_name:40} {rows:>10,} {duration:>9.2f} {rate:>12,.0f}")
+    rate = total_rows / total_duration if total_duration else 0
+    print(f"{'Total':40} {total_rows:>10,} {total_duration:>9.2f} {rate:>12,.0f}")
+    if wall_time is not None:
+        rate = total_rows / wall_time if wall_time else 0
+        print(f"{'Wall-clock':40} {total_rows:>10,} {wall_time:>9.2f} {rate:>12,.0f}")
+
+
+def get_dependent_loaders(loaders, changed_loaders):
+    """
+    The loaders to run again when the tables of `changed_loaders` are
+    reloaded: those, and every loader that depends on one of them, directly
+    or not.
+
+    Args:
+        loaders: Functions decorated with `bulk_loader`
+        changed_loaders: The loaders whose data changed
+
+    Returns:
+        list: The loaders, in the order of `loaders`
+    """
+
+    dependencies = get_loader_dependencies(loaders)
+    affected = set(changed_loaders)
+    added = True
+    while added:
+        added = {
+            loader for loader in loaders
+            if loader not in affected
+            and any(dependency in affected for dependency in dependencies[loader])
+        }
+        affected.update(added)
+    return [loader for loader in loaders if loader in affected]
+
+
+def get_referencing_tables(tables):
+    """
+    The tables, and the tables that reference them with a foreign key,
+    directly or not.
+
+    Args:
+        tables: SQLAlchemy tables
+
+    Returns:
+        list: The tables, in dependency order
+    """
+
+    names = {table.name for table in tables}
+    sorted_tables = list(tables[0].metadata.sorted_tables) if tables else []
+    # Sorted so that referenced tables come first
+    for table in sorted_tables:
+        if any(foreign_key.column.table.name in names for foreign_key in table.foreign_keys):
+            names.add(table.name)
+    return [table for table in sorted_tables if table.name in names]
+
+
+def truncate_tables(db_session, tables):
+    """
+    Empty the tables, and the tables that reference them with a foreign
+    key (which can't keep their rows). The ids start from 1 again, as the
+    CSV files refer to rows by id.
+
+    Args:
+        db_session: Database session
+        tables: SQLAlchemy tables
+
+    Returns:
+        list: All the tables emptied, in dependency order
+    """
+
+    truncated = get_referencing_tables(tables)
+    if not truncated:
+        return truncated
+
+    dialect = db_session.get_bind().dialect
+    if dialect.name == 'postgresql':
+        table_names = ', '.join(dialect.identifier_preparer.format_table(table) for table in truncated)
+        db_session.execute(text(f'TRUNCATE TABLE {table_names} RESTART IDENTITY'))
+    else:
+        for table in reversed(truncated):
+            db_session.execute(delete(table))
+    db_session.commit()
+    return truncated
+
+
+def hash_file(path):
+    """SHA-256 of the content of a file."""
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_csv_hashes():
+    """
+    Returns:
+        dict: Name -> content hash of every CSV file in SEED_CSV_DIR
+    """
+
+    if not os.path.isdir(SEED_CSV_DIR):
+        return {}
+    return {
+        file_name: hash_file(get_csv_path(file_name))
+        for file_name in sorted(os.listdir(SEED_CSV_DIR))
+        if file_name.endswith('.csv')
+    }
+
+
+def get_schema_hash(metadata):
+    """
+    Hash of the DDL of the tables and indexes of `metadata`, and of the
+    database they are in, to tell whether the seed hashes still describe
+    the tables.
+    """
+
+    bind = SessionLocal.kw['bind']
+    ddl = [bind.url.render_as_string(hide_password=True)]
+    for table in metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=bind.dialect)))
+        for index in sorted(table.indexes, key=lambda index: index.name or ''):
+            ddl.append(str(CreateIndex(index).compile(dialect=bind.dialect)))
+    return hashlib.sha256('\n'.join(ddl).encode()).hexdigest()
+
+
+def read_seed_hashes():
+    """
+    Returns:
+        dict: The content of SEED_HASH_FILE, empty if there is none
+    """
+
+    if not os.path.exists(SEED_HASH_FILE):
+        return {}
+    try:
+        with open(SEED_HASH_FILE) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        print(f"Warning: Failed to read {SEED_HASH_FILE}, ignoring it")
+        return {}
+
+
+def write_seed_hashes(hashes):
+    """
+    Replace SEED_HASH_FILE with `hashes`, or remove it if they are empty
+    (when the database no longer matches any files).
+    """
+
+    if not hashes:
+        if os.path.exists(SEED_HASH_FILE):
+            os.remove(SEED_HASH_FILE)
+        return
+
+    directory = os.path.dirname(SEED_HASH_FILE)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(SEED_HASH_FILE, 'w') as file:
+        json.dump(hashes, file, indent=2, sort_keys=True)
+        file.write('\n')
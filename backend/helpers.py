@@ -1,20 +1,86 @@
 import re
+import io
+import csv
 import copy
 import json
+import base64
+import hashlib
 import logging
 import os
 import jwt
+import time
+import orjson
+import threading
 import requests
 
-from datetime import datetime, timedelta
-from decimal import Decimal
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from email.utils import format_datetime
+from decimal import Decimal, InvalidOperation
+from enum import Enum
 from typing import Any, Dict, List, Optional, Union, Tuple
 from pydantic import ValidationError
-from sqlalchemy import DateTime, String, Date
+from fastapi.encoders import jsonable_encoder, decimal_encoder
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy import DateTime, String, Date, Integer, Numeric, Boolean
+
+from backend.exceptions import InvalidRequestData
 
 
 logger = logging.getLogger(__name__)
 
+COUNT_MODES = ('exact', 'estimate', 'cached', 'none')
+
+# What a write returns:
+# - minimal: only the id
+# - representation: the readable fields of the written row
+# - full: the row with its joins and list joins, like get_one
+WRITE_RETURN_MODES = ('minimal', 'representation', 'full')
+
+
+class TTLCache:
+    """
+    Small thread-safe in-process LRU cache whose entries expire `ttl`
+    seconds after they were set.
+    """
+
+    def __init__(self, ttl: float = 30, max_size: int = 1024):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._items[key]
+                return default
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: Optional[float] = None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._items[key] = (expires_at, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
+
 
 def unflatten_json(text):
     """
@@ -272,6 +338,237 @@ def send_email(
     return res
 
 
+def escape_like(text: str, escape_character: str = '\\') -> str:
+    """
+    Escape the LIKE wildcards (`%` and `_`) and the escape character itself
+    in `text`, to match it literally.
+    """
+
+    return (
+        text
+        .replace(escape_character, escape_character * 2)
+        .replace('%', f'{escape_character}%')
+        .replace('_', f'{escape_character}_')
+    )
+
+
+# A plain date in a date/datetime filter, e.g. `2024-01-31`, is taken as
+# the whole day. Anything else goes through `datetime.fromisoformat`.
+DATE_FILTER_PATTERN = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})$')
+
+BOOLEAN_FILTER_VALUES = {
+    'true': True,
+    'false': False,
+}
+
+
+class FilterPlan:
+    """
+    Everything `parse_request_params` needs to know about a model to parse
+    its filters and sorting, computed once per model (and joined models)
+    instead of on every request:
+
+    - `filter_fields`: `f_` field path -> (model class, field, value kind)
+    - `sort_fields`: `sort_by` field path -> (model class, field)
+
+    The value kind tells how a filter value is parsed: 'date', 'datetime',
+    'string', 'integer', 'number' (Numeric and Float, parsed as a Decimal)
+    or 'boolean'. Columns of any other type (e.g. JSON) have no kind and
+    only take the null checks.
+    """
+
+    def __init__(self, main_model_class, secondary_models_map):
+        self.main_model_class = main_model_class
+        self.filter_fields = {}
+        self.sort_fields = {}
+
+        for field_path in set(getattr(main_model_class, 'filterable_fields', [])):
+            model_class, field = self._resolve(field_path, main_model_class, secondary_models_map)
+            if model_class is None or field not in getattr(model_class, 'filterable_fields', []):
+                continue
+            column = getattr(model_class, field, None)
+            column_type = getattr(column, 'type', None)
+            if column_type is None:
+                continue
+            self.filter_fields[field_path] = (model_class, field, self._get_value_kind(column_type))
+
+        for field_path in set(getattr(main_model_class, 'sortable_fields', [])):
+            model_class, field = self._resolve(field_path, main_model_class, secondary_models_map)
+            if model_class is not None:
+                self.sort_fields[field_path] = (model_class, field)
+
+    @staticmethod
+    def _resolve(field_path, main_model_class, secondary_models_map):
+        """
+        The model class and field of a field path like 'id' or
+        'role_details.id', or (None, None) when the joined model isn't in
+        `secondary_models_map`.
+        """
+
+        if '.' not in field_path:
+            return main_model_class, field_path
+        as_, _, field = field_path.partition('.')
+        if as_ not in secondary_models_map or '.' in field:
+            return None, None
+        return secondary_models_map[as_], field
+
+    @staticmethod
+    def _get_value_kind(column_type):
+        if isinstance(column_type, DateTime):
+            return 'datetime'
+        if isinstance(column_type, Date):
+            return 'date'
+        if isinstance(column_type, String):
+            return 'string'
+        if isinstance(column_type, Integer):
+            return 'integer'
+        if isinstance(column_type, Numeric):
+            return 'number'
+        if isinstance(column_type, Boolean):
+            return 'boolean'
+        return None
+
+    @staticmethod
+    def _parse_date(value, kind, end_of_day=False):
+        """
+        Parse the value of a date/datetime filter. A plain date is the start
+        (or the end) of that day for datetime columns.
+        """
+
+        match = DATE_FILTER_PATTERN.match(value)
+        if match is None:
+            return datetime.fromisoformat(value)
+        date_value = date(*map(int, match.groups()))
+        if kind == 'date':
+            return date_value
+        return datetime.combine(date_value, datetime.max.time() if end_of_day else datetime.min.time())
+
+    @classmethod
+    def _parse_value(cls, value, kind, end_of_day=False):
+        if kind == 'date' or kind == 'datetime':
+            return cls._parse_date(value, kind, end_of_day=end_of_day)
+        if kind == 'string':
+            return value
+        if kind == 'number':
+            number = Decimal(value)
+            if not number.is_finite():
+                raise ValueError(f'Not a finite number: {value}')
+            return number
+        if kind == 'boolean':
+            if value.lower() not in BOOLEAN_FILTER_VALUES:
+                raise ValueError(f'Not a boolean: {value}')
+            return BOOLEAN_FILTER_VALUES[value.lower()]
+        if kind == 'integer':
+            return int(value)
+        raise ValueError(f'No filter value for the field: {value}')
+
+    def parse_filter(self, field_path, value):
+        """
+        Parse the value of the `f_<field_path>` param into a filter. The
+        operation is given by the start of the value:
+
+        - `is:null` / `is:not_null`: null checks
+        - `in:a,b,c`: one of the values
+        - `between:a,b`: from a to b, both included
+        - `<=`, `>=`, `<`, `>`: comparisons
+        - `~`: contains, case-insensitive (strings only)
+        - `^`: starts with, case-sensitive (strings only)
+        - anything else: equal to
+
+        Booleans (`true`/`false`) only take the null checks, `in:` and
+        equal to.
+
+        A plain date on a datetime field stands for the whole day, e.g.
+        `between:2024-01-01,2024-01-31` includes all of January 31.
+
+        Returns:
+            dict | None: The filter, None if the field isn't filterable or
+            the value isn't valid for the field
+        """
+
+        filter_field = self.filter_fields.get(field_path)
+        if filter_field is None:
+            return None
+        model_class, field, kind = filter_field
+        filter_dict = {
+            'model': model_class,
+            'field': field,
+        }
+
+        try:
+            if value == 'is:null' or value == 'is:not_null':
+                filter_dict['is_null'] = value == 'is:null'
+            elif value.startswith('in:'):
+                filter_dict['in'] = [self._parse_value(item, kind) for item in value[3:].split(',')]
+            elif kind == 'boolean' and (value.startswith('between:') or value[:1] in ('<', '>')):
+                # Booleans have no order
+                return None
+            elif value.startswith('between:'):
+                bounds = value[8:].split(',')
+                if len(bounds) != 2:
+                    return None
+                filter_dict['greater_than_or_equal_to'] = self._parse_value(bounds[0], kind)
+                filter_dict['lesser_than_or_equal_to'] = self._parse_value(bounds[1], kind, end_of_day=True)
+            elif value.startswith('<='):
+                filter_dict['lesser_than_or_equal_to'] = self._parse_value(value[2:], kind, end_of_day=True)
+            elif value.startswith('>='):
+                filter_dict['greater_than_or_equal_to'] = self._parse_value(value[2:], kind)
+            elif value.startswith('<'):
+                filter_dict['lesser_than'] = self._parse_value(value[1:], kind)
+            elif value.startswith('>'):
+                filter_dict['greater_than'] = self._parse_value(value[1:], kind, end_of_day=True)
+            elif value.startswith('~') or value.startswith('^'):
+                # Wildcard matches for string fields
+                if kind != 'string':
+                    return None
+                operation = 'contains' if value[0] == '~' else 'starts_with'
+                filter_dict[operation] = value[1:]
+            elif kind == 'datetime' and DATE_FILTER_PATTERN.match(value):
+                # A date on a datetime field matches the entire day
+                filter_dict['greater_than_or_equal_to'] = self._parse_date(value, kind)
+                filter_dict['lesser_than_or_equal_to'] = self._parse_date(value, kind, end_of_day=True)
+            else:
+                filter_dict['equal_to'] = self._parse_value(value, kind)
+        except (ValueError, TypeError, InvalidOperation):
+            # Not a valid value for the kind of the field
+            return None
+        return filter_dict
+
+    def get_sort_details(self, sort_by_text):
+        field_path = sort_by_text.strip('-')
+        sort_field = self.sort_fields.get(field_path)
+        if sort_field is None:
+            return {
+                'model': self.main_model_class,
+                'field': 'id',
+                'reverse': False,
+            }
+        return {
+            'model': sort_field[0],
+            'field': sort_field[1],
+            'reverse': sort_by_text.startswith('-'),
+        }
+
+
+_filter_plans = {}
+_filter_plans_lock = threading.Lock()
+
+
+def get_filter_plan(main_model_class, secondary_models_map={}):
+    """
+    The `FilterPlan` of a model and its joined models, built on the first
+    call.
+    """
+
+    key = (main_model_class, tuple(sorted(secondary_models_map.items(), key=lambda item: item[0])))
+    plan = _filter_plans.get(key)
+    if plan is None:
+        plan = FilterPlan(main_model_class, secondary_models_map)
+        with _filter_plans_lock:
+            _filter_plans[key] = plan
+    return plan
+
+
 def parse_request_params(request_args, main_model_class, secondary_models_map={}):
     """
     Parse request parameters from request args.
@@ -293,155 +590,22 @@ def parse_request_params(request_args, main_model_class, secondary_models_map={}
         )
     """
 
-    # Column specific filters
+    plan = get_filter_plan(main_model_class, secondary_models_map)
+
+    # Column specific filters. field_path can be just the native field like
+    # 'id' or a joined field like 'role_details.id'
     filters = []
     for param, value in request_args.items():
         if param.startswith('f_'):
-            # field_path can be just the native field like 'id' or a joined field
-            # like 'role_details.id'
-            field_path = param[2:]  # Remove 'f_' prefix
-            
-            if '.' in field_path:
-                as_, field = field_path.split('.')
-                
-                # Developer needs to pass this parameter in the route
-                if as_ not in secondary_models_map:
-                    continue
-
-                # The model's filterable fields list should allow it
-                if field_path not in main_model_class.filterable_fields:
-                    continue
-                
-                model_class = secondary_models_map[as_]
-            else:
-                field = field_path
-                model_class = main_model_class
-
-            if field not in model_class.filterable_fields:
-                continue
-                
-            # Get the column type
-            column = getattr(model_class, field)
-            column_type = column.type
-            
-            try:
-                # Check if value starts with an operation
-                if value.startswith('<'):
-                    value_str = value[1:]
-                    if isinstance(column_type, (DateTime, Date)):
-                        try:
-                            # Try parsing as date first
-                            date_value = datetime.strptime(value_str, '%Y-%m-%d').date()
-                            if isinstance(column_type, DateTime):
-                                # For datetime fields, use start of day
-                                value = datetime.combine(date_value, datetime.min.time())
-                            else:
-                                value = date_value
-                        except ValueError:
-                            # If not a date, try parsing as datetime
-                            value = datetime.fromisoformat(value_str)
-                    else:
-                        value = int(value_str)
-                    filters.append({
-                        'model': model_class,
-                        'field': field,
-                        'lesser_than': value
-                    })
-                elif value.startswith('>'):
-                    value_str = value[1:]
-                    if isinstance(column_type, (DateTime, Date)):
-                        try:
-                            # Try parsing as date first
-                            date_value = datetime.strptime(value_str, '%Y-%m-%d').date()
-                            if isinstance(column_type, DateTime):
-                                # For datetime fields, use end of day
-                                value = datetime.combine(date_value, datetime.max.time())
-                            else:
-                                value = date_value
-                        except ValueError:
-                            # If not a date, try parsing as datetime
-                            value = datetime.fromisoformat(value_str)
-                    else:
-                        value = int(value_str)
-                    filters.append({
-                        'model': model_class,
-                        'field': field,
-                        'greater_than': value
-                    })
-                elif value.startswith('~'):
-                    # Wildcard match for string fields
-                    if isinstance(column_type, String):
-                        filters.append({
-                            'model': model_class,
-                            'field': field,
-                            'contains': value[1:]  # Remove '~' prefix
-                        })
-                else:
-                    # No operation specified, treat as equal_to
-                    if isinstance(column_type, (DateTime, Date)):
-                        try:
-                            # Try parsing as date first
-                            date_value = datetime.strptime(value, '%Y-%m-%d').date()
-                            if isinstance(column_type, DateTime):
-                                # For datetime fields, create a range for the entire day
-                                filters.append({
-                                    'model': model_class,
-                                    'field': field,
-                                    'greater_than': datetime.combine(date_value, datetime.min.time()),
-                                    'lesser_than': datetime.combine(date_value, datetime.max.time())
-                                })
-                                continue
-                            else:
-                                value = date_value
-                        except ValueError:
-                            # If not a date, try parsing as datetime
-                            value = datetime.fromisoformat(value)
-                    elif isinstance(column_type, String):
-                        # For string fields, treat as exact match
-                        value = value
-                    else:
-                        value = int(value)
-                    filters.append({
-                        'model': model_class,
-                        'field': field,
-                        'equal_to': value
-                    })
-            except (ValueError, TypeError):
-                continue  # Skip if value is not a valid integer or datetime
+            filter_dict = plan.parse_filter(param[2:], value)
+            if filter_dict is not None:
+                filters.append(filter_dict)
 
     # Sort column and order
     sort_details = None
-    is_valid_sort_field = True
     sort_by_text = request_args.get('sort_by')
     if sort_by_text:
-        if sort_by_text.startswith('-'):
-            sort_reverse = True
-        else:
-            sort_reverse = False
-
-        if '.' in sort_by_text:
-            as_, field = sort_by_text.strip('-').split('.')
-            if as_ not in secondary_models_map:
-                is_valid_sort_field = False
-            else:
-                sort_field_model = secondary_models_map[as_]
-        else:
-            sort_field_model = main_model_class
-
-        sort_field = sort_by_text.strip('-').split('.')[-1]
-
-        if not is_valid_sort_field or sort_by_text.strip('-') not in main_model_class.sortable_fields:
-            sort_details = {
-                'model': main_model_class,
-                'field': 'id',
-                'reverse': False,
-            }
-        else:
-            sort_details = {
-                'model': sort_field_model,
-                'field': sort_field,
-                'reverse': sort_reverse,
-            }
+        sort_details = plan.get_sort_details(sort_by_text)
 
     # Get qsearch query
     q = request_args.get('q', None)
@@ -460,6 +624,30 @@ def parse_request_params(request_args, main_model_class, secondary_models_map={}
     except (ValueError, TypeError):
         pagination['page_size'] = 100
 
+    # How `total_items` is computed: exact, estimate, cached or none
+    count_mode = request_args.get('count')
+    if count_mode in COUNT_MODES:
+        pagination['count_mode'] = count_mode
+
+    # Keyset pagination is opt-in. An empty cursor starts from the first page.
+    cursor = request_args.get('cursor', request_args.get('after'))
+    if cursor is not None:
+        pagination['cursor'] = cursor
+        # The seek key has to be a column of the main model, so an unknown
+        # or joined sort field is an error instead of the fallback to id
+        if sort_by_text and (
+            plan.sort_fields.get(sort_by_text.strip('-')) is None or
+            sort_details['model'] is not main_model_class
+        ):
+            raise InvalidRequestData(
+                errors=[{
+                    'field': 'sort_by',
+                    'description': 'Cursor pagination can only sort by a column of the listed model',
+                }],
+                message='Unsupported sort for cursor pagination',
+                http_status=400,
+            )
+
     return {
         'filters': filters,
         'sort_details': sort_details,
@@ -509,6 +697,225 @@ def responsify(data: Any, message: Optional[str] = None, status_code: int = 200)
     }
 
 
+def _encode_json_default(value: Any) -> Any:
+    # Same output as jsonable_encoder for what orjson doesn't handle natively
+    if isinstance(value, Decimal):
+        return decimal_encoder(value)
+    return jsonable_encoder(value)
+
+
+def dumps_json(content: Any) -> bytes:
+    """
+    Serialize to JSON with orjson, with the same output as FastAPI's
+    encoder.
+    """
+
+    return orjson.dumps(
+        content,
+        default=_encode_json_default,
+        option=orjson.OPT_NON_STR_KEYS,
+    )
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response serialized with orjson, which handles datetime, date,
+    time, UUID and enums natively.
+
+    Route handlers return it directly (instead of the `responsify` dict), so
+    that FastAPI doesn't run the response through `jsonable_encoder` first.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
+def fast_responsify(data: Any, message: Optional[str] = None, status_code: int = 200) -> FastJSONResponse:
+    """
+    `responsify` wrapped in a `FastJSONResponse`.
+
+    Args:
+        data: Data dict/list or list of errors
+        message: Optional message to be sent by the API
+        status_code: The status code of the response
+
+    Returns:
+        FastJSONResponse: The standardized API response
+    """
+
+    return FastJSONResponse(
+        content=responsify(data, message=message, status_code=status_code),
+        status_code=status_code,
+    )
+
+
+def get_etag(body: bytes) -> str:
+    """
+    Strong ETag of a response body.
+    """
+
+    return f'"{hashlib.md5(body).hexdigest()}"'
+
+
+def is_etag_match(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an `If-None-Match` header matches `etag` (weak comparison, as
+    RFC 9110 asks for If-None-Match).
+    """
+
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    tags = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+    return etag.removeprefix('W/') in tags
+
+
+def get_validator_headers(etag: str) -> Dict[str, str]:
+    """
+    `no-cache` lets the browser keep the response but makes it revalidate
+    on every use, so it never shows stale data.
+    """
+
+    return {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(status_code=304, headers=get_validator_headers(etag))
+
+
+def etag_response(request, body: bytes, etag: str) -> Response:
+    """
+    A JSON response with its ETag, or an empty 304 when the client already
+    has that version (its `If-None-Match` matches).
+    """
+
+    if is_etag_match(request.headers.get('if-none-match'), etag):
+        return not_modified_response(etag)
+    return Response(
+        content=body,
+        media_type='application/json',
+        headers=get_validator_headers(etag),
+    )
+
+
+EXPORT_FORMATS = ('ndjson', 'csv')
+EXPORT_MEDIA_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+
+def _to_csv_value(value: Any) -> Any:
+    if value is None:
+        return ''
+    if isinstance(value, (dict, list)):
+        return dumps_json(value).decode()
+    if isinstance(value, (date, Decimal)):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def iter_export_chunks(items, export_format: str, fields: List[str], chunk_size: int = 1000):
+    """
+    Turn items into the chunks of an NDJSON or CSV export. Rows are grouped
+    `chunk_size` at a time so that the response isn't written line by line.
+
+    Args:
+        items: Iterable of item dicts
+        export_format: 'ndjson' or 'csv'
+        fields: Fields of every item, the CSV header
+        chunk_size: Rows per yielded chunk
+
+    Yields:
+        bytes: Part of the export
+    """
+
+    if export_format == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(fields)
+        total_rows = 0
+        for item in items:
+            writer.writerow([_to_csv_value(item.get(field)) for field in fields])
+            total_rows += 1
+            if total_rows % chunk_size == 0:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue().encode()
+        return
+
+    lines = []
+    for item in items:
+        lines.append(dumps_json(item))
+        if len(lines) == chunk_size:
+            yield b'\n'.join(lines) + b'\n'
+            lines = []
+    if lines:
+        yield b'\n'.join(lines) + b'\n'
+
+
+def encode_cursor(field: str, reverse: bool, value: Any, id_item: int) -> str:
+    """
+    Encode the position of the last returned row into an opaque keyset
+    pagination cursor.
+
+    Example:
+        encode_cursor('created_at', True, datetime(2024, 1, 15), 42)
+            -> 'eyJmIjogImNyZWF0ZWRfYXQiLCAici...'
+    """
+
+    if isinstance(value, datetime):
+        value_type, value = 'datetime', value.isoformat()
+    elif isinstance(value, date):
+        value_type, value = 'date', value.isoformat()
+    elif isinstance(value, Decimal):
+        value_type, value = 'decimal', str(value)
+    else:
+        value_type = None
+
+    payload = json.dumps({
+        'f': field,
+        'r': reverse,
+        'v': value,
+        't': value_type,
+        'id': id_item,
+    }, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Optional[Dict[str, Any]]:
+    """
+    Decode a cursor created by `encode_cursor`. Returns None if the cursor
+    is malformed.
+
+    :return dict: Keys `field`, `reverse`, `value` and `id`
+    """
+
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        value = payload['v']
+        value_type = payload.get('t')
+        if value_type == 'datetime':
+            value = datetime.fromisoformat(value)
+        elif value_type == 'date':
+            value = date.fromisoformat(value)
+        elif value_type == 'decimal':
+            value = Decimal(value)
+        return {
+            'field': payload['f'],
+            'reverse': bool(payload['r']),
+            'value': value,
+            'id': int(payload['id']),
+        }
+    except (ValueError, TypeError, KeyError, json.JSONDecodeError):
+        return None
+
+
 def decode_jwt_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Decode a JWT using SECRET_KEY; return claims or None if invalid/expired.
@@ -0,0 +1,134 @@
+"""
+Indexes derived from the column metadata of the models.
+
+Nearly every column is marked `is_filterable` and `is_sortable`, so those
+flags alone can't decide what gets an index. The rules are:
+
+- Reference columns (foreign keys, and `id_*` / `*_id` integers) that are
+  filterable get a composite `(column, created_at)` index. It serves
+  `?id_user=5` on its own as well as with the listing sorted by date.
+- Any other filterable or sortable column is only indexed when its info
+  sets `'is_indexed': True`, e.g. the `status` of the large transactional
+  tables, which the dashboards filter on and sort by date. A filterable
+  one gets the same `(column, created_at)` composite, a sort-only one a
+  single column index.
+- `'is_indexed': False` opts a column out of the above.
+- String columns whose info sets `'is_prefix_indexed': True` also get a
+  `varchar_pattern_ops` (`text_pattern_ops` for Text) index. The `f_x=^v`
+  prefix filter compiles to `LIKE 'v%'`, which a plain B-tree index can
+  only serve under the C collation.
+
+Primary keys and unique columns already have an index. All indexes are
+partial on `deleted_at IS NULL` when the table soft deletes, since every
+listing filters on that.
+
+The indexes are attached to the tables, so `Base.metadata.create_all()`
+(run by the `rebuild` CLI) creates them.
+"""
+
+import hashlib
+
+from sqlalchemy import Index, Integer, String, Text
+
+
+# Postgres truncates longer identifiers, which can make two names collide
+MAX_INDEX_NAME_LENGTH = 63
+
+
+def get_index_name(table_name, column_names):
+    name = f'ix_{table_name}_{"_".join(column_names)}'
+    if len(name) <= MAX_INDEX_NAME_LENGTH:
+        return name
+    digest = hashlib.md5(name.encode()).hexdigest()[:8]
+    return f'{name[:MAX_INDEX_NAME_LENGTH - 9]}_{digest}'
+
+
+def is_reference_column(column):
+    if column.foreign_keys:
+        return True
+    is_reference_name = column.name.startswith('id_') or column.name.endswith('_id')
+    return is_reference_name and isinstance(column.type, Integer)
+
+
+def get_metadata_index_columns(table):
+    """
+    The columns to index for a table, following the rules above.
+
+    Returns:
+        list: Tuples of column names, one per index
+    """
+
+    index_columns = []
+    for column in table.columns:
+        info = column.info
+        if column.primary_key or column.unique or info.get('is_indexed') is False:
+            continue
+        if not (info.get('is_filterable') or info.get('is_sortable')):
+            continue
+
+        if info.get('is_filterable') and (is_reference_column(column) or info.get('is_indexed')):
+            if 'created_at' in table.columns and column.name != 'created_at':
+                index_columns.append((column.name, 'created_at'))
+            else:
+                index_columns.append((column.name,))
+        elif info.get('is_indexed'):
+            index_columns.append((column.name,))
+    return index_columns
+
+
+def get_prefix_index_columns(table):
+    """
+    The string columns of a table that get a pattern ops index for prefix
+    matches.
+
+    Returns:
+        list: The columns
+    """
+
+    return [
+        column for column in table.columns
+        if column.info.get('is_prefix_indexed') and isinstance(column.type, String)
+    ]
+
+
+def declare_metadata_indexes(table):
+    """
+    Attach the metadata derived indexes to a table. Indexes that the table
+    already declares (by name) are left alone.
+
+    Returns:
+        list: The indexes added
+    """
+
+    existing_names = {index.name for index in table.indexes}
+    where = None
+    if 'deleted_at' in table.columns:
+        where = table.c.deleted_at.is_(None)
+
+    indexes = []
+    for column_names in get_metadata_index_columns(table):
+        name = get_index_name(table.name, column_names)
+        if name in existing_names:
+            continue
+        index = Index(
+            name,
+            *[table.c[column_name] for column_name in column_names],
+            postgresql_where=where,
+            sqlite_where=where,
+        )
+        indexes.append(index)
+
+    for column in get_prefix_index_columns(table):
+        name = get_index_name(table.name, (column.name, 'prefix'))
+        if name in existing_names:
+            continue
+        operator_class = 'text_pattern_ops' if isinstance(column.type, Text) else 'varchar_pattern_ops'
+        index = Index(
+            name,
+            column,
+            postgresql_ops={column.name: operator_class},
+            postgresql_where=where,
+            sqlite_where=where,
+        )
+        indexes.append(index)
+    return indexes
@@ -0,0 +1,225 @@
+"""
+Per request query instrumentation.
+
+A `QueryMetrics` object is put in a context variable for every request (see
+`register_instrumentation` in backend/middleware.py). The SQLAlchemy cursor
+events below add the statement count and DB time of every statement to it,
+and `BaseModel.get_items` adds the count time, the serialization time and
+the rows fetched vs returned. The middleware sends it all back in the
+`Server-Timing` header.
+
+Statements slower than SLOW_QUERY_THRESHOLD_MS also go to `slow_query_log`,
+a ring buffer served by `/api/v1/admin/_debug/queries` when
+QUERY_DEBUG_ENABLED=true (to admin users only, with the parameters of the
+statements redacted).
+"""
+
+import os
+import time
+import itertools
+import threading
+
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime, UTC
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv('SLOW_QUERY_THRESHOLD_MS', '100'))
+SLOW_QUERY_LOG_SIZE = int(os.getenv('SLOW_QUERY_LOG_SIZE', '50'))
+
+# Exposes the SQL of the application, so it's off unless asked for
+QUERY_DEBUG_ENABLED = os.getenv('QUERY_DEBUG_ENABLED', 'false').lower() == 'true'
+
+
+class QueryMetrics:
+    """
+    Query metrics of a single request. All times are in milliseconds.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.statement_count = 0
+        self.db_time = 0.0
+        self.count_time = 0.0
+        self.serialization_time = 0.0
+        self.rows_fetched = 0
+        self.rows_returned = 0
+
+    def to_dict(self):
+        return {
+            'path': self.path,
+            'statement_count': self.statement_count,
+            'db_time': round(self.db_time, 2),
+            'count_time': round(self.count_time, 2),
+            'serialization_time': round(self.serialization_time, 2),
+            'rows_fetched': self.rows_fetched,
+            'rows_returned': self.rows_returned,
+        }
+
+    def get_server_timing(self, total_time=None):
+        """
+        The value of the `Server-Timing` header for these metrics.
+
+        Args:
+            total_time (float): Time taken by the whole request, if known
+        """
+
+        entries = [
+            f'db;dur={self.db_time:.2f};desc="{self.statement_count} statements"',
+            f'count;dur={self.count_time:.2f}',
+            f'serialize;dur={self.serialization_time:.2f}',
+            f'rows;desc="fetched {self.rows_fetched}, returned {self.rows_returned}"',
+        ]
+        if total_time is not None:
+            entries.append(f'total;dur={total_time:.2f}')
+        return ', '.join(entries)
+
+
+current_metrics = ContextVar('current_metrics', default=None)
+
+
+def get_current_metrics():
+    """
+    The metrics of the current request, or None outside of a request (e.g.
+    in the CLI scripts).
+    """
+
+    return current_metrics.get()
+
+
+def record_rows_fetched(total_rows):
+    metrics = current_metrics.get()
+    if metrics is not None:
+        metrics.rows_fetched += total_rows
+
+
+class SlowQueryLog:
+    """
+    Ring buffer of the most recent slow statements. The EXPLAIN plan of an
+    entry is computed the first time it's asked for, not while the request
+    that ran the statement is still waiting.
+
+    The entries are only read and changed under the lock: `get_slowest`
+    returns copies, and `update` changes the entry in the buffer.
+    """
+
+    def __init__(self, max_size=50):
+        self._entries = deque(maxlen=max_size)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def add(self, entry):
+        with self._lock:
+            self._entries.append({**entry, 'id': next(self._ids)})
+
+    def get_slowest(self, limit=None):
+        with self._lock:
+            entries = sorted(self._entries, key=lambda entry: entry['duration'], reverse=True)
+            entries = entries[:limit] if limit else entries
+            return [dict(entry) for entry in entries]
+
+    def update(self, entry_id, **values):
+        """
+        Set values of an entry, if it's still in the buffer.
+        """
+
+        with self._lock:
+            for entry in self._entries:
+                if entry['id'] == entry_id:
+                    entry.update(values)
+                    return
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+slow_query_log = SlowQueryLog(max_size=SLOW_QUERY_LOG_SIZE)
+
+
+def explain_entry(engine, entry):
+    """
+    Add the EXPLAIN plan to a copy of a slow query log entry (from
+    `get_slowest`), and keep it in the log for the next time. Only SELECTs
+    are explained (EXPLAIN of a write doesn't run it, but there's no plan
+    worth looking at either), and only on Postgres.
+
+    Returns:
+        dict: The same entry
+    """
+
+    if 'plan' in entry:
+        return entry
+
+    plan = {'plan': None}
+    statement = entry['statement'].lstrip()
+    is_select = statement[:6].upper() == 'SELECT' or statement[:4].upper() == 'WITH'
+    if engine.dialect.name == 'postgresql' and is_select:
+        try:
+            with engine.connect() as connection:
+                plan['plan'] = connection.exec_driver_sql(
+                    f'EXPLAIN (FORMAT JSON) {statement}',
+                    entry['parameters'],
+                ).scalar()
+        except Exception as e:
+            plan['plan_error'] = str(e)
+
+    slow_query_log.update(entry['id'], **plan)
+    entry.update(plan)
+    return entry
+
+
+def _redact_value(value):
+    return None if value is None else f'<{type(value).__name__}>'
+
+
+def redact_parameters(parameters):
+    """
+    The parameters of a statement with every value replaced by its type,
+    since they can hold password hashes, emails or tokens. Handles the
+    dict (named) and tuple (positional) forms, and lists of them
+    (executemany).
+    """
+
+    if isinstance(parameters, dict):
+        return {key: _redact_value(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [
+            redact_parameters(value) if isinstance(value, (dict, list, tuple)) else _redact_value(value)
+            for value in parameters
+        ]
+    return _redact_value(parameters)
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _start_statement_timer(connection, cursor, statement, parameters, context, executemany):
+    if context is None:
+        return
+    context._instrumentation_start_time = time.perf_counter()
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _record_statement(connection, cursor, statement, parameters, context, executemany):
+    start_time = getattr(context, '_instrumentation_start_time', None)
+    if start_time is None:
+        return
+    duration = (time.perf_counter() - start_time) * 1000
+
+    metrics = current_metrics.get()
+    if metrics is not None:
+        metrics.statement_count += 1
+        metrics.db_time += duration
+
+    if duration >= SLOW_QUERY_THRESHOLD_MS and not statement.lstrip().upper().startswith('EXPLAIN'):
+        slow_query_log.add({
+            'path': metrics.path if metrics is not None else None,
+            'statement': statement,
+            'parameters': parameters,
+            'duration': round(duration, 2),
+            'recorded_at': datetime.now(UTC).isoformat(),
+        })
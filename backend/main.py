@@ -1,10 +1,13 @@
 import os
 import jwt
 import json
+import asyncio
+import hashlib
 import logging
 
-from typing import Annotated, Optional
+from typing import Annotated, Literal, Optional
 from functools import partial
+from contextlib import asynccontextmanager
 from fastapi import (
     FastAPI,
     Depends,
@@ -15,19 +18,52 @@ from fastapi import (
     Request,
     HTTPException,
 )
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 
 from backend.meta.pydantic_type_generator import generate_pydantic_model
+from backend.meta.route_registry import (
+    load_route_registry,
+    build_route_registry,
+    get_metadata_stamp,
+    GeneratedRoutes,
+    ROUTE_RELOAD_INTERVAL,
+)
 from backend.pydantic_types import (
     PaginationParams,
+    BulkItemsRequest,
+    BulkDeleteRequest,
 )
 from backend.actions import (
     DynamicActions,
     MetadataActions,
+    relationship_registry,
+)
+from backend.database import (
+    get_db,
+    commit_db_session,
+    SessionLocal,
+    engine,
+    get_pool_status,
 )
-from backend.database import get_db, commit_db_session, SessionLocal
 from backend.models import *
-from backend.helpers import responsify, parse_request_params
+from backend.helpers import (
+    responsify,
+    fast_responsify,
+    parse_request_params,
+    iter_export_chunks,
+    dumps_json,
+    get_etag,
+    etag_response,
+    is_etag_match,
+    not_modified_response,
+    decode_jwt_token,
+    FastJSONResponse,
+    EXPORT_MEDIA_TYPES,
+)
+from backend.exceptions import Unauthorized, Forbidden
+from backend.response_cache import response_cache
 from backend.database import get_db
 from backend.responses import (
     get_buyers_response,
@@ -52,13 +88,25 @@ from backend.responses import (
 )
 
 # Import exception handlers
-from backend.middleware import register_exception_handlers
+from backend.middleware import register_exception_handlers, register_instrumentation
+from backend.instrumentation import QUERY_DEBUG_ENABLED, slow_query_log, explain_entry, redact_parameters
+
+@asynccontextmanager
+async def lifespan(app):
+    watch_task = None
+    if ROUTE_RELOAD_INTERVAL > 0:
+        watch_task = asyncio.create_task(watch_metadata_changes())
+    yield
+    if watch_task is not None:
+        watch_task.cancel()
+
 
 # Create FastAPI app
 app = FastAPI(
     title='TDS Corporate API',
     description='Backend API for TDS Corporate Website',
     version='1.0.0',
+    lifespan=lifespan,
 )
 
 # Optional OAuth2 bearer for endpoints that can accept a token if present
@@ -68,9 +116,39 @@ oauth2_required = OAuth2PasswordBearer(tokenUrl='token', auto_error=False)
 
 logger = logging.getLogger(__name__)
 
+
+def require_admin_user(
+    token: Annotated[Optional[str], Depends(oauth2_required)] = None,
+    db_session=Depends(get_db),
+):
+    """
+    Dependency of the routes for the staff only: a valid JWT of an active
+    user that isn't anonymous or a customer.
+    """
+
+    claims = decode_jwt_token(token) if token else None
+    try:
+        user_id = int((claims or {}).get('sub'))
+    except (TypeError, ValueError):
+        raise Unauthorized(message='Missing or invalid token')
+
+    user = db_session.get(User, user_id)
+    if (
+        user is None
+        or user.deleted_at is not None
+        or user.is_anonymous
+        or user.is_customer
+        or (user.status or '').lower() != 'active'
+    ):
+        raise Forbidden(message='Admin access required')
+    return user
+
 # Register all exception handlers
 register_exception_handlers(app)
 
+# Send the query metrics of every request in the Server-Timing header
+register_instrumentation(app)
+
 
 ADMIN_API_PREFIX = '/api/v1/admin'
 
@@ -78,7 +156,44 @@ ADMIN_API_PREFIX = '/api/v1/admin'
 @app.get("/api/v1/health")
 async def health_check():
     """Health check endpoint for monitoring and load balancers"""
-    return {"status": "healthy", "service": "tds-corporate-api"}
+    return {
+        "status": "healthy",
+        "service": "tds-corporate-api",
+        "relationship_registry": relationship_registry.stats(),
+        "generated_routes": generated_routes.stats(),
+        "response_cache": response_cache.stats(),
+        "database_pool": get_pool_status(engine),
+    }
+
+
+if QUERY_DEBUG_ENABLED:
+    @app.get(
+        f'{ADMIN_API_PREFIX}/_debug/queries',
+        operation_id='get_debug_queries',
+        summary='Get the slowest recent queries',
+        description='''
+Slowest of the recent statements that took longer than `SLOW_QUERY_THRESHOLD_MS`,
+slowest first, with the request path that ran them.
+
+With `explain=true`, the Postgres `EXPLAIN` plan of every SELECT is included
+(computed once per entry). The parameters of the statements are redacted to
+their types.
+
+Only enabled with `QUERY_DEBUG_ENABLED=true`, for admin users.
+''',
+        tags=['Debug'],
+        dependencies=[Depends(require_admin_user)],
+    )
+    def get_debug_queries(
+        limit: Annotated[int, Query(description="Number of queries to return", ge=1, le=100)] = 20,
+        explain: Annotated[bool, Query(description="Include the EXPLAIN plan of each query")] = True,
+    ):
+        entries = slow_query_log.get_slowest(limit)
+        if explain:
+            entries = [explain_entry(engine, entry) for entry in entries]
+        for entry in entries:
+            entry['parameters'] = redact_parameters(entry['parameters'])
+        return responsify(entries)
 
 
 class MetadataObjectRoutes:
@@ -87,7 +202,8 @@ class MetadataObjectRoutes:
         operation_id='get_all_metadata_objects',
         summary='Get all metadata objects',
         description='Retrieve a paginated list of all metadata objects',
-        tags=['Metadata Object']
+        tags=['Metadata Object'],
+        response_class=FastJSONResponse,
     )
     def get_all_metadata_objects(
         pagination_params: Annotated[PaginationParams, Query()],
@@ -97,7 +213,7 @@ class MetadataObjectRoutes:
             db_session=db_session,
             pagination=pagination_params.model_dump(),
         )
-        return responsify(
+        return fast_responsify(
             (
                 metadata_objects,
                 pagination,
@@ -105,9 +221,75 @@ class MetadataObjectRoutes:
         )
 
 
-def create_route_handler(route_type, metadata_object, metadata_fields, model_class):
+async def serve_get_response(request, model_class, route_type, params, get_data, get_validators):
+    """
+    Response of a get route, with an ETag so that the client can revalidate
+    with `If-None-Match` and get a 304.
+
+    - Models that opt in to the response cache (see
+      backend/response_cache.py) are served from it. The ETag is a hash of
+      the body.
+    - For the others, a request with an `If-None-Match` first reads the
+      validators (see `BaseModel.get_validators`), and gets a 304 before
+      any row is loaded when they match. The ETag is then a hash of the
+      validators. Requests without one don't pay for the validators (it
+      would undo `count=none`), their ETag is a hash of the body.
+
+    `If-Modified-Since` isn't honoured: a row leaving a listing (deleted,
+    or no longer matching the filters) doesn't move the latest timestamp,
+    so a `Last-Modified` would give stale 304s.
+
+    Args:
+        request: The request
+        model_class: The model of the route
+        route_type (str): 'get_one' or 'get_all'
+        params: Hashable, normalized params of the request
+        get_data: Coroutine function returning the data to `responsify`
+        get_validators: Coroutine function returning the validators
+    """
+
+    cache_key = None
+    if response_cache.is_enabled(model_class):
+        # Unknown joins (plans not loaded yet) could make an entry outlive
+        # a write to a joined model, so those responses aren't cached
+        joined_models = relationship_registry.get_joined_models(model_class)
+        if joined_models is not None:
+            cache_key = await response_cache.get_key_async(model_class, route_type, params, joined_models)
+            cached = await response_cache.get_async(cache_key)
+            if cached is not None:
+                return etag_response(request, *cached)
+
+    if_none_match = request.headers.get('if-none-match')
+    if cache_key is None and if_none_match and hasattr(model_class, 'last_updated_at'):
+        validators = await get_validators()
+        # Nothing matches a get_one: let get_data raise its 404
+        if route_type != 'get_one' or validators[0]:
+            # The response also depends on the params and on the generated
+            # routes (fields, joins), which change with the metadata
+            etag = 'W/"{}"'.format(hashlib.sha1(repr((
+                route_type,
+                params,
+                validators,
+                generated_routes.metadata_version,
+            )).encode()).hexdigest())
+            if is_etag_match(if_none_match, etag):
+                return not_modified_response(etag)
+            body = dumps_json(responsify(await get_data()))
+            # The client may hold the ETag of a response without validators
+            if is_etag_match(if_none_match, get_etag(body)):
+                return not_modified_response(etag)
+            return etag_response(request, body, etag)
+
+    body = dumps_json(responsify(await get_data()))
+    etag = get_etag(body)
+    if cache_key is not None:
+        await response_cache.set_async(cache_key, body, etag, model_class.response_cache_ttl)
+    return etag_response(request, body, etag)
+
+
+def create_route_handler(router, route_type, metadata_object, metadata_fields, model_class):
     """
-    Create a route handler with proper parameter handling.
+    Create a route handler with proper parameter handling, on `router`.
     """
 
     name = metadata_object.api_configuration['name']
@@ -117,7 +299,7 @@ def create_route_handler(route_type, metadata_object, metadata_fields, model_cla
     param_name = f'id_{singular}'
     
     if route_type == 'get_all':
-        @app.get(
+        @router.get(
             f'/api/v1/admin/{plural_kebab}',
             operation_id=f'get_all_{name}',
             summary=f'Get all {plural}',
@@ -125,26 +307,49 @@ def create_route_handler(route_type, metadata_object, metadata_fields, model_cla
 
 **Filter Parameters:**
 Use `f_fieldname=value` format for filtering:
-- `f_fieldname=value` - Exact match
+- `f_fieldname=value` - Exact match (a date on a datetime field matches the whole day)
 - `f_fieldname=~value` - Contains text (case-insensitive)
-- `f_fieldname=>value` - Greater than (numbers/dates)
-- `f_fieldname=<value` - Less than (numbers/dates)
+- `f_fieldname=^value` - Starts with text (case-sensitive)
+- `f_fieldname=>value` / `f_fieldname=>=value` - Greater than / or equal to
+- `f_fieldname=<value` / `f_fieldname=<=value` - Less than / or equal to
+- `f_fieldname=between:from,to` - Range, both ends included
+- `f_fieldname=in:a,b,c` - Any of the values
+- `f_fieldname=is:null` / `f_fieldname=is:not_null` - Null checks
 
 **Examples:**
 - `f_status=active` - Filter by status
+- `f_status=in:active,paused` - Active or paused
 - `f_name=~electronics` - Names containing "electronics"
 - `f_name=^tech` - Names starting with "tech"
 - `f_id=>10` - IDs greater than 10
+- `f_created_at=between:2024-01-01,2024-01-31` - Created in January 2024
+
+**Cursor Pagination:**
+Pass `cursor=` (empty) to switch from page numbers to keyset pagination,
+then pass the returned `pagination.next_cursor` to fetch the next page.
+`after` is accepted as an alias of `cursor`. Deep pages stay as fast as
+the first one because no rows are skipped with OFFSET.
+
+**Total Count:**
+- `count=exact` - Exact count of the matching rows (default)
+- `count=estimate` - Planner estimate, much cheaper on large tables
+- `count=cached` - Exact count, cached for a few seconds per filter set
+- `count=none` - Skip the count, `total_items` is null
+
+`pagination.count_mode` tells which mode produced `total_items`.
 ''',
-            tags=[name]
+            tags=[name],
+            response_class=FastJSONResponse,
         )
-        def handler(
+        async def handler(
             request: Request,
             db_session=Depends(get_db),
             
             # Pagination parameters
             page: Annotated[Optional[int], Query(description="Page number (starting from 1)", ge=1)] = 1,
             page_size: Annotated[Optional[int], Query(description="Number of items per page", ge=1, le=1000)] = 100,
+            cursor: Annotated[Optional[str], Query(description="Keyset pagination cursor. Empty for the first page, then `pagination.next_cursor`")] = None,
+            count: Annotated[Optional[Literal['exact', 'estimate', 'cached', 'none']], Query(description="How `pagination.total_items` is computed. Defaults to `exact`")] = None,
             
             # Search and sorting
             q: Annotated[Optional[str], Query(description="Global search query across searchable fields")] = None,
@@ -158,45 +363,143 @@ Use `f_fieldname=value` format for filtering:
                 secondary_models_map={}
             )
             
-            method = getattr(DynamicActions, 'get_all')
-            items_details, pagination = method(
-                model_class=model_class,
-                db_session=db_session,
-                filters=parsed_params['filters'],
-                sort_details=parsed_params['sort_details'],
-                q=parsed_params['q'],
-                secondary_models_map=parsed_params['secondary_models_map'],
-                pagination=parsed_params['pagination'],
-            )
-            return responsify(
-                (
-                    items_details,
-                    pagination,
+            async def get_data():
+                method = getattr(DynamicActions, 'get_all')
+                items_details, pagination = await run_in_threadpool(
+                    method,
+                    model_class=model_class,
+                    db_session=db_session,
+                    filters=parsed_params['filters'],
+                    sort_details=parsed_params['sort_details'],
+                    q=parsed_params['q'],
+                    secondary_models_map=parsed_params['secondary_models_map'],
+                    pagination=parsed_params['pagination'],
+                )
+                return items_details, pagination
+
+            sort_details = parsed_params['sort_details']
+            cache_params = (
+                model_class.get_count_cache_key(parsed_params['filters'], parsed_params['q']),
+                sort_details and (
+                    sort_details['model'].__tablename__,
+                    sort_details['field'],
+                    sort_details['reverse'],
                 ),
+                tuple(sorted(parsed_params['pagination'].items())),
+            )
+            async def get_validators():
+                return await run_in_threadpool(
+                    DynamicActions.get_validators,
+                    model_class=model_class,
+                    db_session=db_session,
+                    filters=parsed_params['filters'],
+                    q=parsed_params['q'],
+                    secondary_models_map=parsed_params['secondary_models_map'],
+                )
+
+            return await serve_get_response(
+                request,
+                model_class,
+                'get_all',
+                cache_params,
+                get_data,
+                get_validators,
             )
         handler.__name__ = f'get_all_{name}'
         return handler
         
+    elif route_type == 'export':
+        @router.get(
+            f'/api/v1/admin/{plural_kebab}/export',
+            operation_id=f'export_{name}',
+            summary=f'Export {plural}',
+            description=f'''Stream every matching {singular} as NDJSON (one JSON object per line)
+or CSV, with the readable fields of the {singular}.
+
+Takes the same `f_` filters, `q` and `sort_by` as the list route. There is no
+pagination and no count: the rows are read through a server-side cursor, so
+exports of any size use the same memory.
+''',
+            tags=[name],
+            response_class=StreamingResponse,
+        )
+        async def handler(
+            request: Request,
+            format: Annotated[Literal['ndjson', 'csv'], Query(description="Export format")] = 'ndjson',
+            q: Annotated[Optional[str], Query(description="Global search query across searchable fields")] = None,
+            sort_by: Annotated[Optional[str], Query(description="Sort by field name. Use '-' prefix for descending (e.g., '-name')")] = None,
+        ):
+            # Parsed up front so that invalid filters fail before streaming
+            parsed_params = parse_request_params(
+                request_args=dict(request.query_params),
+                main_model_class=model_class,
+                secondary_models_map={}
+            )
+
+            def iter_items():
+                # The session has to outlive the request handler, so the
+                # export opens its own instead of using get_db
+                db_session = SessionLocal()
+                try:
+                    yield from model_class.stream_items(
+                        db_session=db_session,
+                        filters=parsed_params['filters'],
+                        sort_details=parsed_params['sort_details'],
+                        q=parsed_params['q'],
+                        secondary_models_map=parsed_params['secondary_models_map'],
+                    )
+                finally:
+                    db_session.close()
+
+            fields = model_class.get_projection_fields() or model_class.readable_fields
+            return StreamingResponse(
+                iter_export_chunks(iter_items(), format, fields),
+                media_type=EXPORT_MEDIA_TYPES[format],
+                headers={
+                    'Content-Disposition': f'attachment; filename="{plural}.{format}"',
+                },
+            )
+        handler.__name__ = f'export_{name}'
+        return handler
+
     elif route_type == 'get_one':
-        @app.get(
+        @router.get(
             f'/api/v1/admin/{plural_kebab}/{{{param_name}}}',
             operation_id=f'get_one_{name}',
             summary=f'Get {singular} by ID',
             description=f'Retrieve a specific {singular} by their ID',
-            tags=[name]
+            tags=[name],
+            response_class=FastJSONResponse,
         )
-        def handler(
+        async def handler(
+            request: Request,
             id_param: int = Path(..., alias=param_name),
             db_session=Depends(get_db)
         ):
-            method = getattr(DynamicActions, 'get_one')
-            item_details = method(
-                model_class=model_class,
-                id_item=id_param,
-                db_session=db_session
-            )
-            return responsify(
-                item_details,
+            async def get_data():
+                method = getattr(DynamicActions, 'get_one')
+                return await run_in_threadpool(
+                    method,
+                    model_class=model_class,
+                    id_item=id_param,
+                    db_session=db_session
+                )
+
+            async def get_validators():
+                return await run_in_threadpool(
+                    DynamicActions.get_validators,
+                    model_class=model_class,
+                    db_session=db_session,
+                    id_item=id_param,
+                )
+
+            return await serve_get_response(
+                request,
+                model_class,
+                'get_one',
+                id_param,
+                get_data,
+                get_validators,
             )
         handler.__name__ = f'get_one_{name}'
         return handler
@@ -209,25 +512,29 @@ Use `f_fieldname=value` format for filtering:
         )
         status_code = 201
 
-        @app.post(
+        @router.post(
             f'/api/v1/admin/{plural_kebab}',
             operation_id=f'create_{name}',
             summary=f'Create {singular}',
-            description=f'Create a new {singular}',
+            description=f'Create a new {singular}. `return` sets what is returned.',
             tags=[name],
             status_code=status_code,
+            response_class=FastJSONResponse,
         )
-        def handler(
+        async def handler(
             data_model: pydantic_create_model,
+            return_mode: Annotated[Literal['minimal', 'representation', 'full'], Query(alias='return', description="What to return: `minimal` (only the id), `representation` (the written row, default) or `full` (with its joins, like get_one)")] = 'representation',
             db_session=Depends(commit_db_session),
         ):
             method = getattr(DynamicActions, 'create')
-            item_details = method(
+            item_details = await run_in_threadpool(
+                method,
                 model_class=model_class,
                 data=data_model.model_dump(),
                 db_session=db_session,
+                return_mode=return_mode,
             )
-            return responsify(
+            return fast_responsify(
                 item_details,
                 status_code=status_code,
             )
@@ -241,95 +548,260 @@ Use `f_fieldname=value` format for filtering:
             model_type='update',
         )
 
-        @app.patch(
+        @router.patch(
             f'/api/v1/admin/{plural_kebab}/{{{param_name}}}',
             operation_id=f'update_{name}',
             summary=f'Update {singular}',
-            description=f'Update an existing {singular} by their ID',
-            tags=[name]
+            description=f'Update an existing {singular} by their ID. `return` sets what is returned.',
+            tags=[name],
+            response_class=FastJSONResponse,
         )
-        def handler(
+        async def handler(
             data: pydantic_update_model,
             id_param: int = Path(..., alias=param_name),
+            return_mode: Annotated[Literal['minimal', 'representation', 'full'], Query(alias='return', description="What to return: `minimal` (only the id), `representation` (the written row, default) or `full` (with its joins, like get_one)")] = 'representation',
             db_session=Depends(commit_db_session),
         ):
             method = getattr(DynamicActions, 'update')
-            item_details = method(
+            item_details = await run_in_threadpool(
+                method,
                 model_class=model_class,
                 **{param_name: id_param},
                 data=data,
                 db_session=db_session,
+                return_mode=return_mode,
             )
-            return responsify(
+            return fast_responsify(
                 item_details,
             )
         handler.__name__ = f'update_{name}'
         return handler
         
     elif route_type == 'delete':
-        @app.delete(
+        @router.delete(
             f'/api/v1/admin/{plural_kebab}/{{{param_name}}}',
             operation_id=f'delete_{name}',
             summary=f'Delete {singular}',
             description=f'Delete a {singular} by their ID',
-            tags=[name]
+            tags=[name],
+            response_class=FastJSONResponse,
         )
-        def handler(
+        async def handler(
             id_param: int = Path(..., alias=param_name),
             db_session=Depends(commit_db_session),
         ):
             method = getattr(DynamicActions, 'delete')
-            details = method(
+            details = await run_in_threadpool(
+                method,
                 model_class=model_class,
                 **{param_name: id_param},
                 db_session=db_session,
             )
-            return responsify(
+            return fast_responsify(
                 details,
             )
         handler.__name__ = f'delete_{name}'
         return handler
 
+    elif route_type in ('bulk_post', 'bulk_patch'):
+        is_create = route_type == 'bulk_post'
+        pydantic_model = generate_pydantic_model(
+            object=metadata_object,
+            fields=metadata_fields,
+            model_type='create' if is_create else 'update',
+        )
+        status_code = 201 if is_create else 200
+        operation = 'create' if is_create else 'update'
+        route = router.post if is_create else router.patch
+
+        @route(
+            f'/api/v1/admin/{plural_kebab}/bulk',
+            operation_id=f'bulk_{operation}_{name}',
+            summary=f'Bulk {operation} {plural}',
+            description=f'''{operation.capitalize()} many {plural} in one request and one statement.
+{'' if is_create else 'Every item needs its `id`, plus the fields to update.'}
+
+Every item is validated like in the single {operation} route. With `atomic=true`
+(default) any invalid item fails the whole request with all the errors. With
+`atomic=false` the valid items are still written, and the errors of the others
+(with their `index` in `items`) are returned in `data.errors`.
+
+`return` sets what is returned for every item: `minimal` (only the id),
+`representation` (the written row, default) or `full` (with its joins, like
+get_one, at the cost of re-reading the items).
+''',
+            tags=[name],
+            status_code=status_code,
+            response_class=FastJSONResponse,
+        )
+        async def handler(
+            data: BulkItemsRequest,
+            atomic: Annotated[bool, Query(description="Fail the whole request if any item is invalid")] = True,
+            return_mode: Annotated[Literal['minimal', 'representation', 'full'], Query(alias='return', description="What to return for every item")] = 'representation',
+            db_session=Depends(commit_db_session),
+        ):
+            method = getattr(DynamicActions, f'bulk_{operation}')
+            items, errors = await run_in_threadpool(
+                method,
+                model_class=model_class,
+                items=data.items,
+                db_session=db_session,
+                pydantic_model=pydantic_model,
+                atomic=atomic,
+                return_mode=return_mode,
+            )
+            return fast_responsify(
+                {
+                    'items': items,
+                    'errors': errors,
+                },
+                status_code=status_code,
+            )
+        handler.__name__ = f'bulk_{operation}_{name}'
+        return handler
+
+    elif route_type == 'bulk_delete':
+        @router.delete(
+            f'/api/v1/admin/{plural_kebab}/bulk',
+            operation_id=f'bulk_delete_{name}',
+            summary=f'Bulk delete {plural}',
+            description=f'''Delete many {plural} by their IDs in one statement.
+
+With `atomic=true` (default) any missing item fails the whole request. With
+`atomic=false` the others are still deleted, and the missing ones are returned
+in `data.errors`.
+''',
+            tags=[name],
+            response_class=FastJSONResponse,
+        )
+        async def handler(
+            data: BulkDeleteRequest,
+            atomic: Annotated[bool, Query(description="Fail the whole request if any item is missing")] = True,
+            db_session=Depends(commit_db_session),
+        ):
+            method = getattr(DynamicActions, 'bulk_delete')
+            items, errors = await run_in_threadpool(
+                method,
+                model_class=model_class,
+                ids=data.ids,
+                db_session=db_session,
+                atomic=atomic,
+            )
+            return fast_responsify(
+                {
+                    'items': items,
+                    'errors': errors,
+                },
+            )
+        handler.__name__ = f'bulk_delete_{name}'
+        return handler
+
+
+
+# Extra routes generated for a route type, under a fixed path
+FIXED_PATH_ROUTE_TYPES = {
+    'get_all': 'export',
+    'post': 'bulk_post',
+    'patch': 'bulk_patch',
+    'delete': 'bulk_delete',
+}
+
+
+def create_metadata_object_routes(router, metadata_object, metadata_fields):
+    """
+    Add the routes of a metadata object to `router`, based on its
+    api_configuration.
+    """
+
+    model_class = globals()[metadata_object.api_configuration['class_name']]
+
+    # Generate routes based on configuration. The routes with a
+    # fixed path go first, otherwise `/{plural}/export` and
+    # `/{plural}/bulk` would match the `/{plural}/{id}` routes.
+    route_types = metadata_object.api_configuration['routes']
+    fixed_path_route_types = [
+        FIXED_PATH_ROUTE_TYPES[route_type]
+        for route_type in route_types
+        if route_type in FIXED_PATH_ROUTE_TYPES
+    ]
+    for route_type in [*fixed_path_route_types, *route_types]:
+        create_route_handler(
+            router,
+            route_type,
+            metadata_object,
+            metadata_fields,
+            model_class,
+        )
+
+
+generated_routes = GeneratedRoutes(app, create_metadata_object_routes)
 
 
 def generate_routes_from_metadata_objects():
     """
     Dynamically generate routes from metadata_objects configuration.
+
+    The metadata comes from the compiled route registry (see
+    backend/meta/route_registry.py) when there's one, so that the startup
+    doesn't wait for the database. Otherwise it's read from the tables.
     """
 
-    db_session = SessionLocal()
-    try:
-        metadata_objects = MetadataObject.get_items(
-            db_session=db_session,
-        )
+    registry = load_route_registry()
+    if registry is None:
+        logger.info('No compiled route registry, reading the metadata tables')
+        db_session = SessionLocal()
+        try:
+            registry = build_route_registry(db_session)
+        finally:
+            db_session.close()
+    else:
+        logger.info(f'Using the compiled route registry {registry["metadata_version"][:12]}')
 
-        for metadata_object in metadata_objects:
-            if not metadata_object.api_configuration.get('is_enabled'):
-                print(f'Skipping {metadata_object.name} APIs because it is not enabled')
-                continue
+    generated_routes.apply(registry)
 
-            metadata_fields = MetadataField.get_items(
-                db_session=db_session,
-                filters=[{
-                    'field': 'id_metadata_object',
-                    'model': MetadataField,
-                    'equal_to': metadata_object.id,
-                }],
-            )
 
-            model_class = globals()[metadata_object.api_configuration['class_name']]
+def reload_routes_if_changed(last_stamp):
+    """
+    Regenerate the routes of the metadata objects that changed since the
+    metadata tables had the stamp `last_stamp`.
 
-            # Generate routes based on configuration
-            for route_type in metadata_object.api_configuration['routes']:
-                create_route_handler(
-                    route_type,
-                    metadata_object,
-                    metadata_fields,
-                    model_class,
-                )
+    Returns:
+        tuple: The current stamp, to pass to the next call
+    """
+
+    db_session = SessionLocal()
+    try:
+        stamp = get_metadata_stamp(db_session)
+        if stamp == last_stamp:
+            return stamp
+        registry = build_route_registry(db_session)
     finally:
         db_session.close()
 
+    if registry['metadata_version'] != generated_routes.metadata_version:
+        rebuilt_names = generated_routes.apply(registry)
+        logger.info(
+            f'Reloaded the routes of {len(rebuilt_names)} metadata objects '
+            f'(version {registry["metadata_version"][:12]}): {", ".join(rebuilt_names)}'
+        )
+    return stamp
+
+
+async def watch_metadata_changes():
+    """
+    Reload the generated routes of this worker whenever the metadata
+    changes. Also generates them once the database is reachable if it
+    wasn't at startup.
+    """
+
+    stamp = None
+    while True:
+        await asyncio.sleep(ROUTE_RELOAD_INTERVAL)
+        try:
+            stamp = await run_in_threadpool(reload_routes_if_changed, stamp)
+        except Exception as e:
+            logger.warning(f'Could not reload the generated routes: {e}')
+
 
 # Generate routes dynamically
 try:
@@ -0,0 +1,338 @@
+"""
+Compiled route registry.
+
+The generated routes only need the metadata_objects, their metadata_fields
+and the active metadata_relationships. Reading them takes a query per
+object at import time, so the `rebuild` CLI (or `compile-routes`) dumps them
+to a JSON file and the API loads that file instead, without touching the
+database. When the file is missing, or was written by an older format, the
+API reads the tables as before.
+
+Every worker then checks a cheap stamp of the metadata tables every
+ROUTE_RELOAD_INTERVAL seconds. When it changed, the registry is rebuilt from
+the tables and the routes of the objects that changed are regenerated and
+swapped in by `GeneratedRoutes`, without a restart.
+
+The file looks like
+
+    {
+        "format_version": 1,
+        "metadata_version": "<sha256 of the content below>",
+        "generated_at": "2025-01-01T00:00:00+00:00",
+        "objects": [{...metadata_object..., "fields": [{...}, ...]}, ...],
+        "relationships": [{...}, ...]
+    }
+"""
+
+import os
+import hashlib
+import logging
+import threading
+
+from pathlib import Path
+from datetime import datetime, UTC
+
+import orjson
+
+from fastapi import APIRouter
+from sqlalchemy import select, func
+
+from backend.actions import relationship_registry
+from backend.helpers import dumps_json
+from backend.models import MetadataObject, MetadataField, MetadataRelationship
+
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of the file changes, older files are then ignored
+ROUTE_REGISTRY_FORMAT_VERSION = 1
+
+ROUTE_REGISTRY_PATH = os.getenv(
+    'ROUTE_REGISTRY_PATH',
+    str(Path(__file__).resolve().parents[2] / 'data' / 'route_registry.json'),
+)
+
+# Seconds between two checks of the metadata tables for changes by every
+# worker, 0 disables the reloading
+ROUTE_RELOAD_INTERVAL = float(os.getenv('ROUTE_RELOAD_INTERVAL', '30'))
+
+# Change on every rebuild without changing the routes
+EXCLUDED_COLUMNS = ('created_at', 'last_updated_at', 'deleted_at')
+
+
+def _to_registry_row(item):
+    row = item.to_dict(full=True)
+    for column_name in EXCLUDED_COLUMNS:
+        row.pop(column_name, None)
+    return row
+
+
+def get_metadata_version(objects, relationships):
+    """
+    Content hash of the metadata the routes are generated from. Equal
+    metadata gives an equal version, whatever the row timestamps.
+    """
+
+    content = dumps_json({'objects': objects, 'relationships': relationships})
+    return hashlib.sha256(content).hexdigest()
+
+
+def build_route_registry(db_session):
+    """
+    Read the metadata tables into a route registry.
+
+    Args:
+        db_session: Database session
+
+    Returns:
+        dict: The registry, in the layout of the file
+    """
+
+    metadata_objects = db_session.query(MetadataObject).filter(
+        MetadataObject.deleted_at == None,
+    ).order_by(MetadataObject.id).all()
+
+    # All the fields at once instead of a query per object
+    fields_by_object = {}
+    metadata_fields = db_session.query(MetadataField).filter(
+        MetadataField.deleted_at == None,
+    ).order_by(MetadataField.id).all()
+    for metadata_field in metadata_fields:
+        fields_by_object.setdefault(
+            metadata_field.id_metadata_object, [],
+        ).append(_to_registry_row(metadata_field))
+
+    objects = []
+    for metadata_object in metadata_objects:
+        row = _to_registry_row(metadata_object)
+        row['fields'] = fields_by_object.get(metadata_object.id, [])
+        objects.append(row)
+
+    relationships = [
+        _to_registry_row(relationship)
+        for relationship in db_session.query(MetadataRelationship).filter(
+            MetadataRelationship.status == 'active',
+        ).order_by(MetadataRelationship.id).all()
+    ]
+
+    return {
+        'format_version': ROUTE_REGISTRY_FORMAT_VERSION,
+        'metadata_version': get_metadata_version(objects, relationships),
+        'generated_at': datetime.now(UTC).isoformat(),
+        'objects': objects,
+        'relationships': relationships,
+    }
+
+
+def write_route_registry(registry, path=None):
+    """
+    Write the registry to `path`. The file is replaced atomically, so a
+    process starting at the same time reads either the old or the new one.
+
+    Returns:
+        str: The path written to
+    """
+
+    path = path or ROUTE_REGISTRY_PATH
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = f'{path}.{os.getpid()}.tmp'
+    with open(temporary_path, 'wb') as f:
+        f.write(dumps_json(registry))
+    os.replace(temporary_path, path)
+    return path
+
+
+def load_route_registry(path=None):
+    """
+    Read the registry from `path`.
+
+    Returns:
+        dict | None: The registry, or None if there's no usable file
+    """
+
+    path = path or ROUTE_REGISTRY_PATH
+    try:
+        with open(path, 'rb') as f:
+            registry = orjson.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning(f'Could not read the route registry {path}: {e}')
+        return None
+
+    if registry.get('format_version') != ROUTE_REGISTRY_FORMAT_VERSION:
+        logger.warning(
+            f'Ignoring the route registry {path}, its format version is '
+            f'{registry.get("format_version")} instead of {ROUTE_REGISTRY_FORMAT_VERSION}'
+        )
+        return None
+    return registry
+
+
+def get_registry_object(row):
+    """
+    A metadata object of a registry with its fields, as transient (never
+    added to a session) model instances, so that they can be used like the
+    ones queried from the database.
+
+    Returns:
+        tuple[MetadataObject, list[MetadataField]]
+    """
+
+    row = dict(row)
+    fields = [MetadataField(**field_row) for field_row in row.pop('fields')]
+    return MetadataObject(**row), fields
+
+
+def get_registry_objects(registry):
+    """
+    All the metadata objects of a registry, see `get_registry_object`.
+
+    Returns:
+        list[tuple[MetadataObject, list[MetadataField]]]
+    """
+
+    return [get_registry_object(row) for row in registry['objects']]
+
+
+def get_object_version(row):
+    """
+    Content hash of a metadata object of a registry and its fields, to tell
+    which objects changed between two registries.
+    """
+
+    return hashlib.sha256(dumps_json(row)).hexdigest()
+
+
+def get_registry_relationships(registry):
+    """
+    The active metadata relationships of a registry, as transient model
+    instances.
+
+    Returns:
+        list[MetadataRelationship]
+    """
+
+    return [MetadataRelationship(**row) for row in registry['relationships']]
+
+
+def get_metadata_stamp(db_session):
+    """
+    Cheap stamp of the metadata tables (row count, highest id and latest
+    change of each), read in a single statement. It changes whenever a row
+    is inserted, updated or deleted, so the registry only has to be rebuilt
+    (and compared) when it does.
+
+    Returns:
+        tuple
+    """
+
+    columns = []
+    for model_class in (MetadataObject, MetadataField, MetadataRelationship):
+        columns += [
+            select(func.count(model_class.id)).scalar_subquery(),
+            select(func.max(model_class.id)).scalar_subquery(),
+            select(func.max(model_class.created_at)).scalar_subquery(),
+            select(func.max(model_class.last_updated_at)).scalar_subquery(),
+        ]
+    return tuple(db_session.execute(select(*columns)).one())
+
+
+class GeneratedRoutes:
+    """
+    The routes generated from a route registry, one APIRouter per metadata
+    object, kept as a block in `app.router.routes` where they were first
+    added (so the routes declared after them still come after them). The
+    block is found by the identity of its route objects, not by position,
+    so routes added or removed around it don't shift it.
+
+    `apply()` takes a newer registry, rebuilds the routes and pydantic
+    models of the objects that changed only, and swaps the whole block in
+    with a single assignment of `app.router.routes`. A request being routed
+    at the same time sees either the old or the new routes, never a mix.
+    """
+
+    def __init__(self, app, create_routes):
+        """
+        Args:
+            app: The FastAPI app
+            create_routes: Function (router, metadata_object,
+            metadata_fields) adding the routes of an object to `router`
+        """
+
+        self.app = app
+        self.create_routes = create_routes
+        self.metadata_version = None
+        self.reloads = 0
+        self._routers = {}
+        self._routes = []
+        # The block goes right after the last route declared before it
+        self._previous_route = app.router.routes[-1] if app.router.routes else None
+        self._lock = threading.Lock()
+
+    def apply(self, registry):
+        """
+        Make the routes match `registry`.
+
+        Returns:
+            list[str]: Names of the metadata objects whose routes were
+            (re)generated
+        """
+
+        with self._lock:
+            # Cheap, and the relationships aren't part of the object versions
+            relationship_registry.load(get_registry_relationships(registry))
+
+            routers = {}
+            rebuilt_names = []
+            for row in registry['objects']:
+                version = get_object_version(row)
+                current = self._routers.get(row['token'])
+                if current is not None and current[0] == version:
+                    routers[row['token']] = current
+                    continue
+
+                metadata_object, metadata_fields = get_registry_object(row)
+                router = APIRouter(dependency_overrides_provider=self.app)
+                if metadata_object.api_configuration.get('is_enabled'):
+                    self.create_routes(router, metadata_object, metadata_fields)
+                else:
+                    print(f'Skipping {metadata_object.name} APIs because it is not enabled')
+                routers[row['token']] = (version, router)
+                rebuilt_names.append(metadata_object.name)
+
+            routes = [route for _, router in routers.values() for route in router.routes]
+            self.app.router.routes = self._replace_routes(self.app.router.routes, routes)
+            # Regenerated on the next /openapi.json
+            self.app.openapi_schema = None
+
+            self._routers = routers
+            self._routes = routes
+            self.metadata_version = registry['metadata_version']
+            self.reloads += 1
+            return rebuilt_names
+
+    def _replace_routes(self, app_routes, routes):
+        """
+        `app_routes` with the current generated routes replaced by `routes`.
+        """
+
+        current_ids = {id(route) for route in self._routes}
+        other_routes = [route for route in app_routes if id(route) not in current_ids]
+        # No generated route comes before the first one, so its index is
+        # the same in `other_routes`
+        index = next((i for i, route in enumerate(app_routes) if id(route) in current_ids), None)
+        if index is None:
+            index = next(
+                (i + 1 for i, route in enumerate(other_routes) if route is self._previous_route),
+                0 if self._previous_route is None else len(other_routes),
+            )
+        return [*other_routes[:index], *routes, *other_routes[index:]]
+
+    def stats(self):
+        return {
+            'metadata_version': self.metadata_version,
+            'objects': len(self._routers),
+            'routes': len(self._routes),
+            'reloads': self.reloads,
+        }
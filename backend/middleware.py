@@ -1,9 +1,11 @@
+import time
 import logging
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 
+from backend.instrumentation import QueryMetrics, current_metrics
 from backend.exceptions import (
     Forbidden,
     Unauthorized,
@@ -167,3 +169,23 @@ def register_exception_handlers(app: FastAPI):
             content=error_response
         )
 
+
+def register_instrumentation(app: FastAPI):
+    """
+    Collect the query metrics of every request (see backend/instrumentation.py)
+    and send them back in the `Server-Timing` header
+    """
+
+    @app.middleware('http')
+    async def add_server_timing(request: Request, call_next):
+        start_time = time.perf_counter()
+        metrics = QueryMetrics(path=request.url.path)
+        token = current_metrics.set(metrics)
+        try:
+            response = await call_next(request)
+        finally:
+            current_metrics.reset(token)
+
+        total_time = (time.perf_counter() - start_time) * 1000
+        response.headers['Server-Timing'] = metrics.get_server_timing(total_time)
+        return response
@@ -8,6 +8,10 @@ from backend.models.mixins import CommonColumnsMixin
 class ActivityLog(CommonColumnsMixin, BaseModel):
     __tablename__ = 'activity_logs'
 
+    _info = {
+        'search': {'backend': 'fulltext'},
+    }
+
     activity_type: Mapped[str] = mc(String(100), nullable=False, info={
         'name': 'activity_type',
         'display_name': 'Activity Type',
@@ -19,6 +23,7 @@ class ActivityLog(CommonColumnsMixin, BaseModel):
         'is_searchable': True,
         'is_sortable': True,
         'is_filterable': True,
+        'is_indexed': True,
         'max_length': 100,
     })
     
@@ -1,15 +1,61 @@
+import os
 import json
+import time
 
 from datetime import datetime, UTC
-from sqlalchemy import or_, func, event, String, Integer
+from sqlalchemy import or_, and_, tuple_, func, event, select, text, literal, String, Integer, Numeric, Boolean, DateTime, Date
 from sqlalchemy.orm import Session, aliased, declared_attr
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from sqlalchemy.ext.compiler import compiles
 
 from backend.database import Base
-from backend.helpers import camel_case_to_words, to_snake_case, deep_merge_dicts
+from backend.exceptions import InvalidRequestData
+from backend.indexes import declare_metadata_indexes
+from backend.instrumentation import get_current_metrics, record_rows_fetched
+from backend.search import get_search_backend, get_searchable_columns
+from backend.helpers import (
+    camel_case_to_words,
+    to_snake_case,
+    deep_merge_dicts,
+    encode_cursor,
+    decode_cursor,
+    escape_like,
+    TTLCache,
+)
+
+
+# Exact counts for `count_mode=cached`, keyed by table and normalized filters
+count_cache = TTLCache(
+    ttl=float(os.getenv('COUNT_CACHE_TTL_SECONDS', '30')),
+    max_size=int(os.getenv('COUNT_CACHE_MAX_SIZE', '2048')),
+)
+
+
+class Explain(Executable, ClauseElement):
+    """
+    `EXPLAIN (FORMAT JSON)` of a statement. Compiled like the statement
+    itself, so the parameters follow the paramstyle of the driver.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, 'postgresql')
+def _compile_explain(element, compiler, **kwargs):
+    return f'EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kwargs)}'
 
 
 class BaseModel(Base):
     __abstract__ = True
+
+    # Seconds the responses of the generated get routes are cached for, see
+    # backend/response_cache.py (also for how stale the other workers can
+    # get). None disables the cache. Meant for reference data, read on most
+    # pages and rarely written.
+    response_cache_ttl = None
     
     @declared_attr
     def __table_args__(cls):
@@ -93,6 +139,576 @@ class BaseModel(Base):
         for field, value in data.items():
             setattr(self, field, value)
 
+    @classmethod
+    def get_projection_fields(cls):
+        """
+        The readable fields if all of them are table columns, so they can be
+        selected directly instead of loading the entity. None if some of them
+        are computed in Python (e.g. a property).
+        """
+
+        columns = cls.__table__.columns
+        if any(field not in columns for field in cls.readable_fields):
+            return None
+        return cls.readable_fields
+
+    @staticmethod
+    def get_projection_columns(selected_entities):
+        """
+        Build the labelled columns that select the readable fields of each
+        entity, and the layout to read them back with `row_to_dict`.
+
+        Args:
+            selected_entities (list): (entity or alias, model class) tuples
+
+        Returns:
+            tuple: (columns, layouts), or (None, None) if some model has
+                readable fields that aren't columns
+        """
+
+        projection_fields = [model.get_projection_fields() for _, model in selected_entities]
+        if any(fields is None for fields in projection_fields):
+            return None, None
+
+        columns = []
+        layouts = []
+        for position, (entity, model) in enumerate(selected_entities):
+            id_index = len(columns)
+            columns.append(getattr(entity, 'id').label(f'e{position}_id'))
+            field_layout = []
+            for field in projection_fields[position]:
+                is_datetime = isinstance(model.__table__.columns[field].type, DateTime)
+                field_layout.append((field, len(columns), is_datetime))
+                columns.append(getattr(entity, field).label(f'e{position}_{field}'))
+            layouts.append((id_index, field_layout))
+        return columns, layouts
+
+    @staticmethod
+    def row_to_dict(row, layout):
+        """
+        Build the `to_dict()` equivalent of one entity from a projected row.
+
+        Args:
+            row (Row): A row of a projection query
+            layout (tuple): (index of the id column, [(field, index, is_datetime)])
+
+        Returns:
+            dict: None if the entity is missing (outer join without a match)
+        """
+
+        id_index, fields = layout
+        if row[id_index] is None:
+            return None
+
+        result = {}
+        for field, index, is_datetime in fields:
+            value = row[index]
+            if is_datetime and value is not None:
+                value = value.isoformat()
+            result[field] = value
+        return result
+
+    @classmethod
+    def load_list_joins(cls, db_session, main_items, list_joins, projection=False):
+        """
+        Load `list_joins` for a page of main items with one
+        `WHERE fk IN (...)` query per list join, and attach them to the main
+        item dicts. The per-item `limit` is applied in SQL with a
+        row_number() window over the matching rows only.
+
+        Args:
+            db_session (Session): SQLAlchemy session
+            main_items (dict): Main item ID -> main item dict
+            list_joins (list): Same structure as in `get_items`
+            projection (bool): Select plain columns instead of entities
+        """
+
+        main_ids = list(main_items)
+        for list_join in list_joins:
+            as_key = list_join['as_']
+            for item_dict in main_items.values():
+                item_dict[as_key] = []
+            if not main_ids:
+                continue
+
+            model = list_join['model']
+            fk_column = getattr(model, list_join['column'])
+
+            order_by = None
+            if 'sort_by' in list_join:
+                order_by = getattr(model, list_join['sort_by'])
+                if list_join.get('reverse', False):
+                    order_by = order_by.desc()
+
+            row_number = func.row_number().over(
+                partition_by=fk_column,
+                order_by=order_by,
+            ).label('row_number')
+            subquery = db_session.query(
+                model,
+                row_number,
+            ).filter(
+                fk_column.in_(main_ids)
+            ).subquery()
+            list_join_alias = aliased(model, subquery)
+
+            query = db_session.query(list_join_alias)
+            if 'limit' in list_join:
+                query = query.filter(subquery.c.row_number <= list_join['limit'])
+
+            selected_entities = [(list_join_alias, model)]
+            joins_of_list_join = list_join.get('joins', [])
+            for join_of_list_join in joins_of_list_join:
+                join_model_alias = aliased(join_of_list_join['model'])
+                query = query.outerjoin(
+                    join_model_alias,
+                    getattr(list_join_alias, join_of_list_join['column']) == getattr(join_model_alias, 'id'),
+                ).add_entity(join_model_alias)
+                selected_entities.append((join_model_alias, join_of_list_join['model']))
+
+            # Rows of the same main item come back in the list join's order
+            query = query.order_by(subquery.c.row_number)
+
+            layouts = None
+            if projection:
+                columns, layouts = cls.get_projection_columns(selected_entities)
+            if layouts:
+                fk_index = len(columns)
+                columns.append(getattr(list_join_alias, list_join['column']).label('main_item_id'))
+                rows = query.with_entities(*columns).all()
+                record_rows_fetched(len(rows))
+                for row in rows:
+                    list_joined_item_details = cls.row_to_dict(row, layouts[0])
+                    for i, join_of_list_join in enumerate(joins_of_list_join):
+                        list_joined_item_details[join_of_list_join['as_']] = cls.row_to_dict(row, layouts[i + 1])
+                    main_items[row[fk_index]][as_key].append(list_joined_item_details)
+            else:
+                rows = query.all()
+                record_rows_fetched(len(rows))
+                for item_or_tuple in rows:
+                    if joins_of_list_join:
+                        list_joined_item = item_or_tuple[0]
+                        joined_items = item_or_tuple[1:]
+                    else:
+                        list_joined_item = item_or_tuple
+                        joined_items = []
+
+                    list_joined_item_details = list_joined_item.to_dict()
+                    for join_of_list_join, joined_item in zip(joins_of_list_join, joined_items):
+                        list_joined_item_details[join_of_list_join['as_']] = joined_item.to_dict() if joined_item else None
+                    main_items[getattr(list_joined_item, list_join['column'])][as_key].append(
+                        list_joined_item_details
+                    )
+
+    @classmethod
+    def get_count_cache_key(cls, filters=None, q=None, joins=()):
+        """
+        Normalize a filter set into a hashable key, so the same filters in a
+        different order share a cached count. The joins are part of it, as
+        they can change the number of rows.
+        """
+
+        normalized_filters = []
+        for filter_dict in filters or []:
+            model = filter_dict['model']
+            for operation, value in filter_dict.items():
+                if operation in ('model', 'field'):
+                    continue
+                normalized_filters.append((
+                    model.__tablename__,
+                    filter_dict['field'],
+                    operation,
+                    repr(value),
+                ))
+        normalized_joins = tuple(
+            (join['model'].__tablename__, join.get('column'), str(join['on']) if 'on' in join else None)
+            for join in joins
+        )
+        return (
+            cls.__tablename__,
+            tuple(sorted(normalized_filters)),
+            (q or '').strip(),
+            normalized_joins,
+        )
+
+    @classmethod
+    def get_validators(
+        cls,
+        db_session,
+        id=None,
+        filters=None,
+        q=None,
+        secondary_models_map={},
+        joins=[],
+        list_joins=[],
+    ):
+        """
+        Cheap validators of what `get_items` would return, for conditional
+        GETs: they change whenever a matching row, one of the rows it joins,
+        one of its list joined rows or a row those join is created, updated
+        or deleted. They come from a single statement that doesn't load any
+        row.
+
+        Args:
+            id (int): Validators of this item only
+            filters, q, secondary_models_map: As in `get_items`
+            joins, list_joins: As in `get_items`
+
+        Returns:
+            tuple: The validators, starting with the number of matching rows
+        """
+
+        columns = [cls.id, cls.created_at, cls.last_updated_at]
+        joins = [join for join in joins if hasattr(join['model'], 'last_updated_at')]
+        columns += [getattr(cls, join['column']) for join in joins]
+
+        query = db_session.query(*columns).filter(cls.deleted_at == None)
+        if id:
+            query = query.filter(cls.id == id)
+        query, _ = cls.apply_filters(
+            db_session,
+            query,
+            filters=None if id else filters,
+            q=None if id else q,
+            secondary_models_map=secondary_models_map,
+        )
+        matching = query.cte('matching')
+
+        validators = [
+            func.count(matching.c.id),
+            func.max(matching.c.created_at),
+            func.max(matching.c.last_updated_at),
+        ]
+        for join in joins:
+            target_model = join['model']
+            validators.append(
+                select(func.max(target_model.last_updated_at)).where(
+                    target_model.id.in_(select(matching.c[join['column']]))
+                ).scalar_subquery()
+            )
+        for list_join in list_joins:
+            target_model = list_join['model']
+            condition = getattr(target_model, list_join['column']).in_(select(matching.c.id))
+            if hasattr(target_model, 'last_updated_at'):
+                validators += [
+                    select(func.count(target_model.id)).where(condition).scalar_subquery(),
+                    select(func.max(func.coalesce(
+                        target_model.last_updated_at,
+                        target_model.created_at,
+                    ))).where(condition).scalar_subquery(),
+                ]
+            for join_of_list_join in list_join.get('joins', []):
+                join_model = join_of_list_join['model']
+                if not hasattr(join_model, 'last_updated_at'):
+                    continue
+                joined_ids = select(getattr(target_model, join_of_list_join['column'])).where(condition)
+                validators.append(
+                    select(func.max(func.coalesce(
+                        join_model.last_updated_at,
+                        join_model.created_at,
+                    ))).where(join_model.id.in_(joined_ids)).scalar_subquery()
+                )
+
+        return tuple(db_session.execute(select(*validators).select_from(matching)).one())
+
+    @classmethod
+    def count_items(cls, db_session, query, count_mode='exact', cache_key=None, is_filtered=True):
+        """
+        Count the rows of a listing query.
+
+        Args:
+            db_session (Session): SQLAlchemy session
+            query: The filtered (and joined) listing query
+            count_mode (str):
+                - exact: `SELECT count(*)` over the query
+                - estimate: Postgres planner estimate. `pg_class.reltuples`
+                  when the listing is unfiltered, otherwise the row estimate
+                  of `EXPLAIN`
+                - cached: exact count, cached for a short time per filter set
+                - none: no count at all
+            cache_key: Key for `count_mode=cached`, see `get_count_cache_key`
+            is_filtered (bool): If False, the table statistics can be used for
+                the estimate
+
+        Returns:
+            tuple: (total or None, the count mode that produced it)
+        """
+
+        if count_mode == 'none':
+            return None, 'none'
+
+        if count_mode == 'cached' and cache_key is not None:
+            total = count_cache.get(cache_key)
+            if total is not None:
+                return total, 'cached'
+            total = query.count()
+            count_cache.set(cache_key, total)
+            return total, 'exact'
+
+        if count_mode == 'estimate' and db_session.get_bind().dialect.name == 'postgresql':
+            if not is_filtered:
+                reltuples = db_session.execute(
+                    text('SELECT reltuples FROM pg_class WHERE oid = CAST(:table_name AS regclass)'),
+                    {'table_name': cls.__tablename__},
+                ).scalar()
+                # -1 (or 0) until the table has been vacuumed/analyzed
+                if reltuples and reltuples > 0:
+                    return int(reltuples), 'estimate'
+
+            statement = query.with_entities(cls.id).order_by(None).statement
+            plan = db_session.execute(Explain(statement)).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]['Plan']['Plan Rows']), 'estimate'
+
+        return query.count(), 'exact'
+
+    @classmethod
+    def get_seek_condition(cls, sort_column, reverse, cursor):
+        """
+        Build the WHERE condition that continues a keyset paginated listing
+        after the row encoded in `cursor`.
+
+        Rows are ordered by (sort_column, id) with NULLs last in ascending
+        order and first in descending order (the Postgres default), so
+        nullable sort columns need an explicit branch for them.
+
+        Args:
+            sort_column: The main model column the listing is sorted by
+            reverse (bool): If True, the listing is in descending order
+            cursor (str): Cursor returned in the previous page's pagination
+
+        Raises:
+            InvalidRequestData: If the cursor is malformed or was issued for
+                a different sort order
+        """
+
+        position = decode_cursor(cursor)
+        if (
+            position is None or
+            position['field'] != sort_column.key or
+            position['reverse'] != reverse
+        ):
+            raise InvalidRequestData(
+                errors=[{
+                    'field': 'cursor',
+                    'description': 'Cursor is invalid or does not match the sort order',
+                }],
+                message='Invalid pagination cursor',
+            )
+
+        value = position['value']
+        last_id = position['id']
+
+        if sort_column.key == 'id':
+            return cls.id < last_id if reverse else cls.id > last_id
+
+        is_nullable = sort_column.property.columns[0].nullable
+        if not is_nullable:
+            # Row value comparison, which Postgres can serve from a
+            # composite (sort column, id) index
+            if reverse:
+                return tuple_(sort_column, cls.id) < tuple_(value, last_id)
+            return tuple_(sort_column, cls.id) > tuple_(value, last_id)
+
+        if value is None:
+            if reverse:
+                # NULLs first: the rest of the NULLs, then every non-NULL
+                return or_(
+                    and_(sort_column.is_(None), cls.id < last_id),
+                    sort_column.is_not(None),
+                )
+            # NULLs last: only the rest of the NULLs remain
+            return and_(sort_column.is_(None), cls.id > last_id)
+
+        if reverse:
+            return or_(
+                sort_column < value,
+                and_(sort_column == value, cls.id < last_id),
+            )
+        return or_(
+            sort_column > value,
+            and_(sort_column == value, cls.id > last_id),
+            sort_column.is_(None),
+        )
+
+    @classmethod
+    def apply_filters(
+        cls,
+        db_session,
+        query,
+        filters=None,
+        raw_filters=None,
+        q=None,
+        secondary_models_map={},
+    ):
+        """
+        Apply the raw filters, the field filters and the global search to a
+        query of the model.
+
+        Args:
+            db_session (Session): SQLAlchemy session
+            query (Query): Query of the model (and its joins)
+            filters (list): Filters from `parse_request_params`
+            raw_filters (list): SQLAlchemy conditions, applied as they are
+            q (str): Global search query
+            secondary_models_map (dict): Joined models by their `as_` name
+
+        Returns:
+            tuple: (query, search rank expression or None)
+        """
+
+        if raw_filters:
+            query = query.filter(*raw_filters)
+
+        # Apply filters to the main model if provided
+        # print('filters', filters)
+        if filters:
+            for filter_dict in filters:
+                field = filter_dict.get('field')
+
+                column = getattr(filter_dict['model'], field)
+
+                # Null checks work on any column
+                if 'is_null' in filter_dict:
+                    if filter_dict['is_null']:
+                        query = query.filter(column.is_(None))
+                    else:
+                        query = query.filter(column.is_not(None))
+
+                # Skip if column is not a number, date/datetime, string or
+                # boolean (`parse_filter` only gives null checks for others)
+                if not isinstance(
+                    column.type,
+                    (Integer, Numeric, DateTime, Date, String, Boolean),
+                ):
+                    continue
+
+                # Apply filters. All but `contains` are plain comparisons
+                # that a B-tree index on the column can serve.
+                if 'lesser_than' in filter_dict:
+                    value = filter_dict['lesser_than']
+                    query = query.filter(column < value)
+                if 'lesser_than_or_equal_to' in filter_dict:
+                    value = filter_dict['lesser_than_or_equal_to']
+                    query = query.filter(column <= value)
+                if 'greater_than' in filter_dict:
+                    value = filter_dict['greater_than']
+                    query = query.filter(column > value)
+                if 'greater_than_or_equal_to' in filter_dict:
+                    value = filter_dict['greater_than_or_equal_to']
+                    query = query.filter(column >= value)
+                if 'equal_to' in filter_dict:
+                    value = filter_dict['equal_to']
+                    query = query.filter(column == value)
+                if 'in' in filter_dict:
+                    value = filter_dict['in']
+                    query = query.filter(column.in_(value))
+                if 'contains' in filter_dict and isinstance(column.type, String):
+                    value = filter_dict['contains']
+                    query = query.filter(column.ilike(f'%{value}%'))
+                if 'starts_with' in filter_dict and isinstance(column.type, String):
+                    # The pattern is rendered inline (`literal_execute`)
+                    # instead of sent as a bind parameter, so even a prepared
+                    # or generic plan sees the fixed prefix and can turn it
+                    # into a range on the prefix index
+                    value = escape_like(filter_dict['starts_with'])
+                    pattern = literal(f'{value}%', String, literal_execute=True)
+                    query = query.filter(column.like(pattern, escape='\\'))
+
+        # Apply global search if provided. The model's own columns go
+        # through its search backend (and its index), the columns of joined
+        # models are always matched with ILIKE.
+        search_rank = None
+        if q and q.strip():
+            search_conditions = []
+            searchable_columns = get_searchable_columns(cls)
+            if searchable_columns:
+                search_backend = get_search_backend(cls, db_session)
+                search_conditions.append(search_backend.get_condition(cls, searchable_columns, q))
+                search_rank = search_backend.get_rank(cls, searchable_columns, q)
+
+            for field_text in cls.searchable_fields:
+                if '.' not in field_text:
+                    continue
+                as_, field = field_text.split('.')
+                column = getattr(secondary_models_map[as_], field)
+                if isinstance(column.type, String):
+                    search_conditions.append(column.ilike(f'%{q}%'))
+
+            if search_conditions:
+                # Combine all conditions with OR
+                query = query.filter(or_(*search_conditions))
+
+        return query, search_rank
+
+    @classmethod
+    def stream_items(
+        cls,
+        db_session: Session,
+        filters=None,
+        sort_details=None,
+        q=None,
+        secondary_models_map={},
+        batch_size=1000,
+    ):
+        """
+        Yield the readable fields of every matching item, for exports. The
+        rows are fetched `batch_size` at a time through a server-side cursor
+        (`yield_per`), so memory stays the same whatever the table size.
+        There are no joins, no pagination and no count.
+
+        Args:
+            db_session (Session): SQLAlchemy session
+            filters (list): Filters from `parse_request_params`
+            sort_details (dict): Sort from `parse_request_params`. Only
+                columns of the model itself are used.
+            q (str): Global search query
+            secondary_models_map (dict): Joined models by their `as_` name
+            batch_size (int): Rows per round trip
+
+        Yields:
+            dict: Readable fields of an item
+        """
+
+        query = db_session.query(cls).filter(cls.deleted_at == None)
+        query, search_rank = cls.apply_filters(
+            db_session,
+            query,
+            filters=filters,
+            q=q,
+            secondary_models_map=secondary_models_map,
+        )
+
+        if sort_details and sort_details['model'] is cls and hasattr(cls, sort_details['field']):
+            sort_column = getattr(cls, sort_details['field'])
+            if sort_details['reverse']:
+                query = query.order_by(sort_column.desc(), cls.id.desc())
+            else:
+                query = query.order_by(sort_column.asc(), cls.id.asc())
+        elif search_rank is not None:
+            query = query.order_by(search_rank.desc(), cls.id.asc())
+        else:
+            query = query.order_by(cls.id.asc())
+
+        query = query.execution_options(yield_per=batch_size)
+        total_rows = 0
+        fields = cls.get_projection_fields()
+        try:
+            if fields:
+                query = query.with_entities(*[getattr(cls, field) for field in fields])
+                for row in query:
+                    total_rows += 1
+                    yield {
+                        field: value.isoformat() if isinstance(value, datetime) else value
+                        for field, value in zip(fields, row)
+                    }
+            else:
+                for item in query:
+                    total_rows += 1
+                    yield item.to_dict()
+        finally:
+            record_rows_fetched(total_rows)
 
     @classmethod
     def get_items(
@@ -108,6 +724,8 @@ class BaseModel(Base):
         list_joins=[],
         secondary_models_map={},
         pagination={},
+        projection=False,
+        list_join_strategy='window',
     ):
         """
         Get items with sorting, limiting, and filtering.
@@ -123,8 +741,13 @@ class BaseModel(Base):
                     'model': Model,  # The model to filter on
                     'lesser_than': int/str,  # Optional, int for Integer fields, ISO format string for DateTime/Date
                     'greater_than': int/str,  # Optional, int for Integer fields, ISO format string for DateTime/Date
+                    'lesser_than_or_equal_to': int/str,  # Optional, like lesser_than
+                    'greater_than_or_equal_to': int/str,  # Optional, like greater_than
                     'equal_to': int/str,  # Optional, int for Integer fields, ISO format string for DateTime/Date
-                    'contains': str  # Optional, for string fields, case-insensitive wildcard match
+                    'in': list,  # Optional, values like equal_to
+                    'is_null': bool,  # Optional, True for IS NULL, False for IS NOT NULL
+                    'contains': str,  # Optional, for string fields, case-insensitive wildcard match
+                    'starts_with': str  # Optional, for string fields, case-sensitive prefix match
                 }
             q (str): Optional search string to match across searchable string columns
             joins (list): List of join dictionaries with structure:
@@ -145,14 +768,46 @@ class BaseModel(Base):
             secondary_models_map (dict): A map of secondary model classes
                 that are joined to the main model class, but needed for searching.
                 e.g. { 'role_details': GlobalRole }
+            pagination (dict): `page` and `page_size`. If `cursor` is
+                present, keyset pagination on (sort column, id) is used
+                instead of the page offset. An empty cursor starts from the
+                first page, and `next_cursor`/`has_more` are set in
+                `pagination` (with or without `details`). Only a column of
+                the main model can be the cursor sort, anything else raises
+                InvalidRequestData (400). `count_mode` picks how `total_items`
+                is computed (see `count_items`), and the mode that was
+                actually used is returned next to it.
+            projection (bool): Only with `details`. Select the readable
+                fields as plain columns and build the dicts straight from the
+                rows, skipping ORM entity loading. Falls back to loading
+                entities if a model has readable fields that aren't columns.
+            list_join_strategy (str): Only with `details`.
+                - window: outer join every list join to a row_number()
+                  subquery in the main query and de-duplicate the main items
+                  in Python
+                - select_in: fetch the page of main items first, then run
+                  one `WHERE fk IN (...)` query per list join
+                  (see `load_list_joins`)
             
         Returns:
             list: List of model instances or dictionaries if details=True
         """
 
         start_time = datetime.now()
+        metrics = get_current_metrics()
+
+        # List joins loaded after the main query with the select-in strategy
+        select_in_list_joins = []
+        if details and list_joins and list_join_strategy == 'select_in':
+            select_in_list_joins = list_joins
+            list_joins = []
 
         query = db_session.query(cls)
+
+        # Every entity added to the query in order, as (entity, model class).
+        # The entity is an alias for list joins. Used to build the
+        # projection columns.
+        selected_entities = [(cls, cls)]
         
         # Apply deleted_at filter
         query = query.filter(cls.deleted_at == None)
@@ -173,58 +828,17 @@ class BaseModel(Base):
                         model,
                         getattr(cls, column) == getattr(model, 'id'),
                     ).add_entity(model)
+                selected_entities.append((model, model))
 
-        if raw_filters:
-            query = query.filter(*raw_filters)
-
-        # Apply filters to the main model if provided
-        # print('filters', filters)
-        if not id and filters:
-            for filter_dict in filters:
-                field = filter_dict.get('field')
-                
-                column = getattr(filter_dict['model'], field)
-                
-                # Skip if column is not Integer, DateTime/Date, or String type
-                if not isinstance(
-                    column.type,
-                    (Integer, datetime, String),
-                ):
-                    continue
-                
-                # Apply filters
-                if 'lesser_than' in filter_dict:
-                    value = filter_dict['lesser_than']
-                    query = query.filter(column < value)
-                if 'greater_than' in filter_dict:
-                    value = filter_dict['greater_than']
-                    query = query.filter(column > value)
-                if 'equal_to' in filter_dict:
-                    value = filter_dict['equal_to']
-                    query = query.filter(column == value)
-                if 'contains' in filter_dict and isinstance(column.type, String):
-                    value = filter_dict['contains']
-                    query = query.filter(column.ilike(f'%{value}%'))
-
-        # Apply global search if provided
-        if not id and q and q.strip():
-            search_conditions = []
-            for field_text in cls.searchable_fields:
-                if '.' in field_text:
-                    as_, field = field_text.split('.')
-                    Model = secondary_models_map[as_]
-                else:
-                    Model = cls
-                    field = field_text
+        query, search_rank = cls.apply_filters(
+            db_session,
+            query,
+            filters=None if id else filters,
+            raw_filters=raw_filters,
+            q=None if id else q,
+            secondary_models_map=secondary_models_map,
+        )
 
-                column = getattr(Model, field)
-                if isinstance(column.type, String):
-                    search_conditions.append(column.ilike(f'%{q}%'))
-            
-            if search_conditions:
-                # Combine all conditions with OR
-                query = query.filter(or_(*search_conditions))
-        
         # Get the sort column and direction. Then the sorting will be
         # applied here once and then in in list joins. Because
         # without that, if sorting is specified via list_joins,
@@ -244,37 +858,111 @@ class BaseModel(Base):
                 sort_column = getattr(cls, 'id')
                 sort_column_reverse = False
 
-        if sort_column:
-            # Apply sorting
+        # Keyset pagination needs a unique position for every row, so the
+        # sort is always (sort column, id). Only columns of the main model
+        # can be used as the seek key.
+        is_cursor_mode = not id and pagination.get('cursor') is not None
+        cursor_order_by = []
+        if is_cursor_mode:
+            if sort_details and (
+                sort_details['model'] is not cls or
+                sort_details['field'] not in cls.__mapper__.columns
+            ):
+                raise InvalidRequestData(
+                    errors=[{
+                        'field': 'sort_by',
+                        'description': 'Cursor pagination can only sort by a column of the listed model',
+                    }],
+                    message='Unsupported sort for cursor pagination',
+                    http_status=400,
+                )
+            if sort_column is None:
+                sort_column = cls.id
+                sort_column_reverse = False
+            cursor_column = sort_column
+            cursor_reverse = sort_column_reverse
+            if cursor_reverse:
+                cursor_order_by.append(cursor_column.desc().nulls_first())
+            else:
+                cursor_order_by.append(cursor_column.asc().nulls_last())
+            if cursor_column.key != 'id':
+                cursor_order_by.append(cls.id.desc() if cursor_reverse else cls.id.asc())
+
+        main_order_by = []
+        if is_cursor_mode:
+            main_order_by = cursor_order_by
+        elif sort_column:
+            # Apply sorting. The id breaks ties so that rows with the same
+            # sort value can't move between OFFSET pages.
             if sort_column_reverse:
-                query = query.order_by(sort_column.desc())
+                main_order_by = [sort_column.desc(), cls.id.desc()]
             else:
-                query = query.order_by(sort_column.asc())
+                main_order_by = [sort_column.asc(), cls.id.asc()]
+        elif search_rank is not None:
+            # Best matches first when searching without an explicit sort
+            main_order_by = [search_rank.desc(), cls.id.asc()]
+        elif not id:
+            # OFFSET pages are only stable with a deterministic order
+            main_order_by = [cls.id.asc()]
+        query = query.order_by(*main_order_by)
         
         # Used to be returned inside the pagination dict
-        total_main_rows = query.count()
+        total_main_rows = None
+        count_mode = None
+        if not id:
+            is_filtered = bool(filters or raw_filters or (q and q.strip()))
+            count_start_time = time.perf_counter()
+            total_main_rows, count_mode = cls.count_items(
+                db_session,
+                query,
+                count_mode=pagination.get('count_mode', 'exact'),
+                cache_key=None if raw_filters else cls.get_count_cache_key(filters, q, joins),
+                is_filtered=is_filtered,
+            )
+            if metrics is not None:
+                metrics.count_time += (time.perf_counter() - count_start_time) * 1000
+
+        if is_cursor_mode and pagination['cursor']:
+            query = query.filter(cls.get_seek_condition(
+                cursor_column,
+                cursor_reverse,
+                pagination['cursor'],
+            ))
 
         if id:
             query = query.filter(cls.id == id)
         else:
             # Create subquery for limited main items if page_size is specified
             if pagination.get('page_size'):
-                # Calculate offset from page number (page 1 = offset 0)
-                page = pagination.get('page', 1)
-                offset = (page - 1) * pagination['page_size']
+                if is_cursor_mode:
+                    # The seek condition already skips the previous pages.
+                    # One extra row tells whether there is a next page.
+                    offset = 0
+                    limit = pagination['page_size'] + 1
+                else:
+                    # Calculate offset from page number (page 1 = offset 0)
+                    page = pagination.get('page', 1)
+                    offset = (page - 1) * pagination['page_size']
+                    limit = pagination['page_size']
                 
                 if joins:
                     # When joins are present, we need to create a subquery that only contains
                     # the main model's ID, then join back to the full query
                     main_ids_subquery = query.with_entities(cls.id).offset(offset).limit(
-                        pagination['page_size']
+                        limit
                     ).subquery()
                     query = query.join(main_ids_subquery, cls.id == main_ids_subquery.c.id)
                 else:
                     # When no joins, we can use the simpler approach
-                    subquery = query.offset(offset).limit(pagination['page_size']).subquery()
+                    subquery = query.offset(offset).limit(limit).subquery()
                     query = db_session.query(cls).join(subquery, cls.id == subquery.c.id)
 
+                    # The ordering inside the subquery doesn't carry over
+                    query = query.order_by(*main_order_by)
+
+        # Positions in `selected_entities` of each list join and of the
+        # joins of that list join
+        list_join_positions = []
         if list_joins:
             list_join_aliases = []  # Track the aliases we create
             for join in list_joins:
@@ -314,6 +1002,9 @@ class BaseModel(Base):
                     join_model_alias,
                     join_condition
                 ).add_entity(join_model_alias)
+                list_join_position = len(selected_entities)
+                selected_entities.append((join_model_alias, model))
+                join_of_list_join_positions = []
 
                 for join_of_list_join in join.get('joins', []):
                     # print('join_of_list_join', join_of_list_join)
@@ -328,6 +1019,10 @@ class BaseModel(Base):
                         model,
                         getattr(join_model_alias, column) == getattr(model, 'id')
                     ).add_entity(model)
+                    join_of_list_join_positions.append(len(selected_entities))
+                    selected_entities.append((model, join_of_list_join['model']))
+
+                list_join_positions.append((list_join_position, join_of_list_join_positions))
             
         # Apply list_joins sorting if specified. This sorting applies only
         # within the list and is applied after the main sorting.
@@ -355,15 +1050,34 @@ class BaseModel(Base):
         # print(str(query.statement.compile(compile_kwargs={"literal_binds": True})))
         # print('=============')
 
+        # Select plain columns instead of entities for the projection path.
+        # Every selected model needs all of its readable fields as columns.
+        projection_layouts = None
+        if details and projection:
+            columns, projection_layouts = cls.get_projection_columns(selected_entities)
+            if projection_layouts:
+                if is_cursor_mode:
+                    cursor_index = len(columns)
+                    columns.append(cursor_column.label('cursor_value'))
+                query = query.with_entities(*columns)
+
+        # print('=+=+=+=+=+=+=')
+        # print(str(query.statement.compile(compile_kwargs={"literal_binds": True})))
+        # print('=============')
+
         # Execute the query and measure performance
         items = query.all()
         # print('Items', items)
         execution_time = datetime.now() - start_time
         # print(f'Database query executed in {execution_time.total_seconds() * 1000:.0f} milliseconds')
+        record_rows_fetched(len(items))
 
         # print('Items', items)
 
         if details:
+            # DB time of the select-in loads is taken out of the serialization time
+            serialization_start_time = time.perf_counter()
+            serialization_start_db_time = metrics.db_time if metrics is not None else 0
             # unique_main_items: {
             #     id: main_item
             # }
@@ -372,67 +1086,167 @@ class BaseModel(Base):
             # will return multiple rows for the same item due to left
             # outer joins
             unique_main_items = {}
-            for item_or_tuple in items:
-                if not joins and not list_joins:
-                    item = item_or_tuple
-                    unique_main_items[item.id] = item.to_dict()
-                else:
-                    main_item = item_or_tuple[0]
-                    joined_items = item_or_tuple[1:(len(joins) + 1)]
-                    list_joined_items = item_or_tuple[(len(joins) + 1):]
-
-                    item_dict = main_item.to_dict()
-                    if main_item.id not in unique_main_items:
-                        unique_main_items[main_item.id] = item_dict
-
-                    if joins:
-                        for i, joined_model in enumerate(joins):
-                            # Since the first item is the main item
-                            joined_item = joined_items[i]
-                            as_key = joined_model['as_']
-                            joined_item_details = joined_item.to_dict() if joined_item else None
-                            unique_main_items[main_item.id][as_key] = joined_item_details
-
-                    if list_joins:
-                        for i, list_join in enumerate(list_joins):
-                            list_joined_item = list_joined_items[i]
-
-                            as_key = list_join['as_']
-                            if as_key not in unique_main_items[main_item.id]:
-                                unique_main_items[main_item.id][as_key] = []
+
+            # Sort column value of each main item, for the next cursor
+            cursor_values = {}
+
+            if projection_layouts:
+                main_layout = projection_layouts[0]
+                for row in items:
+                    id_main_item = row[main_layout[0]]
+                    item_dict = unique_main_items.get(id_main_item)
+                    if item_dict is None:
+                        item_dict = cls.row_to_dict(row, main_layout)
+                        unique_main_items[id_main_item] = item_dict
+                        for i, join in enumerate(joins):
+                            # Since the first entity is the main item
+                            item_dict[join['as_']] = cls.row_to_dict(row, projection_layouts[i + 1])
+                        for list_join in list_joins:
+                            item_dict[list_join['as_']] = []
+                        if is_cursor_mode:
+                            cursor_values[id_main_item] = row[cursor_index]
+
+                    for list_join, (list_join_position, join_of_list_join_positions) in zip(
+                        list_joins,
+                        list_join_positions,
+                    ):
+                        list_joined_item_details = cls.row_to_dict(row, projection_layouts[list_join_position])
+                        if list_joined_item_details is None:
+                            continue
+
+                        for join_of_list_join, position in zip(
+                            list_join.get('joins', []),
+                            join_of_list_join_positions,
+                        ):
+                            list_joined_item_details[join_of_list_join['as_']] = cls.row_to_dict(
+                                row,
+                                projection_layouts[position],
+                            )
+                        item_dict[list_join['as_']].append(list_joined_item_details)
+            else:
+                for item_or_tuple in items:
+                    if not joins and not list_joins:
+                        item = item_or_tuple
+                        unique_main_items[item.id] = item.to_dict()
+                    else:
+                        main_item = item_or_tuple[0]
+                        joined_items = item_or_tuple[1:(len(joins) + 1)]
+                        list_joined_items = item_or_tuple[(len(joins) + 1):]
+
+                        item_dict = main_item.to_dict()
+                        if main_item.id not in unique_main_items:
+                            unique_main_items[main_item.id] = item_dict
+
+                        if joins:
+                            for i, joined_model in enumerate(joins):
+                                # Since the first item is the main item
+                                joined_item = joined_items[i]
+                                as_key = joined_model['as_']
+                                joined_item_details = joined_item.to_dict() if joined_item else None
+                                unique_main_items[main_item.id][as_key] = joined_item_details
+
+                        if list_joins:
+                            for i, list_join in enumerate(list_joins):
+                                list_joined_item = list_joined_items[i]
+
+                                as_key = list_join['as_']
+                                if as_key not in unique_main_items[main_item.id]:
+                                    unique_main_items[main_item.id][as_key] = []
 
                             
-                            if list_joined_item is not None:
-                                list_joined_item_details = list_joined_item.to_dict()
-
-                                # Getting the item that is joined with the item
-                                # of the list join
-                                joins_of_list_join = list_join.get('joins', [])
-                                index = 1
-                                for join_of_list_join in joins_of_list_join:
-                                    joined_item_of_list_joined_item = list_joined_items[i + index]
-                                    if joined_item_of_list_joined_item:
-                                        joined_item_of_list_joined_item_details = joined_item_of_list_joined_item.to_dict()
-                                    else:
-                                        joined_item_of_list_joined_item_details = None
-
-                                    list_joined_item_details[join_of_list_join['as_']] = joined_item_of_list_joined_item_details
-                                    index += 1
-
-                                unique_main_items[main_item.id][as_key].append(
-                                    list_joined_item_details
-                                )
+                                if list_joined_item is not None:
+                                    list_joined_item_details = list_joined_item.to_dict()
+
+                                    # Getting the item that is joined with the item
+                                    # of the list join
+                                    joins_of_list_join = list_join.get('joins', [])
+                                    index = 1
+                                    for join_of_list_join in joins_of_list_join:
+                                        joined_item_of_list_joined_item = list_joined_items[i + index]
+                                        if joined_item_of_list_joined_item:
+                                            joined_item_of_list_joined_item_details = joined_item_of_list_joined_item.to_dict()
+                                        else:
+                                            joined_item_of_list_joined_item_details = None
+
+                                        list_joined_item_details[join_of_list_join['as_']] = joined_item_of_list_joined_item_details
+                                        index += 1
+
+                                    unique_main_items[main_item.id][as_key].append(
+                                        list_joined_item_details
+                                    )
                 
+            if select_in_list_joins:
+                cls.load_list_joins(
+                    db_session,
+                    unique_main_items,
+                    select_in_list_joins,
+                    projection=projection,
+                )
+
             item_dicts = list(unique_main_items.values())
+            if metrics is not None:
+                metrics.serialization_time += (
+                    (time.perf_counter() - serialization_start_time) * 1000
+                    - (metrics.db_time - serialization_start_db_time)
+                )
             if id:
+                if metrics is not None:
+                    metrics.rows_returned += 1 if item_dicts else 0
                 return item_dicts[0] if item_dicts else None
+            if is_cursor_mode:
+                pagination['has_more'] = False
+                pagination['next_cursor'] = None
+                page_size = pagination.get('page_size')
+                if page_size and len(item_dicts) > page_size:
+                    item_dicts = item_dicts[:page_size]
+
+                    last_id = list(unique_main_items)[page_size - 1]
+                    if last_id in cursor_values:
+                        cursor_value = cursor_values[last_id]
+                    else:
+                        # The sort column doesn't have to be a readable field,
+                        # so the cursor is read from the (already loaded) entity
+                        cursor_value = getattr(db_session.get(cls, last_id), cursor_column.key)
+                    pagination['has_more'] = True
+                    pagination['next_cursor'] = encode_cursor(
+                        cursor_column.key,
+                        cursor_reverse,
+                        cursor_value,
+                        last_id,
+                    )
+            if metrics is not None:
+                metrics.rows_returned += len(item_dicts)
             if pagination:
                 pagination['returned_items'] = len(item_dicts)
                 pagination['total_items'] = total_main_rows
+                pagination['count_mode'] = count_mode
             return item_dicts, pagination
 
         if id:
             return items[0] if items else None
+        if is_cursor_mode:
+            # The rows are the main items, or tuples starting with them (with
+            # several rows per main item for the list joins)
+            get_main_item = (lambda item: item[0]) if joins or list_joins else (lambda item: item)
+            main_items = {}
+            for item in items:
+                main_item = get_main_item(item)
+                main_items.setdefault(main_item.id, main_item)
+            pagination['has_more'] = False
+            pagination['next_cursor'] = None
+            page_size = pagination.get('page_size')
+            if page_size and len(main_items) > page_size:
+                page_ids = list(main_items)[:page_size]
+                last_item = main_items[page_ids[-1]]
+                pagination['has_more'] = True
+                pagination['next_cursor'] = encode_cursor(
+                    cursor_column.key,
+                    cursor_reverse,
+                    getattr(last_item, cursor_column.key),
+                    last_item.id,
+                )
+                page_ids = set(page_ids)
+                items = [item for item in items if get_main_item(item).id in page_ids]
         return items
 
 
@@ -467,3 +1281,16 @@ def _set_default_is_initializable(mapper, cls):
             continue
         info['is_initializable'] = bool(info.get('is_editable', False))
 
+
+
+@event.listens_for(BaseModel, 'instrument_class', propagate=True)
+def _declare_metadata_indexes(mapper, cls):
+    """
+    Attach the indexes derived from the column metadata to the table, so
+    that `create_all()` creates them. See backend/indexes.py for the rules.
+    """
+
+    table = getattr(cls, '__table__', None)
+    if table is None:
+        return
+    declare_metadata_indexes(table)
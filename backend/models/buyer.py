@@ -34,6 +34,7 @@ class Buyer(CommonColumnsMixin, BaseModel):
         'is_searchable': True,
         'is_sortable': True,
         'is_filterable': True,
+        'is_prefix_indexed': True,
         'max_length': 255,
     })
     user_status: Mapped[str] = mc(String(20), default='ACTIVE', info={
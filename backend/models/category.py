@@ -120,3 +120,5 @@ class Category(CommonColumnsMixin, BaseModel):
         'id_data_type',
         'status',
     ]
+
+    response_cache_ttl = 300
@@ -93,3 +93,5 @@ class Country(CommonColumnsMixin, BaseModel):
         'code',
         'id_icon',
     ]
+
+    response_cache_ttl = 300
@@ -79,4 +79,6 @@ class DataType(CommonColumnsMixin, BaseModel):
         'last_updated_at',
         'name',
         'status',
-    ]
\ No newline at end of file
+    ]
+
+    response_cache_ttl = 300
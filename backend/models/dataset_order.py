@@ -30,6 +30,7 @@ class DatasetOrder(CommonColumnsMixin, BaseModel):
     _info = {
         'description': 'Tracks dataset purchases and downstream operational status.',
         'type': 'transactional',
+        'search': {'backend': 'trigram'},
     }
 
     order_code: Mapped[str] = mc(
@@ -47,6 +48,7 @@ class DatasetOrder(CommonColumnsMixin, BaseModel):
             'is_searchable': True,
             'is_sortable': True,
             'is_filterable': True,
+            'is_prefix_indexed': True,
             'max_length': 30,
         },
     )
@@ -246,6 +248,7 @@ class DatasetOrder(CommonColumnsMixin, BaseModel):
             'is_searchable': True,
             'is_sortable': True,
             'is_filterable': True,
+            'is_indexed': True,
             'display_settings': {
                 'options': [
                     {'value': status.value, 'label': status.name.replace('_', ' ').title()}
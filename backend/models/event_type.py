@@ -92,3 +92,5 @@ class EventType(CommonColumnsMixin, BaseModel):
         'token',
         'name',
     ]
+
+    response_cache_ttl = 300
@@ -30,6 +30,7 @@ class LiveLeadOrder(CommonColumnsMixin, BaseModel):
     _info = {
         'description': 'Tracks live lead purchase agreements, delivery progress, and API connectivity.',
         'type': 'transactional',
+        'search': {'backend': 'trigram'},
         'api': {
             'is_enabled': True,
             'class_name': 'LiveLeadOrder',
@@ -57,6 +58,7 @@ class LiveLeadOrder(CommonColumnsMixin, BaseModel):
             'is_searchable': True,
             'is_sortable': True,
             'is_filterable': True,
+            'is_prefix_indexed': True,
         },
     )
 
@@ -300,6 +302,7 @@ class LiveLeadOrder(CommonColumnsMixin, BaseModel):
             'is_searchable': True,
             'is_sortable': True,
             'is_filterable': True,
+            'is_indexed': True,
             'display_settings': {
                 'options': [
                     {'value': status.value, 'label': status.name.replace('_', ' ').title()}
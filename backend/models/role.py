@@ -65,3 +65,5 @@ class Role(CommonColumnsMixin, BaseModel):
         'id',
         'name',
     ]
+
+    response_cache_ttl = 300
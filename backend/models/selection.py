@@ -167,3 +167,5 @@ class Selection(CommonColumnsMixin, BaseModel):
         'selection_id',
         'status',
     ]
+
+    response_cache_ttl = 300
@@ -53,6 +53,7 @@ class Seller(CommonColumnsMixin, BaseModel):
         'is_searchable': True,
         'is_sortable': True,
         'is_filterable': True,
+        'is_prefix_indexed': True,
         'max_length': 255,
     })
 
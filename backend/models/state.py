@@ -78,3 +78,5 @@ class State(CommonColumnsMixin, BaseModel):
         'code',
         'id_country',
     ]
+
+    response_cache_ttl = 300
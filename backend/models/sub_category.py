@@ -135,3 +135,5 @@ class SubCategory(CommonColumnsMixin, BaseModel):
         'id_data_type',
         'status',
     ]
+
+    response_cache_ttl = 300
@@ -8,6 +8,10 @@ from backend.models.mixins import CommonColumnsMixin
 class Transaction(CommonColumnsMixin, BaseModel):
     __tablename__ = 'transactions'
 
+    _info = {
+        'search': {'backend': 'trigram'},
+    }
+
     id_transaction: Mapped[str] = mc(String(255), nullable=False, info={
         'name': 'id_transaction',
         'display_name': 'Transaction ID',
@@ -154,6 +158,7 @@ class Transaction(CommonColumnsMixin, BaseModel):
         'is_searchable': True,
         'is_sortable': True,
         'is_filterable': True,
+        'is_indexed': True,
     })
     portal: Mapped[str] = mc(String(20), nullable=False, info={
         'name': 'portal',
@@ -1,12 +1,36 @@
+import os
+
 from pydantic import BaseModel, Field
 
 
+# Most items accepted by one bulk request
+BULK_MAX_ITEMS = int(os.getenv('BULK_MAX_ITEMS', '5000'))
+
+
 # Common Pydantic Types
 class PaginationParams(BaseModel):
     page: int = Field(1, gt=0, description='Page number')
     page_size: int = Field(100, gt=0, description='Number of items per page')
 
 
+class BulkItemsRequest(BaseModel):
+    items: list[dict] = Field(
+        ...,
+        min_length=1,
+        max_length=BULK_MAX_ITEMS,
+        description='Items to write. Each one is validated on its own.',
+    )
+
+
+class BulkDeleteRequest(BaseModel):
+    ids: list[int] = Field(
+        ...,
+        min_length=1,
+        max_length=BULK_MAX_ITEMS,
+        description='IDs of the items to delete',
+    )
+
+
 class TaskProgressUpdateSubModel(BaseModel):
     type: str = Field(..., description='Type of update (e.g., "task_progress")')
     status: str = Field(..., description='Current status (e.g., "processing", "completed", "failed")')
@@ -0,0 +1,248 @@
+"""
+Cache of the serialized responses of the generated `get_one` and `get_all`
+routes, for the read-mostly models (countries, categories, roles...).
+
+A model opts in with a `response_cache_ttl` (seconds) class attribute. The
+key of an entry is the model, the route and the normalized parsed params,
+plus the current generation of the model and of every model it joins.
+Committing a write to a model bumps its generation, so the entries that
+read it are never served again and expire on their own. The writes are
+caught with session events, whether they go through the unit of work
+(`after_flush`) or are ORM-enabled INSERT/UPDATE/DELETE statements like the
+ones of `DynamicActions` (`do_orm_execute`).
+
+RESPONSE_CACHE_BACKEND selects where the entries live:
+
+- memory (default): a `TTLCache` per worker. A write only invalidates the
+  entries of the worker that made it, the others keep serving the old
+  responses for up to the `response_cache_ttl` of the model.
+- redis: shared by all workers, generations included, so a write
+  invalidates everywhere. Needs the `redis` package and REDIS_URL.
+- none: disabled.
+"""
+
+import os
+import hashlib
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+
+from backend.helpers import TTLCache
+
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_BACKEND = os.getenv('RESPONSE_CACHE_BACKEND', 'memory')
+RESPONSE_CACHE_MAX_SIZE = int(os.getenv('RESPONSE_CACHE_MAX_SIZE', '1024'))
+# Bigger responses (e.g. large pages) aren't worth the memory
+RESPONSE_CACHE_MAX_ITEM_SIZE = int(os.getenv('RESPONSE_CACHE_MAX_ITEM_SIZE', str(1024 * 1024)))
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+
+
+class MemoryCacheBackend:
+    is_remote = False
+
+    def __init__(self, max_size=1024):
+        self._items = TTLCache(max_size=max_size)
+        self._generations = {}
+
+    def get(self, key):
+        return self._items.get(key)
+
+    def set(self, key, value, ttl):
+        self._items.set(key, value, ttl=ttl)
+
+    def get_generations(self, namespaces):
+        return [self._generations.get(namespace, 0) for namespace in namespaces]
+
+    def bump_generation(self, namespace):
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+    def clear(self):
+        self._items.clear()
+
+
+class RedisCacheBackend:
+    is_remote = True
+
+    def __init__(self, url):
+        # Optional dependency, only needed with RESPONSE_CACHE_BACKEND=redis
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key):
+        return self._client.get(f'response_cache:{key}')
+
+    def set(self, key, value, ttl):
+        self._client.set(f'response_cache:{key}', value, ex=max(1, int(ttl)))
+
+    def get_generations(self, namespaces):
+        values = self._client.mget([f'response_cache_generation:{namespace}' for namespace in namespaces])
+        return [int(value or 0) for value in values]
+
+    def bump_generation(self, namespace):
+        self._client.incr(f'response_cache_generation:{namespace}')
+
+    def clear(self):
+        for key in self._client.scan_iter('response_cache:*'):
+            self._client.delete(key)
+
+
+class ResponseCache:
+    """
+    Serialized responses with their ETag. An entry is stored as
+    `<etag>\\n<body>` so that both backends only deal with bytes.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def is_enabled(self, model_class):
+        return self.backend is not None and bool(getattr(model_class, 'response_cache_ttl', None))
+
+    def get_key(self, model_class, route_type, params, joined_models=()):
+        """
+        Key of a response.
+
+        Args:
+            model_class: The model of the route
+            route_type (str): 'get_one' or 'get_all'
+            params: Hashable, normalized params of the request (e.g. the
+            id, or the filters, sort and pagination)
+            joined_models: Models whose rows are part of the response
+
+        Returns:
+            str
+        """
+
+        namespaces = [model_class.__tablename__, *sorted({
+            joined_model.__tablename__ for joined_model in joined_models
+        })]
+        generations = self.backend.get_generations(namespaces)
+        digest = hashlib.sha1(repr(params).encode()).hexdigest()
+        return f'{model_class.__tablename__}:{route_type}:{"-".join(map(str, generations))}:{digest}'
+
+    def get(self, key):
+        """
+        Returns:
+            tuple | None: (body, etag) of the cached response
+        """
+
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        etag, _, body = value.partition(b'\n')
+        return body, etag.decode()
+
+    def set(self, key, body, etag, ttl):
+        if len(body) > RESPONSE_CACHE_MAX_ITEM_SIZE:
+            return
+        self.backend.set(key, etag.encode() + b'\n' + body, ttl)
+
+    async def get_key_async(self, *args, **kwargs):
+        if self.backend.is_remote:
+            return await run_in_threadpool(self.get_key, *args, **kwargs)
+        return self.get_key(*args, **kwargs)
+
+    async def get_async(self, key):
+        if self.backend.is_remote:
+            return await run_in_threadpool(self.get, key)
+        return self.get(key)
+
+    async def set_async(self, key, body, etag, ttl):
+        if self.backend.is_remote:
+            return await run_in_threadpool(self.set, key, body, etag, ttl)
+        return self.set(key, body, etag, ttl)
+
+    def invalidate(self, table_names):
+        """
+        Make every cached response that read one of these tables stale.
+        """
+
+        if self.backend is None:
+            return
+        for table_name in table_names:
+            try:
+                self.backend.bump_generation(table_name)
+                self.invalidations += 1
+            except Exception as e:
+                logger.warning(f'Could not invalidate the response cache of {table_name}: {e}')
+
+    def clear(self):
+        if self.backend is not None:
+            self.backend.clear()
+
+    def stats(self):
+        return {
+            'backend': RESPONSE_CACHE_BACKEND,
+            'hits': self.hits,
+            'misses': self.misses,
+            'invalidations': self.invalidations,
+        }
+
+
+def get_response_cache_backend(name):
+    if name == 'memory':
+        return MemoryCacheBackend(max_size=RESPONSE_CACHE_MAX_SIZE)
+    if name == 'redis':
+        try:
+            return RedisCacheBackend(REDIS_URL)
+        except ImportError:
+            logger.warning('RESPONSE_CACHE_BACKEND=redis needs the redis package, the response cache is disabled')
+            return None
+    return None
+
+
+response_cache = ResponseCache(get_response_cache_backend(RESPONSE_CACHE_BACKEND))
+
+
+def _mark_changed(session, table_names):
+    session.info.setdefault('response_cache_changed_tables', set()).update(table_names)
+
+
+@event.listens_for(Session, 'after_flush')
+def _record_flushed_tables(session, flush_context):
+    table_names = {
+        instance.__table__.name
+        for instance in (*session.new, *session.dirty, *session.deleted)
+        if hasattr(instance, '__table__')
+    }
+    if table_names:
+        _mark_changed(session, table_names)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _record_statement_tables(orm_execute_state):
+    is_write = orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete
+    mapper = orm_execute_state.bind_mapper
+    if is_write and mapper is not None:
+        _mark_changed(orm_execute_state.session, {mapper.local_table.name})
+
+
+# after_commit and after_rollback also fire when a savepoint is released or
+# rolled back (e.g. the per-row savepoints of the bulk routes). Only the end
+# of the outermost transaction counts: the rows aren't visible to the other
+# sessions before its COMMIT, and a failed savepoint doesn't undo the writes
+# made before it.
+@event.listens_for(Session, 'after_commit')
+def _invalidate_committed_tables(session):
+    if session.in_nested_transaction():
+        return
+    table_names = session.info.pop('response_cache_changed_tables', None)
+    if table_names:
+        response_cache.invalidate(table_names)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _forget_rolled_back_tables(session):
+    if session.in_nested_transaction():
+        return
+    session.info.pop('response_cache_changed_tables', None)
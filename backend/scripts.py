@@ -1,18 +1,59 @@
 import os
 import re
 import sys
-import json
 import click
 import inspect
+import importlib.util
 import pandas as pd
 import time
 
+from contextlib import ExitStack
+from functools import partial
 from datetime import datetime, timedelta, time as time_of_day
 import bcrypt
 from sqlalchemy import inspect as sa_inspect, select, delete, text
 
 from backend.database import engine, SessionLocal, Base
+from backend.bulk_load import (
+    FALSE_VALUES,
+    SEED_CSV_DIR,
+    SEED_LOAD_WORKERS,
+    bulk_insert,
+    bulk_loader,
+    fill_missing,
+    get_csv_column,
+    get_csv_hashes,
+    get_csv_path,
+    get_dependent_loaders,
+    get_referencing_tables,
+    get_schema_hash,
+    hash_file,
+    insert_frame,
+    map_columns,
+    map_ids,
+    print_load_summary,
+    read_seed_csv,
+    read_seed_hashes,
+    run_loaders,
+    skip_existing,
+    skip_invalid_ids,
+    skip_rows,
+    strip_strings,
+    to_bool,
+    to_choice,
+    to_date,
+    to_datetime,
+    to_float,
+    to_int,
+    to_json,
+    to_str,
+    to_upper,
+    truncate_tables,
+    write_seed_hashes,
+)
 from backend.helpers import unflatten_json, camel_case_to_words, to_snake_case
+from backend.search import create_search_indexes, create_search_extensions
+from backend.meta.route_registry import build_route_registry, write_route_registry
 from backend.models import *
 
 # Using bcrypt directly for password hashing
@@ -153,6 +194,27 @@ def extract_field_metadata_from_sqlalchemy(model_class, field_name):
         return {}
 
 
+def get_indexed_column_names(inspector, table_name):
+    """
+    Names of the columns that can be looked up through an index of the
+    table, i.e. the leading column of the primary key, a unique constraint
+    or an index.
+    """
+
+    column_name_lists = [
+        inspector.get_pk_constraint(table_name).get('constrained_columns') or [],
+    ]
+    for constraint in inspector.get_unique_constraints(table_name) + inspector.get_indexes(table_name):
+        column_name_lists.append(constraint.get('column_names') or [])
+
+    # Expression indexes have None in place of the column name
+    return {
+        column_names[0]
+        for column_names in column_name_lists
+        if column_names and column_names[0]
+    }
+
+
 def populate_metadata_tables():
     """Automatically populate metadata tables based on all existing models"""
     
@@ -235,11 +297,12 @@ def populate_metadata_tables():
             if not metadata_object:
                 continue
             
-            # Get table columns
+            # Get table columns, and the columns that lead an index
             try:
                 inspector = sa_inspect(engine)
                 table_name = model_class.__tablename__
                 columns = inspector.get_columns(table_name)
+                indexed_column_names = get_indexed_column_names(inspector, table_name)
             except Exception as e:
                 print(f"Warning: Could not inspect table {table_name} for {class_name}: {e}")
                 continue
@@ -334,7 +397,7 @@ def populate_metadata_tables():
                     is_nullable=is_nullable,
                     is_primary_key=is_primary_key,
                     is_unique=is_unique,
-                    is_indexed=False,  # Would need to check indexes separately
+                    is_indexed=column_name in indexed_column_names,
                     is_visible=is_visible,
                     is_initializable=is_initializable,
                     is_editable=is_editable,
@@ -440,18 +503,36 @@ def populate_metadata_tables():
         db_session.close()
 
 
+def compile_route_registry():
+    """
+    Write the metadata the API generates its routes from to the route
+    registry file (see backend/meta/route_registry.py).
+    """
+
+    db_session = SessionLocal()
+    try:
+        registry = build_route_registry(db_session)
+    finally:
+        db_session.close()
+
+    path = write_route_registry(registry)
+    print(
+        f'Compiled {len(registry["objects"])} metadata objects and '
+        f'{len(registry["relationships"])} relationships to {path} '
+        f'(version {registry["metadata_version"][:12]})'
+    )
 
 
+@bulk_loader(StatsLayout, 'stats layouts', csv_files=())
 def load_stats_layouts():
     """Seed default stats layout ordering for key dashboards."""
 
-    print('Loading stats layouts...')
     db_session = SessionLocal()
     try:
         user_id_row = db_session.query(User.id).order_by(User.id).first()
         if not user_id_row:
             print('No users found; skipping stats layout seed')
-            return
+            return None
         user_id = user_id_row[0]
 
         defaults = [
@@ -485,246 +566,123 @@ def load_stats_layouts():
 
         if created:
             db_session.commit()
-            print(f'Inserted {created} stats layouts for user {user_id}')
         else:
             print(f'Stats layouts already present for user {user_id}, skipping')
+        return created
     finally:
         db_session.close()
 
+@bulk_loader(LeadDeliveryTrendReport, 'lead delivery trend reports')
 def load_lead_delivery_trend_reports():
-    column_mapping = {
+    df = read_seed_csv('lead_delivery_trend_reports.csv', 'lead delivery trend reports')
+    if df is None:
+        return None
+
+    # Convert display names to snake_case constants
+    metric_mapping = {
+        'Delivered': 'delivered',
+        'Accepted': 'accepted',
+        'Rejected': 'rejected',
+    }
+
+    def to_metric_type(values):
+        return values.map(metric_mapping).where(
+            values.isin(list(metric_mapping)),
+            values.astype(str).str.lower().str.replace(' ', '_', regex=False),
+        )
+
+    frame = map_columns(LeadDeliveryTrendReport, df, {
         'Date': 'date',
         'Metric Type': 'metric_type',
         'Count': 'count',
         'Seller ID': 'id_seller',
-    }
-
-    csv_path = 'data/csv/lead_delivery_trend_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping lead delivery trend reports load")
-        return
+    }, {
+        'date': to_date,
+        'metric_type': to_metric_type,
+        'count': partial(to_int, default=0),
+        'id_seller': to_int,
+    })
+    return insert_frame(LeadDeliveryTrendReport, frame)
 
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping lead delivery trend reports load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading lead delivery trend reports", "reports")
-
-            lead_delivery_trend_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle date fields
-                    if db_column == 'date':
-                        try:
-                            lead_delivery_trend_report_data[db_column] = pd.to_datetime(value).date()
-                        except:
-                            lead_delivery_trend_report_data[db_column] = None
-                    # Handle count (integer)
-                    elif db_column == 'count':
-                        try:
-                            lead_delivery_trend_report_data[db_column] = int(value)
-                        except:
-                            lead_delivery_trend_report_data[db_column] = 0
-                    # Handle seller ID (nullable integer)
-                    elif db_column == 'id_seller':
-                        try:
-                            lead_delivery_trend_report_data[db_column] = int(value) if value else None
-                        except:
-                            lead_delivery_trend_report_data[db_column] = None
-                    # Handle metric type (convert to snake_case for constants)
-                    elif db_column == 'metric_type':
-                        # Convert display names to snake_case constants
-                        metric_mapping = {
-                            'Delivered': 'delivered',
-                            'Accepted': 'accepted',
-                            'Rejected': 'rejected',
-                        }
-                        lead_delivery_trend_report_data[db_column] = metric_mapping.get(value, str(value).lower().replace(' ', '_'))
-                    else:
-                        lead_delivery_trend_report_data[db_column] = value
-
-            lead_delivery_trend_report = LeadDeliveryTrendReport(**lead_delivery_trend_report_data)
-            db_session.add(lead_delivery_trend_report)
 
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} lead delivery trend reports into the database")
-    finally:
-        db_session.close()
+@bulk_loader(TopCategoriesByPurchaseReport, 'top categories by purchase reports')
+def load_top_categories_by_purchase_reports():
+    df = read_seed_csv('top_categories_by_purchase_reports.csv', 'top categories by purchase reports')
+    if df is None:
+        return None
+
+    # Convert display names to snake_case constants
+    category_mapping = {
+        'Energy & Utilities': 'energy_utilities',
+        'Advertising Data': 'advertising_data',
+        'Financial & Insurance': 'financial_insurance',
+        'Home Improvements': 'home_improvements',
+        'Residential Data': 'residential_data',
+    }
 
+    def to_category(values):
+        return values.map(category_mapping).where(
+            values.isin(list(category_mapping)),
+            values.astype(str).str.lower()
+            .str.replace(' ', '_', regex=False)
+            .str.replace('&', '', regex=False)
+            .str.replace('__', '_', regex=False),
+        )
 
-def load_top_categories_by_purchase_reports():
-    column_mapping = {
+    frame = map_columns(TopCategoriesByPurchaseReport, df, {
         'Category': 'category',
         'Purchase Count': 'purchase_count',
         'Seller ID': 'id_seller',
-    }
-
-    csv_path = 'data/csv/top_categories_by_purchase_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping top categories by purchase reports load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping top categories by purchase reports load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading top categories by purchase reports", "reports")
-
-            top_categories_by_purchase_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle purchase count (integer)
-                    if db_column == 'purchase_count':
-                        try:
-                            top_categories_by_purchase_report_data[db_column] = int(value)
-                        except:
-                            top_categories_by_purchase_report_data[db_column] = 0
-                    # Handle seller ID (nullable integer)
-                    elif db_column == 'id_seller':
-                        try:
-                            top_categories_by_purchase_report_data[db_column] = int(value) if value else None
-                        except:
-                            top_categories_by_purchase_report_data[db_column] = None
-                    # Handle category (convert to snake_case for constants)
-                    elif db_column == 'category':
-                        # Convert display names to snake_case constants
-                        category_mapping = {
-                            'Energy & Utilities': 'energy_utilities',
-                            'Advertising Data': 'advertising_data',
-                            'Financial & Insurance': 'financial_insurance',
-                            'Home Improvements': 'home_improvements',
-                            'Residential Data': 'residential_data',
-                        }
-                        top_categories_by_purchase_report_data[db_column] = category_mapping.get(value, str(value).lower().replace(' ', '_').replace('&', '').replace('__', '_'))
-                    else:
-                        top_categories_by_purchase_report_data[db_column] = value
-
-            top_categories_by_purchase_report = TopCategoriesByPurchaseReport(**top_categories_by_purchase_report_data)
-            db_session.add(top_categories_by_purchase_report)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} top categories by purchase reports into the database")
-    finally:
-        db_session.close()
+    }, {
+        'category': to_category,
+        'purchase_count': partial(to_int, default=0),
+        'id_seller': to_int,
+    })
+    return insert_frame(TopCategoriesByPurchaseReport, frame)
 
 
+@bulk_loader(DisputeInsightsReport, 'dispute insights reports')
 def load_dispute_insights_reports():
-    column_mapping = {
+    df = read_seed_csv('dispute_insights_reports.csv', 'dispute insights reports')
+    if df is None:
+        return None
+
+    frame = map_columns(DisputeInsightsReport, df, {
         'Metric Type': 'metric_type',
         'Metric Category': 'metric_category',
         'Count': 'count',
         'Seller ID': 'id_seller',
-    }
-
-    csv_path = 'data/csv/dispute_insights_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping dispute insights reports load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping dispute insights reports load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading dispute insights reports", "reports")
-
-            dispute_insights_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle integer fields
-                    if db_column == 'count':
-                        try:
-                            dispute_insights_report_data[db_column] = int(value)
-                        except:
-                            dispute_insights_report_data[db_column] = 0
-                    # Handle seller ID (nullable)
-                    elif db_column == 'id_seller':
-                        try:
-                            dispute_insights_report_data[db_column] = int(value) if value else None
-                        except:
-                            dispute_insights_report_data[db_column] = None
-                    else:
-                        dispute_insights_report_data[db_column] = value
-
-            dispute_insights_report = DisputeInsightsReport(**dispute_insights_report_data)
-            db_session.add(dispute_insights_report)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} dispute insights reports into the database")
-    finally:
-        db_session.close()
+    }, {
+        'count': partial(to_int, default=0),
+        'id_seller': to_int,
+    })
+    return insert_frame(DisputeInsightsReport, frame)
 
 
+@bulk_loader(TopDisputeReasonsReport, 'top dispute reasons reports')
 def load_top_dispute_reasons_reports():
-    column_mapping = {
+    df = read_seed_csv('top_dispute_reasons_reports.csv', 'top dispute reasons reports')
+    if df is None:
+        return None
+
+    frame = map_columns(TopDisputeReasonsReport, df, {
         'Reason': 'reason',
         'Purchase Count': 'purchase_count',
         'Seller ID': 'id_seller',
-    }
-
-    csv_path = 'data/csv/top_dispute_reasons_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping top dispute reasons reports load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping top dispute reasons reports load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading top dispute reasons reports", "reports")
-
-            top_dispute_reasons_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle integer fields
-                    if db_column == 'purchase_count':
-                        try:
-                            top_dispute_reasons_report_data[db_column] = int(value)
-                        except:
-                            top_dispute_reasons_report_data[db_column] = 0
-                    # Handle seller ID (nullable)
-                    elif db_column == 'id_seller':
-                        try:
-                            top_dispute_reasons_report_data[db_column] = int(value) if value else None
-                        except:
-                            top_dispute_reasons_report_data[db_column] = None
-                    else:
-                        top_dispute_reasons_report_data[db_column] = value
-
-            top_dispute_reasons_report = TopDisputeReasonsReport(**top_dispute_reasons_report_data)
-            db_session.add(top_dispute_reasons_report)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} top dispute reasons reports into the database")
-    finally:
-        db_session.close()
+    }, {
+        'purchase_count': partial(to_int, default=0),
+        'id_seller': to_int,
+    })
+    return insert_frame(TopDisputeReasonsReport, frame)
 
 
+@bulk_loader(ApiUsageReport, 'API usage reports')
 def load_api_usage_reports():
-    column_mapping = {
+    df = read_seed_csv('api_usage_reports.csv', 'API usage reports')
+    if df is None:
+        return None
+
+    frame = map_columns(ApiUsageReport, df, {
         'ID User': 'id_user',
         'User Name': 'user_name',
         'User Email': 'user_email',
@@ -734,56 +692,22 @@ def load_api_usage_reports():
         'Success Rate(%)': 'success_rate',
         'Most Common Error': 'most_common_error',
         'Status': 'status',
-    }
-
-    csv_path = 'data/csv/api_usage_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping API usage reports load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping API usage reports load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading API usage reports", "reports")
-
-            api_usage_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle integer fields
-                    if db_column in ['total_api_calls', 'successful_calls', 'failed_calls']:
-                        try:
-                            api_usage_report_data[db_column] = int(value)
-                        except:
-                            api_usage_report_data[db_column] = 0
-                    # Handle percentage field
-                    elif db_column == 'success_rate':
-                        try:
-                            # Remove percentage symbol if present
-                            clean_value = str(value).replace('%', '').strip()
-                            api_usage_report_data[db_column] = float(clean_value)
-                        except:
-                            api_usage_report_data[db_column] = 0.00
-                    else:
-                        api_usage_report_data[db_column] = value
-
-            api_usage_report = ApiUsageReport(**api_usage_report_data)
-            db_session.add(api_usage_report)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} API usage reports into the database")
-    finally:
-        db_session.close()
+    }, {
+        'total_api_calls': partial(to_int, default=0),
+        'successful_calls': partial(to_int, default=0),
+        'failed_calls': partial(to_int, default=0),
+        'success_rate': partial(to_float, default=0.0, strip='%'),
+    })
+    return insert_frame(ApiUsageReport, frame)
 
 
+@bulk_loader(MostVerifiedReport, 'most verified reports')
 def load_most_verified_reports():
-    column_mapping = {
+    df = read_seed_csv('most_verified_reports.csv', 'most verified reports')
+    if df is None:
+        return None
+
+    frame = map_columns(MostVerifiedReport, df, {
         'ID User': 'id_user',
         'User Name': 'user_name',
         'User Email': 'user_email',
@@ -794,62 +718,24 @@ def load_most_verified_reports():
         'Spent On Credits': 'spent_on_credits',
         'Last Check': 'last_check',
         'Status': 'status',
-    }
-
-    csv_path = 'data/csv/most_verified_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping most verified reports load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping most verified reports load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading most verified reports", "reports")
-
-            most_verified_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle date fields
-                    if db_column == 'last_check':
-                        try:
-                            most_verified_report_data[db_column] = pd.to_datetime(value).date()
-                        except:
-                            most_verified_report_data[db_column] = None
-                    # Handle integer check fields
-                    elif db_column in ['total_checks', 'dd_checks', 'kyc_checks', 'dd_kyc_checks']:
-                        try:
-                            most_verified_report_data[db_column] = int(value)
-                        except:
-                            most_verified_report_data[db_column] = 0
-                    # Handle currency field
-                    elif db_column == 'spent_on_credits':
-                        try:
-                            # Remove currency symbols and commas if present
-                            clean_value = str(value).replace('£', '').replace(',', '').strip()
-                            most_verified_report_data[db_column] = float(clean_value)
-                        except:
-                            most_verified_report_data[db_column] = 0.00
-                    else:
-                        most_verified_report_data[db_column] = value
-
-            most_verified_report = MostVerifiedReport(**most_verified_report_data)
-            db_session.add(most_verified_report)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} most verified reports into the database")
-    finally:
-        db_session.close()
-
-
+    }, {
+        'total_checks': partial(to_int, default=0),
+        'dd_checks': partial(to_int, default=0),
+        'kyc_checks': partial(to_int, default=0),
+        'dd_kyc_checks': partial(to_int, default=0),
+        'spent_on_credits': partial(to_float, default=0.0, strip='£,'),
+        'last_check': to_date,
+    })
+    return insert_frame(MostVerifiedReport, frame)
+
+
+@bulk_loader(CreditPurchasedReport, 'credit purchased reports')
 def load_credit_purchased_reports():
-    column_mapping = {
+    df = read_seed_csv('credit_purchased_reports.csv', 'credit purchased reports')
+    if df is None:
+        return None
+
+    frame = map_columns(CreditPurchasedReport, df, {
         'ID User': 'id_user',
         'User Name': 'user_name',
         'User Email': 'user_email',
@@ -859,58 +745,14 @@ def load_credit_purchased_reports():
         'Spent On Credits': 'spent_on_credits',
         'Last Top Up': 'last_top_up',
         'Status': 'status',
-    }
-
-    csv_path = 'data/csv/credit_purchased_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping credit purchased reports load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping credit purchased reports load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading credit purchased reports", "reports")
-
-            credit_purchased_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle date fields
-                    if db_column == 'last_top_up':
-                        try:
-                            credit_purchased_report_data[db_column] = pd.to_datetime(value).date()
-                        except:
-                            credit_purchased_report_data[db_column] = None
-                    # Handle integer credit fields
-                    elif db_column in ['credit_purchased', 'credit_used', 'remaining_credits']:
-                        try:
-                            credit_purchased_report_data[db_column] = int(value)
-                        except:
-                            credit_purchased_report_data[db_column] = 0
-                    # Handle currency field
-                    elif db_column == 'spent_on_credits':
-                        try:
-                            # Remove currency symbols and commas if present
-                            clean_value = str(value).replace('£', '').replace(',', '').strip()
-                            credit_purchased_report_data[db_column] = float(clean_value)
-                        except:
-                            credit_purchased_report_data[db_column] = 0.00
-                    else:
-                        credit_purchased_report_data[db_column] = value
-
-            credit_purchased_report = CreditPurchasedReport(**credit_purchased_report_data)
-            db_session.add(credit_purchased_report)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} credit purchased reports into the database")
-    finally:
-        db_session.close()
+    }, {
+        'credit_purchased': partial(to_int, default=0),
+        'credit_used': partial(to_int, default=0),
+        'remaining_credits': partial(to_int, default=0),
+        'spent_on_credits': partial(to_float, default=0.0, strip='£,'),
+        'last_top_up': to_date,
+    })
+    return insert_frame(CreditPurchasedReport, frame)
 
 
 def calculate_permission_bit_sequence_from_csv(permissions_str):
@@ -945,46 +787,86 @@ def calculate_permission_bit_sequence_from_csv(permissions_str):
     return str(result)
 
 
-def export_sheets_to_csv():
-    """Export Excel sheets to CSV files"""
+SEED_EXCEL_FILES = [
+    'data/tds_admin_base_data.xlsx',
+]
 
-    excel_files = [
-        'data/tds_admin_base_data.xlsx',
-    ]
-    csv_dir = 'data/csv'
+# pandas engine reading the Excel files: openpyxl, or calamine (faster, with
+# the python-calamine package)
+SEED_EXCEL_ENGINE = os.getenv('SEED_EXCEL_ENGINE', 'openpyxl')
+
+
+def get_excel_engine(excel_engine=None):
+    excel_engine = excel_engine or SEED_EXCEL_ENGINE
+    if excel_engine == 'calamine' and importlib.util.find_spec('python_calamine') is None:
+        print("Warning: The calamine Excel engine needs the python-calamine package, reading with openpyxl")
+        return 'openpyxl'
+    return excel_engine
+
+
+def export_sheets_to_csv(excel_files=SEED_EXCEL_FILES, excel_engine=None):
+    """
+    Export Excel sheets to CSV files. Every workbook is opened once and its
+    sheets read one after the other, each one written before the next is
+    read. Only the CSV files whose content changed are written.
+
+    Args:
+        excel_files (list): Paths of the workbooks
+        excel_engine (str): pandas engine reading them, SEED_EXCEL_ENGINE
+        by default
+
+    Returns:
+        list: Names of the CSV files written
+    """
+
+    csv_dir = SEED_CSV_DIR
     
     # Ensure CSV directory exists
     os.makedirs(csv_dir, exist_ok=True)
     
-    # Count total sheets for progress tracking
-    total_sheets = 0
-    all_sheets = []
-    for excel_file in excel_files:
-        if os.path.exists(excel_file):
-            xlsx = pd.ExcelFile(excel_file)
-            for sheet_name in xlsx.sheet_names:
-                all_sheets.append((excel_file, sheet_name))
-                total_sheets += 1
-    
-    print(f"Exporting {total_sheets} sheets to CSV...")
-    
-    # Process all sheets with progress
-    for index, (excel_file, sheet_name) in enumerate(all_sheets):
-        ProgressDisplay.show_progress(index + 1, total_sheets, "Exporting Excel sheets", "sheets")
-        
-        # Read the sheet
-        df = pd.read_excel(excel_file, sheet_name=sheet_name)
+    excel_engine = get_excel_engine(excel_engine)
+    with ExitStack() as stack:
+        # Opening a workbook parses its shared strings and styles, so it's
+        # only done once, not for every sheet
+        workbooks = [
+            stack.enter_context(pd.ExcelFile(excel_file, engine=excel_engine))
+            for excel_file in excel_files
+            if os.path.exists(excel_file)
+        ]
+        all_sheets = [(xlsx, sheet_name) for xlsx in workbooks for sheet_name in xlsx.sheet_names]
+        total_sheets = len(all_sheets)
         
-        # Generate CSV filename using snake case
-        csv_filename = f"{to_snake_case(sheet_name)}.csv"
-        csv_path = os.path.join(csv_dir, csv_filename)
+        print(f"Exporting {total_sheets} sheets to CSV...")
         
-        # Export to CSV
-        df.to_csv(csv_path, index=False)
+        # Process all sheets with progress
+        changed_files = []
+        for index, (xlsx, sheet_name) in enumerate(all_sheets):
+            ProgressDisplay.show_progress(index + 1, total_sheets, "Exporting Excel sheets", "sheets")
+            
+            # Read the sheet
+            df = xlsx.parse(sheet_name)
+            
+            # Generate CSV filename using snake case
+            csv_filename = f"{to_snake_case(sheet_name)}.csv"
+            csv_path = os.path.join(csv_dir, csv_filename)
+            
+            # Export to CSV, leaving the files of the unchanged sheets alone
+            content = df.to_csv(index=False).encode('utf-8')
+            if os.path.exists(csv_path):
+                with open(csv_path, 'rb') as csv_file:
+                    if csv_file.read() == content:
+                        continue
+            with open(csv_path, 'wb') as csv_file:
+                csv_file.write(content)
+            changed_files.append(csv_filename)
     
-    ProgressDisplay.finalize_line(f"Exported {total_sheets} Excel sheets to CSV files")
+    ProgressDisplay.finalize_line(
+        f"Exported {total_sheets} Excel sheets to CSV files ({len(changed_files)} changed)"
+    )
+    return changed_files
 
 
+@bulk_loader(User, 'users', csv_files=('users.csv', 'test_users.csv'))
 def load_users():
     column_mapping = {
         'Name': 'name',
@@ -995,12 +877,13 @@ def load_users():
     }
 
     csv_files = [
-        'data/csv/users.csv',
-        'data/csv/test_users.csv',
+        'users.csv',
+        'test_users.csv',
     ]
 
     dfs = []
-    for csv_path in csv_files:
+    for csv_file in csv_files:
+        csv_path = get_csv_path(csv_file)
         if os.path.exists(csv_path):
             try:
                 df = pd.read_csv(csv_path)
@@ -1012,354 +895,201 @@ def load_users():
 
     if not dfs:
         print("Info: No user CSV files found, skipping user load")
-        return
+        return None
 
     df = pd.concat(dfs, ignore_index=True)
+    frame = map_columns(User, df, column_mapping)
 
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading users", "users")
-
-            user_data = {
-                db_column: row.get(csv_column)
-                for csv_column, db_column in column_mapping.items()
-            }
+    # bcrypt is slow on purpose, so every distinct password of the seed
+    # accounts is only hashed once
+    password_hashes = {}
 
+    def hash_password(password):
+        password = str(password or '')
+        if password not in password_hashes:
             try:
-                user_data['password'] = bcrypt.hashpw(
-                    str(user_data.get('password') or '').encode('utf-8'),
+                password_hashes[password] = bcrypt.hashpw(
+                    password.encode('utf-8'),
                     bcrypt.gensalt(),
                 ).decode('utf-8')
             except Exception:
-                user_data['password'] = bcrypt.hashpw(
+                password_hashes[password] = bcrypt.hashpw(
                     b'default-password', bcrypt.gensalt()
                 ).decode('utf-8')
+        return password_hashes[password]
 
-            user = User(**user_data)
-            db_session.add(user)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} users into the database")
-    finally:
-        db_session.close()
+    frame['password'] = get_csv_column(frame, 'password').map(hash_password)
+    return insert_frame(User, frame)
 
 
+@bulk_loader(Role, 'global roles')
 def load_roles():
-    column_mapping = {
-        'Name': 'name',
-    }
-
-    csv_path = 'data/csv/roles.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping global roles load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping global roles load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading global roles", "roles")
-
-            role_data = {
-                db_column: row.get(csv_column)
-                for csv_column, db_column in column_mapping.items()
-            }
-
-            role_data['permission_bit_sequence'] = calculate_permission_bit_sequence_from_csv(
-                row.get('Permissions', ''),
-            )
-
-            role = Role(**role_data)
-            db_session.add(role)
+    df = read_seed_csv('roles.csv', 'global roles')
+    if df is None:
+        return None
 
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} global roles into the database")
-    finally:
-        db_session.close()
+    frame = map_columns(Role, df, {
+        'Name': 'name',
+    })
+    frame['permission_bit_sequence'] = get_csv_column(df, 'Permissions', '').map(
+        calculate_permission_bit_sequence_from_csv,
+    )
+    return insert_frame(Role, frame)
 
 
+@bulk_loader(EventType, 'event types')
 def load_event_types():
-    column_mapping = {
+    df = read_seed_csv('event_types.csv', 'event types')
+    if df is None:
+        return None
+
+    frame = map_columns(EventType, df, {
         'Token': 'token',
         'Name': 'name',
         'Message': 'message',
         'Notes': 'notes',
-    }
-
-    csv_path = 'data/csv/event_types.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping event types load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping event types load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading event types", "types")
-
-            event_type_data = {
-                db_column: (row.get(csv_column) if pd.notna(row.get(csv_column)) else None)
-                for csv_column, db_column in column_mapping.items()
-            }
-
-            event_type = EventType(**event_type_data)
-            db_session.add(event_type)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} event types into the database")
-    finally:
-        db_session.close()
+    })
+    return insert_frame(EventType, frame)
 
 
+@bulk_loader(DataType, 'data types')
 def load_data_types():
-    column_mapping = {
+    df = read_seed_csv('data_types.csv', 'data types')
+    if df is None:
+        return None
+
+    frame = map_columns(DataType, df, {
         'Name': 'name',
         'Description': 'description',
         'Status': 'status',
-    }
+    })
+    return insert_frame(DataType, frame)
 
-    csv_path = 'data/csv/data_types.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping data types load")
-        return
 
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping data types load")
-        return
+@bulk_loader(Category, 'categories')
+def load_categories():
+    df = read_seed_csv('categories.csv', 'categories')
+    if df is None:
+        return None
 
     db_session = SessionLocal()
     try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading data types", "types")
-
-            data_type_data = {
-                db_column: (row.get(csv_column) if pd.notna(row.get(csv_column)) else None)
-                for csv_column, db_column in column_mapping.items()
-            }
-
-            data_type = DataType(**data_type_data)
-            db_session.add(data_type)
+        # Get data types for lookup
+        data_types = {dt.name: dt.id for dt in db_session.query(DataType).all()}
 
+        frame = map_columns(Category, df, {
+            'Category Name': 'name',
+            'Status': 'status',
+            'Icon ID': 'id_icon',
+        })
+
+        # Resolve data type name to ID
+        data_type_names = get_csv_column(df, 'Data Type')
+        frame['id_data_type'] = map_ids(data_type_names, data_types)
+        frame = skip_rows(
+            frame,
+            frame['id_data_type'].isna(),
+            lambda row: f"Warning: Data type '{data_type_names[row.name]}' not found, skipping category",
+        )
+
+        total_rows = bulk_insert(db_session, Category, frame)
         db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} data types into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
-def load_categories():
-    column_mapping = {
-        'Category Name': 'name',
-        'Data Type': 'data_type_name',  # We'll resolve this to id_data_type
-        'Status': 'status',
-        'Icon ID': 'id_icon',
-    }
-
-    csv_path = 'data/csv/categories.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping categories load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping categories load")
-        return
+@bulk_loader(SubCategory, 'sub categories')
+def load_sub_categories():
+    df = read_seed_csv('sub_categories.csv', 'sub categories')
+    if df is None:
+        return None
 
     db_session = SessionLocal()
     try:
-        # Get data types for lookup
+        # Get data types and categories for lookup
         data_types = {dt.name: dt.id for dt in db_session.query(DataType).all()}
+        categories = {cat.name: cat.id for cat in db_session.query(Category).all()}
 
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading categories", "categories")
-
-            # Map basic fields
-            category_data = {}
-            for csv_column, db_column in column_mapping.items():
-                if csv_column != 'Data Type':  # Handle data type separately
-                    value = row.get(csv_column)
-                    if pd.notna(value):
-                        category_data[db_column] = value
-
-            # Resolve data type name to ID
-            data_type_name = row.get('Data Type')
-            if pd.notna(data_type_name) and data_type_name in data_types:
-                category_data['id_data_type'] = data_types[data_type_name]
-            else:
-                print(f"Warning: Data type '{data_type_name}' not found, skipping category")
-                continue
-
-            # Remove the temporary field
-            category_data.pop('data_type_name', None)
-
-            category = Category(**category_data)
-            db_session.add(category)
-
+        frame = map_columns(SubCategory, df, {
+            'Sub Category Name': 'name',
+            'Status': 'status',
+            'Icon ID': 'id_icon',
+        })
+
+        # Resolve category and data type names to IDs
+        category_names = get_csv_column(df, 'Category Name')
+        frame['id_category'] = map_ids(category_names, categories)
+        frame = skip_rows(
+            frame,
+            frame['id_category'].isna(),
+            lambda row: f"Warning: Category '{category_names[row.name]}' not found, skipping sub category",
+        )
+
+        data_type_names = get_csv_column(df, 'Data Type')
+        frame['id_data_type'] = map_ids(data_type_names, data_types)
+        frame = skip_rows(
+            frame,
+            frame['id_data_type'].isna(),
+            lambda row: f"Warning: Data type '{data_type_names[row.name]}' not found, skipping sub category",
+        )
+
+        total_rows = bulk_insert(db_session, SubCategory, frame)
         db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} categories into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
-def load_sub_categories():
-    column_mapping = {
-        'Sub Category Name': 'name',
-        'Category Name': 'category_name',  # We'll resolve this to id_category
-        'Data Type': 'data_type_name',  # We'll resolve this to id_data_type
-        'Status': 'status',
-        'Icon ID': 'id_icon',
-    }
-
-    csv_path = 'data/csv/sub_categories.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping sub categories load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping sub categories load")
-        return
+@bulk_loader(Selection, 'selections')
+def load_selections():
+    df = read_seed_csv('selections.csv', 'selections')
+    if df is None:
+        return None
 
     db_session = SessionLocal()
     try:
-        # Get data types and categories for lookup
+        # Get data types, categories, and sub categories for lookup
         data_types = {dt.name: dt.id for dt in db_session.query(DataType).all()}
         categories = {cat.name: cat.id for cat in db_session.query(Category).all()}
+        sub_categories = {sub_cat.name: sub_cat.id for sub_cat in db_session.query(SubCategory).all()}
 
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading sub categories", "sub categories")
-
-            # Map basic fields
-            sub_category_data = {}
-            for csv_column, db_column in column_mapping.items():
-                if csv_column not in ['Category Name', 'Data Type']:  # Handle lookups separately
-                    value = row.get(csv_column)
-                    if pd.notna(value):
-                        sub_category_data[db_column] = value
-
-            # Resolve category name to ID
-            category_name = row.get('Category Name')
-            if pd.notna(category_name) and category_name in categories:
-                sub_category_data['id_category'] = categories[category_name]
-            else:
-                print(f"Warning: Category '{category_name}' not found, skipping sub category")
-                continue
-
-            # Resolve data type name to ID
-            data_type_name = row.get('Data Type')
-            if pd.notna(data_type_name) and data_type_name in data_types:
-                sub_category_data['id_data_type'] = data_types[data_type_name]
-            else:
-                print(f"Warning: Data type '{data_type_name}' not found, skipping sub category")
-                continue
-
-            # Remove the temporary fields
-            sub_category_data.pop('category_name', None)
-            sub_category_data.pop('data_type_name', None)
-
-            sub_category = SubCategory(**sub_category_data)
-            db_session.add(sub_category)
+        frame = map_columns(Selection, df, {
+            'Selection Name': 'name',
+            'Selection ID': 'selection_id',
+            'Status': 'status',
+            'Icon ID': 'id_icon',
+        })
+
+        # Resolve sub category, category and data type names to IDs
+        lookups = [
+            ('Sub Category Name', 'id_sub_category', sub_categories, 'Sub category'),
+            ('Category Name', 'id_category', categories, 'Category'),
+            ('Data Type', 'id_data_type', data_types, 'Data type'),
+        ]
+        for csv_column, db_column, mapping, entity_name in lookups:
+            names = get_csv_column(df, csv_column)
+            frame[db_column] = map_ids(names.loc[frame.index], mapping)
+            frame = skip_rows(
+                frame,
+                frame[db_column].isna(),
+                lambda row: f"Warning: {entity_name} '{names[row.name]}' not found, skipping selection",
+            )
 
+        total_rows = bulk_insert(db_session, Selection, frame)
         db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} sub categories into the database")
-    finally:
-        db_session.close()
-
-
-def load_selections():
-    column_mapping = {
-        'Selection Name': 'name',
-        'Sub Category Name': 'sub_category_name',  # We'll resolve this to id_sub_category
-        'Category Name': 'category_name',  # We'll resolve this to id_category
-        'Data Type': 'data_type_name',  # We'll resolve this to id_data_type
-        'Selection ID': 'selection_id',
-        'Status': 'status',
-        'Icon ID': 'id_icon',
-    }
-
-    csv_path = 'data/csv/selections.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping selections load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping selections load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        # Get data types, categories, and sub categories for lookup
-        data_types = {dt.name: dt.id for dt in db_session.query(DataType).all()}
-        categories = {cat.name: cat.id for cat in db_session.query(Category).all()}
-        sub_categories = {sub_cat.name: sub_cat.id for sub_cat in db_session.query(SubCategory).all()}
-
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading selections", "selections")
-
-            # Map basic fields
-            selection_data = {}
-            for csv_column, db_column in column_mapping.items():
-                if csv_column not in ['Sub Category Name', 'Category Name', 'Data Type']:  # Handle lookups separately
-                    value = row.get(csv_column)
-                    if pd.notna(value):
-                        selection_data[db_column] = value
-
-            # Resolve sub category name to ID
-            sub_category_name = row.get('Sub Category Name')
-            if pd.notna(sub_category_name) and sub_category_name in sub_categories:
-                selection_data['id_sub_category'] = sub_categories[sub_category_name]
-            else:
-                print(f"Warning: Sub category '{sub_category_name}' not found, skipping selection")
-                continue
-
-            # Resolve category name to ID
-            category_name = row.get('Category Name')
-            if pd.notna(category_name) and category_name in categories:
-                selection_data['id_category'] = categories[category_name]
-            else:
-                print(f"Warning: Category '{category_name}' not found, skipping selection")
-                continue
-
-            # Resolve data type name to ID
-            data_type_name = row.get('Data Type')
-            if pd.notna(data_type_name) and data_type_name in data_types:
-                selection_data['id_data_type'] = data_types[data_type_name]
-            else:
-                print(f"Warning: Data type '{data_type_name}' not found, skipping selection")
-                continue
-
-            # Remove the temporary fields
-            selection_data.pop('sub_category_name', None)
-            selection_data.pop('category_name', None)
-            selection_data.pop('data_type_name', None)
-
-            selection = Selection(**selection_data)
-            db_session.add(selection)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} selections into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
+@bulk_loader(ActivityLog, 'activity logs')
 def load_activity_logs():
-    column_mapping = {
+    df = read_seed_csv('activity_logs.csv', 'activity logs')
+    if df is None:
+        return None
+
+    frame = map_columns(ActivityLog, df, {
         'Activity Type': 'activity_type',
         'Activity Category': 'activity_category',
         'Title': 'title',
@@ -1371,52 +1101,25 @@ def load_activity_logs():
         'Product ID': 'id_product',
         'DD User ID': 'id_dd_user',
         'Metadata': 'activity_metadata',
-    }
-
-    csv_path = 'data/csv/activity_logs.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping activity logs load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping activity logs load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading activity logs", "logs")
-
-            activity_log_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    if db_column in ['id_user', 'id_company', 'id_order', 'id_dispute', 'id_product', 'id_dd_user']:
-                        try:
-                            activity_log_data[db_column] = int(value)
-                        except Exception:
-                            activity_log_data[db_column] = None
-                    elif db_column == 'activity_metadata' and isinstance(value, str):
-                        try:
-                            activity_log_data[db_column] = json.loads(value)
-                        except json.JSONDecodeError:
-                            activity_log_data[db_column] = None
-                    else:
-                        activity_log_data[db_column] = value
-
-            activity_log = ActivityLog(**activity_log_data)
-            db_session.add(activity_log)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} activity logs into the database")
-    finally:
-        db_session.close()
-
-
+    }, {
+        'id_user': to_int,
+        'id_company': to_int,
+        'id_order': to_int,
+        'id_dispute': to_int,
+        'id_product': to_int,
+        'id_dd_user': to_int,
+        'activity_metadata': to_json,
+    })
+    return insert_frame(ActivityLog, frame)
+
+
+@bulk_loader(Transaction, 'transactions')
 def load_transactions():
-    column_mapping = {
+    df = read_seed_csv('transactions.csv', 'transactions')
+    if df is None:
+        return None
+
+    frame = map_columns(Transaction, df, {
         'Transaction ID': 'id_transaction',
         'Order ID': 'id_order',
         'Transaction Date': 'transaction_date',
@@ -1437,82 +1140,36 @@ def load_transactions():
         'Buyer ID': 'id_buyer',
         'Seller ID': 'id_seller',
         'Product ID': 'id_product',
-    }
-
-    csv_path = 'data/csv/transactions.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping transactions load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping transactions load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading transactions", "transactions")
-
-            transaction_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle date fields
-                    if db_column in ['transaction_date']:
-                        try:
-                            transaction_data[db_column] = pd.to_datetime(value)
-                        except:
-                            transaction_data[db_column] = None
-                    elif db_column in ['payable_date']:
-                        try:
-                            transaction_data[db_column] = pd.to_datetime(value).date()
-                        except:
-                            transaction_data[db_column] = None
-                    elif db_column in ['id_buyer', 'id_seller', 'id_product']:
-                        try:
-                            transaction_data[db_column] = int(value)
-                        except:
-                            transaction_data[db_column] = None
-                    elif db_column in ['sale_price', 'vat_amount', 'tds_fee', 'payment_provider_fee', 'net_payable', 'remaining_vat', 'total_payable']:
-                        try:
-                            transaction_data[db_column] = float(value)
-                        except:
-                            transaction_data[db_column] = None
-                    else:
-                        transaction_data[db_column] = str(value).strip() if isinstance(value, str) else value
-
-            transaction = Transaction(**transaction_data)
-            db_session.add(transaction)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} transactions into the database")
-    finally:
-        db_session.close()
-
-
+    }, {
+        'id_transaction': strip_strings,
+        'id_order': strip_strings,
+        'transaction_date': to_datetime,
+        'sale_price': to_float,
+        'vat_amount': to_float,
+        'tds_fee': to_float,
+        'payment_provider_fee': to_float,
+        'net_payable': to_float,
+        'remaining_vat': to_float,
+        'total_payable': to_float,
+        'payable_date': to_date,
+        'status': strip_strings,
+        'portal': strip_strings,
+        'invoice_id': strip_strings,
+        'invoice_url': strip_strings,
+        'payment_provider': strip_strings,
+        'notes': strip_strings,
+        'id_buyer': to_int,
+        'id_seller': to_int,
+        'id_product': to_int,
+    })
+    return insert_frame(Transaction, frame)
+
+
+@bulk_loader(Blog, 'blogs')
 def load_blogs():
-    column_mapping = {
-        'Title': 'title',
-        'Category ID': 'id_category',
-        'Publication Status': 'publication_status',
-        'Blog Status': 'blog_status',
-        'User ID': 'id_user',
-    }
-
-    csv_path = 'data/csv/blogs.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping blogs load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping blogs load")
-        return
-
-    df = df.reset_index(drop=True)
+    df = read_seed_csv('blogs.csv', 'blogs')
+    if df is None:
+        return None
 
     valid_publication_statuses = {'PUBLISHED', 'PENDING'}
     valid_blog_statuses = {'ACTIVE', 'ARCHIVED'}
@@ -1522,87 +1179,59 @@ def load_blogs():
         category_ids = {category.id for category in db_session.query(Category).all()}
         user_ids = {user.id for user in db_session.query(User).all()}
 
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading blogs", "blogs")
-
-            blog_data = {}
-            skip_record = False
-
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.isna(value):
-                    continue
-
-                if db_column in ['id_category', 'id_user']:
-                    try:
-                        blog_data[db_column] = int(value)
-                    except Exception:
-                        blog_data[db_column] = None
-                elif db_column in ['publication_status', 'blog_status']:
-                    normalized_value = str(value).strip().upper()
-                    if db_column == 'publication_status' and normalized_value not in valid_publication_statuses:
-                        print(f"Warning: Invalid publication status '{value}', skipping blog")
-                        skip_record = True
-                        break
-                    if db_column == 'blog_status' and normalized_value not in valid_blog_statuses:
-                        print(f"Warning: Invalid blog status '{value}', skipping blog")
-                        skip_record = True
-                        break
-                    blog_data[db_column] = normalized_value
-                else:
-                    blog_data[db_column] = str(value).strip()
-
-            if skip_record:
-                continue
-
-            category_id = blog_data.get('id_category')
-            if category_id is not None and category_id not in category_ids:
-                print(f"Warning: Category ID {category_id} not found, skipping blog")
+        frame = map_columns(Blog, df, {
+            'Title': 'title',
+            'Category ID': 'id_category',
+            'Publication Status': 'publication_status',
+            'Blog Status': 'blog_status',
+            'User ID': 'id_user',
+        }, {
+            'title': to_str,
+            'id_category': to_int,
+            'publication_status': to_upper,
+            'blog_status': to_upper,
+            'id_user': to_int,
+        })
+
+        status_checks = [
+            ('Publication Status', 'publication_status', valid_publication_statuses, 'publication status'),
+            ('Blog Status', 'blog_status', valid_blog_statuses, 'blog status'),
+        ]
+        for csv_column, db_column, valid_statuses, status_name in status_checks:
+            if db_column not in frame.columns:
                 continue
+            statuses = df[csv_column]
+            frame = skip_rows(
+                frame,
+                statuses.loc[frame.index].notna() & ~frame[db_column].isin(valid_statuses),
+                lambda row: f"Warning: Invalid {status_name} '{statuses[row.name]}', skipping blog",
+            )
 
-            user_id = blog_data.get('id_user')
-            if user_id is not None and user_id not in user_ids:
-                print(f"Warning: User ID {user_id} not found, skipping blog")
+        id_checks = [
+            ('id_category', category_ids, 'Category'),
+            ('id_user', user_ids, 'User'),
+        ]
+        for db_column, valid_ids, entity_name in id_checks:
+            if db_column not in frame.columns:
                 continue
+            frame = skip_rows(
+                frame,
+                frame[db_column].notna() & ~frame[db_column].isin(valid_ids),
+                lambda row: f"Warning: {entity_name} ID {row[db_column]} not found, skipping blog",
+            )
 
-            blog = Blog(**blog_data)
-            db_session.add(blog)
-
+        total_rows = bulk_insert(db_session, Blog, frame)
         db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} blogs into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
+@bulk_loader(Order, 'orders')
 def load_orders():
-    column_mapping = {
-        'Title': 'title',
-        'Description': 'description',
-        'Order Date': 'order_date',
-        'Completion Date': 'completion_date',
-        'Product ID': 'id_product',
-        'Quantity Ordered': 'quantity_ordered',
-        'Unit Price': 'unit_price',
-        'Total Amount': 'total_amount',
-        'Discount Amount': 'discount_amount',
-        'Final Amount': 'final_amount',
-        'Status': 'status',
-        'Payment Status': 'payment_status',
-        'Delivery Status': 'delivery_status',
-        'Buyer ID': 'id_buyer',
-        'Company ID': 'id_company',
-    }
-
-    csv_path = 'data/csv/orders.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping orders load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping orders load")
-        return
+    df = read_seed_csv('orders.csv', 'orders')
+    if df is None:
+        return None
 
     db_session = SessionLocal()
     try:
@@ -1611,352 +1240,235 @@ def load_orders():
         company_ids = {comp.id for comp in db_session.query(Company).all()}
         buyer_ids = {buyer.id for buyer in db_session.query(Buyer).all()}
 
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading orders", "orders")
-
-            order_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle date fields
-                    if db_column in ['order_date', 'completion_date']:
-                        try:
-                            order_data[db_column] = pd.to_datetime(value)
-                        except Exception:
-                            order_data[db_column] = None
-                    # Handle numeric fields
-                    elif db_column in ['quantity_ordered']:
-                        try:
-                            order_data[db_column] = int(value)
-                        except Exception:
-                            order_data[db_column] = 1
-                    elif db_column in ['unit_price', 'total_amount', 'discount_amount', 'final_amount']:
-                        try:
-                            order_data[db_column] = float(value)
-                        except Exception:
-                            order_data[db_column] = None
-                    elif db_column in ['id_product', 'id_buyer', 'id_company']:
-                        try:
-                            order_data[db_column] = int(value)
-                        except Exception:
-                            order_data[db_column] = None
-                    else:
-                        order_data[db_column] = value
-
-            # Validate required foreign key relationships
-            validation_checks = [
-                ('id_product', product_ids, 'Product'),
-                ('id_buyer', buyer_ids, 'Buyer'),
-                ('id_company', company_ids, 'Company'),
-            ]
-
-            skip_record = False
-            for field_name, valid_ids, entity_name in validation_checks:
-                entity_id = order_data.get(field_name)
-                if entity_id is None:
-                    print(f"Warning: No {entity_name} ID provided, skipping order")
-                    skip_record = True
-                    break
-                if valid_ids and entity_id not in valid_ids:
-                    print(f"Warning: {entity_name} ID {entity_id} not found, skipping order")
-                    skip_record = True
-                    break
-
-            if skip_record:
-                continue
-
-            order = Order(**order_data)
-            db_session.add(order)
+        frame = map_columns(Order, df, {
+            'Title': 'title',
+            'Description': 'description',
+            'Order Date': 'order_date',
+            'Completion Date': 'completion_date',
+            'Product ID': 'id_product',
+            'Quantity Ordered': 'quantity_ordered',
+            'Unit Price': 'unit_price',
+            'Total Amount': 'total_amount',
+            'Discount Amount': 'discount_amount',
+            'Final Amount': 'final_amount',
+            'Status': 'status',
+            'Payment Status': 'payment_status',
+            'Delivery Status': 'delivery_status',
+            'Buyer ID': 'id_buyer',
+            'Company ID': 'id_company',
+        }, {
+            'order_date': to_datetime,
+            'completion_date': to_datetime,
+            'id_product': to_int,
+            'quantity_ordered': partial(to_int, default=1),
+            'unit_price': to_float,
+            'total_amount': to_float,
+            'discount_amount': to_float,
+            'final_amount': to_float,
+            'id_buyer': to_int,
+            'id_company': to_int,
+        })
+
+        # Validate required foreign key relationships
+        validation_checks = [
+            ('id_product', product_ids, 'Product'),
+            ('id_buyer', buyer_ids, 'Buyer'),
+            ('id_company', company_ids, 'Company'),
+        ]
+        for field_name, valid_ids, entity_name in validation_checks:
+            frame[field_name] = get_csv_column(frame, field_name)
+            frame = skip_invalid_ids(frame, field_name, valid_ids, entity_name, 'order')
 
+        total_rows = bulk_insert(db_session, Order, frame)
         db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} orders into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
+@bulk_loader(DatasetOrder, 'dataset orders')
 def load_dataset_orders():
-    csv_path = 'data/csv/dataset_orders.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping dataset orders load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping dataset orders load")
-        return
+    df = read_seed_csv('dataset_orders.csv', 'dataset orders')
+    if df is None:
+        return None
 
     db_session = SessionLocal()
     try:
         product_map = {product.name: product.id for product in db_session.query(Product).all()}
         company_map = {company.name: company.id for company in db_session.query(Company).all()}
 
-        def parse_bool(value, default=False):
-            if pd.isna(value):
-                return default
-            normalized = str(value).strip().lower()
-            if normalized in ['true', '1', 'yes', 'y']:
-                return True
-            if normalized in ['false', '0', 'no', 'n']:
-                return False
-            return default
-
-        created = 0
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading dataset orders", "dataset_orders")
-
-            order_code = row.get('Order Code')
-            if pd.isna(order_code):
-                print('Warning: Order Code missing, skipping dataset order row')
-                continue
-            order_code = str(order_code).strip()
-            if not order_code:
-                print('Warning: Blank Order Code encountered, skipping dataset order row')
-                continue
-
-            existing = (
-                db_session.query(DatasetOrder)
-                .filter(DatasetOrder.order_code == order_code)
-                .first()
+        def to_int_or(default):
+            return lambda values: fill_missing(to_int(values, default=default), default)
+
+        def to_float_or(default):
+            return lambda values: fill_missing(to_float(values, default=default), default)
+
+        frame = pd.DataFrame(index=df.index)
+        frame['order_code'] = to_str(get_csv_column(df, 'Order Code'))
+        frame = skip_rows(
+            frame,
+            frame['order_code'].isna(),
+            'Warning: Order Code missing, skipping dataset order row',
+        )
+        frame = skip_rows(
+            frame,
+            frame['order_code'] == '',
+            'Warning: Blank Order Code encountered, skipping dataset order row',
+        )
+
+        frame = skip_existing(db_session, DatasetOrder, frame, 'order_code', 'dataset order')
+
+        lookups = [
+            ('Product Name', 'id_product', product_map, 'Product'),
+            ('Buyer Company', 'id_buyer_company', company_map, 'Buyer company'),
+            ('Seller Company', 'id_seller_company', company_map, 'Seller company'),
+        ]
+        for csv_column, db_column, mapping, entity_name in lookups:
+            names = get_csv_column(df, csv_column)
+            frame[db_column] = map_ids(names.loc[frame.index], mapping)
+            frame = skip_rows(
+                frame,
+                frame[db_column].isna(),
+                lambda row: f"Warning: {entity_name} '{names[row.name]}' not found, skipping dataset order {row['order_code']}",
             )
-            if existing:
-                continue
-
-            product_name = row.get('Product Name')
-            product_id = product_map.get(str(product_name).strip()) if pd.notna(product_name) else None
-            if not product_id:
-                print(f"Warning: Product '{product_name}' not found, skipping dataset order {order_code}")
-                continue
 
-            buyer_name = row.get('Buyer Company')
-            buyer_company_id = company_map.get(str(buyer_name).strip()) if pd.notna(buyer_name) else None
-            if not buyer_company_id:
-                print(f"Warning: Buyer company '{buyer_name}' not found, skipping dataset order {order_code}")
-                continue
+        rows = df.loc[frame.index]
+        frame['ordered_on'] = to_datetime(get_csv_column(rows, 'Ordered On'))
+        frame = skip_rows(
+            frame,
+            frame['ordered_on'].isna(),
+            lambda row: f"Warning: Ordered On missing for {row['order_code']}, skipping",
+        )
+        rows = df.loc[frame.index]
+
+        query_rules_raw = get_csv_column(rows, 'Query Rules')
+        has_query_rules = query_rules_raw.notna() & (query_rules_raw.astype(str).str.strip() != '')
+        query_rules = to_json(query_rules_raw.where(has_query_rules))
+        for order_code in frame['order_code'][has_query_rules & query_rules.isna()]:
+            print(f"Warning: Invalid Query Rules JSON for {order_code}, storing as None")
+
+        currency = to_str(fill_missing(get_csv_column(rows, 'Currency'), 'GBP')).str[:3]
+
+        enum_columns = [
+            ('Status', 'status', DatasetOrderStatus, DatasetOrderStatus.ACCEPTED),
+            ('Licence Status', 'licence_status', DatasetLicenceStatus, DatasetLicenceStatus.ACTIVE),
+            ('Dispute Status', 'dispute_status', DatasetDisputeStatus, DatasetDisputeStatus.NONE),
+            ('Refund Status', 'refund_status', DatasetRefundStatus, DatasetRefundStatus.NONE),
+            ('Forwarding Status', 'forwarding_status', DatasetForwardingStatus, DatasetForwardingStatus.SUCCESS),
+        ]
+        for csv_column, db_column, enum_class, default in enum_columns:
+            frame[db_column] = to_choice(
+                get_csv_column(rows, csv_column),
+                enum_class._value2member_map_,
+                default=default.value,
+            )
 
-            seller_name = row.get('Seller Company')
-            seller_company_id = company_map.get(str(seller_name).strip()) if pd.notna(seller_name) else None
-            if not seller_company_id:
-                print(f"Warning: Seller company '{seller_name}' not found, skipping dataset order {order_code}")
-                continue
+        value_columns = [
+            ('Quantity', 'quantity', to_int_or(0)),
+            ('Unit Price', 'unit_price', to_float_or(0.0)),
+            ('Total Value', 'total_value', to_float_or(0.0)),
+            ('DupeCheck Passed', 'dupecheck_passed', partial(to_bool, false_values=FALSE_VALUES, default=True)),
+            ('TPS Match Count', 'tps_match_count', to_int_or(0)),
+            ('Licence Expires On', 'licence_expires_on', to_date),
+            ('Dispute Count', 'dispute_count', to_int_or(0)),
+            ('Dispute Summary', 'dispute_summary', to_str),
+            ('Refund Value', 'refund_value', to_float),
+            ('Coverage Enabled', 'coverage_enabled', partial(to_bool, false_values=FALSE_VALUES, default=True)),
+            ('Advanced Filters Enabled', 'advanced_filters_enabled', partial(to_bool, false_values=FALSE_VALUES, default=False)),
+            ('Query Count', 'query_count', to_int),
+            ('Retry Count Total', 'retry_count_total', to_int_or(0)),
+            ('Notes', 'notes', to_str),
+        ]
+        for csv_column, db_column, converter in value_columns:
+            frame[db_column] = converter(get_csv_column(rows, csv_column))
 
-            ordered_on_raw = row.get('Ordered On')
-            ordered_on = None
-            if pd.notna(ordered_on_raw):
-                try:
-                    ordered_on = pd.to_datetime(ordered_on_raw, utc=True, errors='coerce')
-                except Exception:
-                    ordered_on = None
-            if ordered_on is None or pd.isna(ordered_on):
-                print(f"Warning: Ordered On missing for {order_code}, skipping")
-                continue
+        # Missing booleans take the default of their column too
+        for db_column, default in [('dupecheck_passed', True), ('coverage_enabled', True), ('advanced_filters_enabled', False)]:
+            frame[db_column] = fill_missing(frame[db_column], default)
 
-            licence_expires_raw = row.get('Licence Expires On')
-            licence_expires_on = None
-            if pd.notna(licence_expires_raw):
-                parsed_date = pd.to_datetime(licence_expires_raw, errors='coerce')
-                if not pd.isna(parsed_date):
-                    licence_expires_on = parsed_date.date()
-
-            def parse_int(value, default=None):
-                if pd.isna(value):
-                    return default
-                try:
-                    return int(value)
-                except Exception:
-                    return default
-
-            def parse_float(value, default=None):
-                if pd.isna(value):
-                    return default
-                try:
-                    return float(value)
-                except Exception:
-                    return default
-
-            status_value = str(row.get('Status', '')).strip().lower()
-            if status_value not in DatasetOrderStatus._value2member_map_:
-                status_value = DatasetOrderStatus.ACCEPTED.value
-
-            licence_status_value = str(row.get('Licence Status', '')).strip().lower()
-            if licence_status_value not in DatasetLicenceStatus._value2member_map_:
-                licence_status_value = DatasetLicenceStatus.ACTIVE.value
-
-            dispute_status_value = str(row.get('Dispute Status', '')).strip().lower()
-            if dispute_status_value not in DatasetDisputeStatus._value2member_map_:
-                dispute_status_value = DatasetDisputeStatus.NONE.value
-
-            refund_status_value = str(row.get('Refund Status', '')).strip().lower()
-            if refund_status_value not in DatasetRefundStatus._value2member_map_:
-                refund_status_value = DatasetRefundStatus.NONE.value
-
-            forwarding_status_value = str(row.get('Forwarding Status', '')).strip().lower()
-            if forwarding_status_value not in DatasetForwardingStatus._value2member_map_:
-                forwarding_status_value = DatasetForwardingStatus.SUCCESS.value
-
-            query_rules_raw = row.get('Query Rules')
-            query_rules = None
-            if pd.notna(query_rules_raw) and str(query_rules_raw).strip():
-                try:
-                    query_rules = json.loads(query_rules_raw)
-                except json.JSONDecodeError:
-                    print(f"Warning: Invalid Query Rules JSON for {order_code}, storing as None")
-                    query_rules = None
-
-            dataset_order_data = {
-                'order_code': order_code,
-                'id_product': product_id,
-                'id_buyer_company': buyer_company_id,
-                'id_seller_company': seller_company_id,
-                'ordered_on': ordered_on.to_pydatetime(),
-                'quantity': parse_int(row.get('Quantity'), 0),
-                'unit_price': parse_float(row.get('Unit Price'), 0.0),
-                'total_value': parse_float(row.get('Total Value'), 0.0),
-                'currency': str(row.get('Currency', 'GBP')).strip()[:3] or 'GBP',
-                'dupecheck_passed': parse_bool(row.get('DupeCheck Passed'), True),
-                'tps_match_count': parse_int(row.get('TPS Match Count'), 0),
-                'status': status_value,
-                'licence_status': licence_status_value,
-                'licence_expires_on': licence_expires_on,
-                'dispute_status': dispute_status_value,
-                'dispute_count': parse_int(row.get('Dispute Count'), 0),
-                'dispute_summary': None if pd.isna(row.get('Dispute Summary')) else str(row.get('Dispute Summary')).strip(),
-                'refund_status': refund_status_value,
-                'refund_value': parse_float(row.get('Refund Value')),
-                'coverage_enabled': parse_bool(row.get('Coverage Enabled'), True),
-                'advanced_filters_enabled': parse_bool(row.get('Advanced Filters Enabled'), False),
-                'query_count': parse_int(row.get('Query Count')),
-                'query_rules': query_rules,
-                'forwarding_status': forwarding_status_value,
-                'retry_count_total': parse_int(row.get('Retry Count Total'), 0),
-                'notes': None if pd.isna(row.get('Notes')) else str(row.get('Notes')).strip(),
-            }
-
-            dataset_order = DatasetOrder(**dataset_order_data)
-            db_session.add(dataset_order)
-            created += 1
+        frame['currency'] = currency.where(currency != '', 'GBP')
+        frame['query_rules'] = query_rules.where(has_query_rules, None)
 
-        if created:
+        total_rows = bulk_insert(db_session, DatasetOrder, frame)
+        if total_rows:
             db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {created} dataset orders into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
+@bulk_loader(DatasetOrderDelivery, 'dataset order deliveries')
 def load_dataset_order_deliveries():
-    csv_path = 'data/csv/dataset_order_deliveries.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping dataset order deliveries load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping dataset order deliveries load")
-        return
+    df = read_seed_csv('dataset_order_deliveries.csv', 'dataset order deliveries')
+    if df is None:
+        return None
 
     db_session = SessionLocal()
     try:
         order_map = {order.order_code: order.id for order in db_session.query(DatasetOrder).all()}
 
-        def parse_bool(value, default=False):
-            if pd.isna(value):
-                return default
-            normalized = str(value).strip().lower()
-            if normalized in ['true', '1', 'yes', 'y']:
-                return True
-            if normalized in ['false', '0', 'no', 'n']:
-                return False
-            return default
-
-        created = 0
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading dataset order deliveries", "dataset_order_deliveries")
-
-            delivery_code = row.get('Delivery Code')
-            if pd.isna(delivery_code):
-                print('Warning: Delivery Code missing, skipping delivery row')
-                continue
-            delivery_code = str(delivery_code).strip()
-            if not delivery_code:
-                print('Warning: Blank Delivery Code encountered, skipping delivery row')
-                continue
-
-            existing = (
-                db_session.query(DatasetOrderDelivery)
-                .filter(DatasetOrderDelivery.delivery_code == delivery_code)
-                .first()
-            )
-            if existing:
-                continue
-
-            order_code = row.get('Order Code')
-            dataset_order_id = order_map.get(str(order_code).strip()) if pd.notna(order_code) else None
-            if not dataset_order_id:
-                print(f"Warning: Dataset order with code '{order_code}' not found, skipping delivery {delivery_code}")
-                continue
-
-            delivered_on_raw = row.get('Delivered On')
-            delivered_on = None
-            if pd.notna(delivered_on_raw):
-                try:
-                    delivered_on = pd.to_datetime(delivered_on_raw, utc=True, errors='coerce')
-                except Exception:
-                    delivered_on = None
-            if delivered_on is None or pd.isna(delivered_on):
-                print(f"Warning: Delivered On missing for delivery {delivery_code}, skipping")
-                continue
-
-            hlr_result = str(row.get('HLR Result', '')).strip().lower()
-            if hlr_result not in ['yes', 'no', 'n/a']:
-                hlr_result = 'yes'
-
-            llv_result = str(row.get('LLV Result', '')).strip().lower()
-            if llv_result not in ['yes', 'no', 'n/a']:
-                llv_result = 'yes'
-
-            status_value = str(row.get('Status', '')).strip().lower()
-            if status_value not in DatasetDeliveryStatus._value2member_map_:
-                status_value = DatasetDeliveryStatus.ACCEPTED.value
-
-            forwarding_status_value = str(row.get('Forwarding Status', '')).strip().lower()
-            if forwarding_status_value not in DatasetForwardingStatus._value2member_map_:
-                forwarding_status_value = DatasetForwardingStatus.SUCCESS.value
-
-            def parse_int(value, default=None):
-                if pd.isna(value):
-                    return default
-                try:
-                    return int(value)
-                except Exception:
-                    return default
-
-            dataset_delivery_data = {
-                'id_dataset_order': dataset_order_id,
-                'delivery_code': delivery_code,
-                'delivered_on': delivered_on.to_pydatetime(),
-                'hlr_result': hlr_result,
-                'llv_result': llv_result,
-                'criteria_met': parse_bool(row.get('Criteria Met'), True),
-                'status': status_value,
-                'retry_count': parse_int(row.get('Retry Count'), 0),
-                'dispute_reason': None if pd.isna(row.get('Dispute Reason')) else str(row.get('Dispute Reason')).strip(),
-                'api_code': parse_int(row.get('API Code')),
-                'forwarding_status': forwarding_status_value,
-                'forwarding_notes': None if pd.isna(row.get('Forwarding Notes')) else str(row.get('Forwarding Notes')).strip(),
-            }
-
-            dataset_delivery = DatasetOrderDelivery(**dataset_delivery_data)
-            db_session.add(dataset_delivery)
-            created += 1
-
-        if created:
+        frame = pd.DataFrame(index=df.index)
+        frame['delivery_code'] = to_str(get_csv_column(df, 'Delivery Code'))
+        frame = skip_rows(
+            frame,
+            frame['delivery_code'].isna(),
+            'Warning: Delivery Code missing, skipping delivery row',
+        )
+        frame = skip_rows(
+            frame,
+            frame['delivery_code'] == '',
+            'Warning: Blank Delivery Code encountered, skipping delivery row',
+        )
+
+        frame = skip_existing(db_session, DatasetOrderDelivery, frame, 'delivery_code', 'dataset order delivery')
+
+        order_codes = get_csv_column(df, 'Order Code')
+        frame['id_dataset_order'] = map_ids(order_codes.loc[frame.index], order_map)
+        frame = skip_rows(
+            frame,
+            frame['id_dataset_order'].isna(),
+            lambda row: f"Warning: Dataset order with code '{order_codes[row.name]}' not found, skipping delivery {row['delivery_code']}",
+        )
+
+        rows = df.loc[frame.index]
+        frame['delivered_on'] = to_datetime(get_csv_column(rows, 'Delivered On'))
+        frame = skip_rows(
+            frame,
+            frame['delivered_on'].isna(),
+            lambda row: f"Warning: Delivered On missing for delivery {row['delivery_code']}, skipping",
+        )
+        rows = df.loc[frame.index]
+
+        frame['hlr_result'] = to_choice(get_csv_column(rows, 'HLR Result'), ['yes', 'no', 'n/a'], default='yes')
+        frame['llv_result'] = to_choice(get_csv_column(rows, 'LLV Result'), ['yes', 'no', 'n/a'], default='yes')
+        frame['criteria_met'] = fill_missing(
+            to_bool(get_csv_column(rows, 'Criteria Met'), false_values=FALSE_VALUES, default=True),
+            True,
+        )
+        frame['status'] = to_choice(
+            get_csv_column(rows, 'Status'),
+            DatasetDeliveryStatus._value2member_map_,
+            default=DatasetDeliveryStatus.ACCEPTED.value,
+        )
+        frame['retry_count'] = fill_missing(to_int(get_csv_column(rows, 'Retry Count'), default=0), 0)
+        frame['dispute_reason'] = to_str(get_csv_column(rows, 'Dispute Reason'))
+        frame['api_code'] = to_int(get_csv_column(rows, 'API Code'))
+        frame['forwarding_status'] = to_choice(
+            get_csv_column(rows, 'Forwarding Status'),
+            DatasetForwardingStatus._value2member_map_,
+            default=DatasetForwardingStatus.SUCCESS.value,
+        )
+        frame['forwarding_notes'] = to_str(get_csv_column(rows, 'Forwarding Notes'))
+
+        total_rows = bulk_insert(db_session, DatasetOrderDelivery, frame)
+        if total_rows:
             db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {created} dataset order deliveries into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
+@bulk_loader(LiveLeadOrder, 'live lead orders', csv_files=())
 def load_live_lead_orders():
     """Seed representative live lead orders for mock API scenarios."""
 
@@ -1964,7 +1476,7 @@ def load_live_lead_orders():
     try:
         if db_session.query(LiveLeadOrder).count():
             print('Live lead orders already exist; skipping live lead order seed')
-            return
+            return None
 
         product_ids = [
             row[0] for row in db_session.query(Product.id).order_by(Product.id).all()
@@ -1975,10 +1487,10 @@ def load_live_lead_orders():
 
         if not product_ids:
             print('No products available; skipping live lead order seed')
-            return
+            return None
         if len(user_ids) < 2:
             print('Need at least two users to map buyer/seller; skipping live lead order seed')
-            return
+            return None
 
         now = datetime.utcnow()
         today = now.date()
@@ -2056,7 +1568,7 @@ def load_live_lead_orders():
                 return ordered_on + timedelta(days=offset)
             return None
 
-        created = 0
+        rows = []
         for config in status_configs:
             for idx in range(15):
                 order_code = f'{config["code_prefix"]}{idx+1:04d}'
@@ -2065,11 +1577,11 @@ def load_live_lead_orders():
                 start_date = compute_start_date(config, ordered_on, idx)
                 end_date = compute_end_date(config, ordered_on, start_date)
                 leads_delivered = int(leads_ordered * config['leads_ratio'])
-                order_data = {
+                rows.append({
                     'order_code': order_code,
-                    'product_id': product_ids[(idx + created) % len(product_ids)],
-                    'buyer_id': user_ids[(idx + created) % len(user_ids)],
-                    'seller_id': user_ids[(idx + created + 1) % len(user_ids)],
+                    'product_id': product_ids[(idx + len(rows)) % len(product_ids)],
+                    'buyer_id': user_ids[(idx + len(rows)) % len(user_ids)],
+                    'seller_id': user_ids[(idx + len(rows) + 1) % len(user_ids)],
                     'ordered_on': ordered_on,
                     'leads_ordered': leads_ordered,
                     'leads_delivered': leads_delivered,
@@ -2083,19 +1595,17 @@ def load_live_lead_orders():
                     'status': config['status'],
                     'start_date': start_date,
                     'end_date': end_date,
-                }
-
-                order = LiveLeadOrder(**order_data)
-                db_session.add(order)
-                created += 1
+                })
 
-        if created:
+        total_rows = bulk_insert(db_session, LiveLeadOrder, pd.DataFrame(rows))
+        if total_rows:
             db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {created} live lead orders into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
+@bulk_loader(LiveLeadDeliverySchedule, 'live lead delivery schedules', csv_files=())
 def load_live_lead_delivery_schedules():
     """Create recurring delivery slots for seeded live lead orders."""
 
@@ -2103,12 +1613,12 @@ def load_live_lead_delivery_schedules():
     try:
         if db_session.query(LiveLeadDeliverySchedule).count():
             print('Live lead delivery schedules already exist; skipping schedule seed')
-            return
+            return None
 
         orders = db_session.query(LiveLeadOrder).all()
         if not orders:
             print('No live lead orders available; skipping delivery schedule seed')
-            return
+            return None
 
         status_based_templates = {
             LiveLeadOrderStatus.AWAITING_START_DATE.value: [
@@ -2130,29 +1640,29 @@ def load_live_lead_delivery_schedules():
             ],
         }
 
-        created = 0
+        rows = []
         for order in orders:
             configs = status_based_templates.get(order.status) or [
                 {'day': LiveLeadDeliveryDay.MONDAY.value, 'start': time_of_day(9, 0), 'end': time_of_day(17, 0), 'capacity': 100},
             ]
             for config in configs:
-                schedule = LiveLeadDeliverySchedule(
-                    order_id=order.id,
-                    day_of_week=config['day'],
-                    start_time=config['start'],
-                    end_time=config['end'],
-                    capacity=config['capacity'],
-                )
-                db_session.add(schedule)
-                created += 1
-
-        if created:
+                rows.append({
+                    'order_id': order.id,
+                    'day_of_week': config['day'],
+                    'start_time': config['start'],
+                    'end_time': config['end'],
+                    'capacity': config['capacity'],
+                })
+
+        total_rows = bulk_insert(db_session, LiveLeadDeliverySchedule, pd.DataFrame(rows))
+        if total_rows:
             db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {created} live lead delivery schedules into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
+@bulk_loader(LiveLeadOrderStatusHistory, 'live lead status history rows', csv_files=())
 def load_live_lead_order_status_history():
     """Backfill lifecycle transitions for seeded live lead orders."""
 
@@ -2160,12 +1670,12 @@ def load_live_lead_order_status_history():
     try:
         if db_session.query(LiveLeadOrderStatusHistory).count():
             print('Live lead order status history already exists; skipping history seed')
-            return
+            return None
 
         orders = {order.order_code: order for order in db_session.query(LiveLeadOrder).all()}
         if not orders:
             print('No live lead orders available; skipping status history seed')
-            return
+            return None
 
         user_row = db_session.query(User.id).order_by(User.id).first()
         changed_by = user_row[0] if user_row else None
@@ -2190,7 +1700,7 @@ def load_live_lead_order_status_history():
             ],
         }
 
-        created = 0
+        rows = []
         for order in orders.values():
             entries = status_templates.get(order.status)
             if not entries:
@@ -2199,23 +1709,23 @@ def load_live_lead_order_status_history():
             base_datetime = datetime.combine(order.ordered_on, time_of_day(9, 0)) if order.ordered_on else datetime.utcnow()
             for entry in entries:
                 changed_at = base_datetime + timedelta(days=entry.get('days_after_order', 0))
-                history = LiveLeadOrderStatusHistory(
-                    order_id=order.id,
-                    status=entry['status'],
-                    changed_at=changed_at,
-                    changed_by=changed_by,
-                    remarks=entry.get('remarks'),
-                )
-                db_session.add(history)
-                created += 1
-
-        if created:
+                rows.append({
+                    'order_id': order.id,
+                    'status': entry['status'],
+                    'changed_at': changed_at,
+                    'changed_by': changed_by,
+                    'remarks': entry.get('remarks'),
+                })
+
+        total_rows = bulk_insert(db_session, LiveLeadOrderStatusHistory, pd.DataFrame(rows))
+        if total_rows:
             db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {created} live lead status history rows into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
+@bulk_loader(DailyLeadDeliveryLog, 'daily live lead delivery log rows', csv_files=())
 def load_daily_lead_delivery_logs():
     """Generate mock daily delivery summaries for the seeded live lead orders."""
 
@@ -2223,12 +1733,12 @@ def load_daily_lead_delivery_logs():
     try:
         if db_session.query(DailyLeadDeliveryLog).count():
             print('Daily live lead delivery logs already exist; skipping delivery log seed')
-            return
+            return None
 
         orders = {order.order_code: order for order in db_session.query(LiveLeadOrder).all()}
         if not orders:
             print('No live lead orders available; skipping delivery log seed')
-            return
+            return None
 
         log_templates = {
             LiveLeadOrderStatus.AWAITING_START_DATE.value: [],
@@ -2246,7 +1756,7 @@ def load_daily_lead_delivery_logs():
             ],
         }
 
-        created = 0
+        rows = []
         for order in orders.values():
             entries = log_templates.get(order.status)
             if not entries:
@@ -2255,25 +1765,29 @@ def load_daily_lead_delivery_logs():
             base_date = order.start_date or order.ordered_on or datetime.utcnow().date()
             for entry in entries:
                 log_date = base_date + timedelta(days=entry.get('days_after_start', 0))
-                log_row = DailyLeadDeliveryLog(
-                    order_id=order.id,
-                    date=log_date,
-                    leads_sent=entry['sent'],
-                    success_count=entry['success'],
-                    failure_count=entry['failed'],
-                    delivery_status=entry['status'],
-                )
-                db_session.add(log_row)
-                created += 1
-
-        if created:
+                rows.append({
+                    'order_id': order.id,
+                    'date': log_date,
+                    'leads_sent': entry['sent'],
+                    'success_count': entry['success'],
+                    'failure_count': entry['failed'],
+                    'delivery_status': entry['status'],
+                })
+
+        total_rows = bulk_insert(db_session, DailyLeadDeliveryLog, pd.DataFrame(rows))
+        if total_rows:
             db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {created} daily live lead delivery log rows into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
+@bulk_loader(Dispute, 'disputes', depends_on=[Company, User, Order, Product])
 def load_disputes():
+    df = read_seed_csv('disputes.csv', 'disputes')
+    if df is None:
+        return None
+
     column_mapping = {
         'Title': 'title',
         'Description': 'description',
@@ -2295,17 +1809,6 @@ def load_disputes():
         'Seller ID': 'id_seller',
     }
 
-    csv_path = 'data/csv/disputes.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping disputes load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping disputes load")
-        return
-
     db_session = SessionLocal()
     try:
         company_ids = {comp.id for comp in db_session.query(Company).all()}
@@ -2326,201 +1829,109 @@ def load_disputes():
             'id_complainant_user',
         ]
 
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading disputes", "disputes")
-
-            dispute_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    if db_column in ['raised_date', 'resolution_date']:
-                        try:
-                            parsed_value = pd.to_datetime(value)
-                            dispute_data[db_column] = parsed_value
-                        except Exception:
-                            dispute_data[db_column] = None
-                    elif db_column in ['disputed_amount', 'refund_amount', 'compensation_amount']:
-                        try:
-                            clean_value = str(value).replace('£', '').replace(',', '').strip()
-                            dispute_data[db_column] = float(clean_value)
-                        except Exception:
-                            dispute_data[db_column] = 0.0 if db_column == 'disputed_amount' else None
-                    elif db_column in [
-                        'id_order',
-                        'id_product',
-                        'id_complainant_company',
-                        'id_respondent_company',
-                        'id_complainant_user',
-                        'id_buyer',
-                        'id_seller',
-                    ]:
-                        try:
-                            dispute_data[db_column] = int(value)
-                        except Exception:
-                            dispute_data[db_column] = None
-                    else:
-                        dispute_data[db_column] = value
-
-            missing_fields = [field for field in required_fields if not dispute_data.get(field)]
-            if missing_fields:
-                print(
-                    "Warning: Missing required fields {} for dispute, skipping".format(
-                        ', '.join(missing_fields)
-                    )
-                )
-                continue
-
-            validation_checks = [
-                ('id_complainant_company', company_ids, 'Complainant Company', True),
-                ('id_respondent_company', company_ids, 'Respondent Company', True),
-                ('id_complainant_user', user_ids, 'Complainant User', True),
-                ('id_buyer', buyer_ids, 'Buyer', False),
-                ('id_order', order_ids, 'Order', False),
-                ('id_product', product_ids, 'Product', False),
-            ]
-
-            skip_record = False
-            for field_name, valid_ids, entity_name, is_required in validation_checks:
-                entity_id = dispute_data.get(field_name)
-
-                if entity_id is None:
-                    if is_required:
-                        print(f"Warning: No {entity_name} ID provided, skipping dispute")
-                        skip_record = True
-                    continue
-
-                if valid_ids and entity_id not in valid_ids:
-                    print(
-                        f"Warning: {entity_name} ID {entity_id} not found, skipping dispute"
-                    )
-                    skip_record = True
-                    break
-
-            if skip_record:
-                continue
-
-            dispute = Dispute(**dispute_data)
-            db_session.add(dispute)
+        frame = map_columns(Dispute, df, column_mapping, {
+            'raised_date': to_datetime,
+            'resolution_date': to_datetime,
+            'disputed_amount': partial(to_float, default=0.0, strip='£,'),
+            'refund_amount': partial(to_float, strip='£,'),
+            'compensation_amount': partial(to_float, strip='£,'),
+            'id_order': to_int,
+            'id_product': to_int,
+            'id_complainant_company': to_int,
+            'id_respondent_company': to_int,
+            'id_complainant_user': to_int,
+            'id_buyer': to_int,
+            'id_seller': to_int,
+        })
+
+        # A required field is missing if the CSV has no value for it (before
+        # the model defaults), or one that converts to a falsy value
+        csv_columns = {db_column: csv_column for csv_column, db_column in column_mapping.items()}
+        missing = pd.DataFrame({
+            field: get_csv_column(df, csv_columns[field]).isna() | (
+                get_csv_column(frame, field).map(lambda value: pd.isna(value) or not value).astype(bool)
+            )
+            for field in required_fields
+        })
+        frame = skip_rows(
+            frame,
+            missing.any(axis=1),
+            lambda row: "Warning: Missing required fields {} for dispute, skipping".format(
+                ', '.join(field for field in required_fields if missing.at[row.name, field])
+            ),
+        )
+
+        validation_checks = [
+            ('id_complainant_company', company_ids, 'Complainant Company', True),
+            ('id_respondent_company', company_ids, 'Respondent Company', True),
+            ('id_complainant_user', user_ids, 'Complainant User', True),
+            ('id_buyer', buyer_ids, 'Buyer', False),
+            ('id_order', order_ids, 'Order', False),
+            ('id_product', product_ids, 'Product', False),
+        ]
+        for field_name, valid_ids, entity_name, is_required in validation_checks:
+            frame[field_name] = get_csv_column(frame, field_name)
+            frame = skip_invalid_ids(frame, field_name, valid_ids, entity_name, 'dispute', is_required)
 
+        total_rows = bulk_insert(db_session, Dispute, frame)
         db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} disputes into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
+@bulk_loader(Country, 'countries')
 def load_countries():
-    column_mapping = {
+    df = read_seed_csv('countries.csv', 'countries')
+    if df is None:
+        return None
+
+    frame = map_columns(Country, df, {
         'Name': 'name',
         'Code': 'code',
         'Flag Emoji': 'flag_emoji',
         'Icon ID': 'id_icon',
-    }
-
-    csv_path = 'data/csv/countries.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping countries load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping countries load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading countries", "countries")
-
-            country_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    country_data[db_column] = value
-
-            country = Country(**country_data)
-            db_session.add(country)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} countries into the database")
-    finally:
-        db_session.close()
+    })
+    return insert_frame(Country, frame)
 
 
+@bulk_loader(State, 'states', depends_on=[Country])
 def load_states():
-    column_mapping = {
-        'Name': 'name',
-        'Code': 'code',
-        'Country Name': 'country_name',  # We'll resolve this to id_country
-    }
-
-    csv_path = 'data/csv/states.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping states load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping states load")
-        return
+    df = read_seed_csv('states.csv', 'states')
+    if df is None:
+        return None
 
     db_session = SessionLocal()
     try:
         # Get countries for lookup
         countries = {country.name: country.id for country in db_session.query(Country).all()}
 
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading states", "states")
-
-            # Map basic fields
-            state_data = {}
-            for csv_column, db_column in column_mapping.items():
-                if csv_column != 'Country Name':  # Handle country lookup separately
-                    value = row.get(csv_column)
-                    if pd.notna(value):
-                        state_data[db_column] = value
-
-            # Resolve country name to ID
-            country_name = row.get('Country Name')
-            if pd.notna(country_name) and country_name in countries:
-                state_data['id_country'] = countries[country_name]
-            else:
-                print(f"Warning: Country '{country_name}' not found, skipping state")
-                continue
-
-            # Remove the temporary field
-            state_data.pop('country_name', None)
-
-            state = State(**state_data)
-            db_session.add(state)
-
+        frame = map_columns(State, df, {
+            'Name': 'name',
+            'Code': 'code',
+        })
+
+        # Resolve country name to ID
+        country_names = get_csv_column(df, 'Country Name')
+        frame['id_country'] = map_ids(country_names, countries)
+        frame = skip_rows(
+            frame,
+            frame['id_country'].isna(),
+            lambda row: f"Warning: Country '{country_names[row.name]}' not found, skipping state",
+        )
+
+        total_rows = bulk_insert(db_session, State, frame)
         db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} states into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
+@bulk_loader(Address, 'addresses', depends_on=[Country, State])
 def load_addresses():
-    column_mapping = {
-        'Street Address': 'street_address',
-        'Address Line 2': 'address_line_2',
-        'City': 'city',
-        'Postal Code': 'postal_code',
-        'Country Name': 'country_name',  # We'll resolve this to id_country
-        'State Name': 'state_name',      # We'll resolve this to id_state
-    }
-
-    csv_path = 'data/csv/addresses.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping addresses load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping addresses load")
-        return
+    df = read_seed_csv('addresses.csv', 'addresses')
+    if df is None:
+        return None
 
     db_session = SessionLocal()
     try:
@@ -2528,359 +1939,251 @@ def load_addresses():
         countries = {country.name: country.id for country in db_session.query(Country).all()}
         states = {state.name: state.id for state in db_session.query(State).all()}
 
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading addresses", "addresses")
-
-            # Map basic fields
-            address_data = {}
-            for csv_column, db_column in column_mapping.items():
-                if csv_column not in ['Country Name', 'State Name']:  # Handle lookups separately
-                    value = row.get(csv_column)
-                    if pd.notna(value):
-                        address_data[db_column] = value
-
-            # Resolve country name to ID
-            country_name = row.get('Country Name')
-            if pd.notna(country_name) and country_name in countries:
-                address_data['id_country'] = countries[country_name]
-            else:
-                print(f"Warning: Country '{country_name}' not found, skipping address")
-                continue
-
-            # Resolve state name to ID (optional)
-            state_name = row.get('State Name')
-            if pd.notna(state_name) and state_name in states:
-                address_data['id_state'] = states[state_name]
-            # Note: id_state is nullable, so we don't skip if state is not found
-
-            # Remove the temporary fields
-            address_data.pop('country_name', None)
-            address_data.pop('state_name', None)
-
-            address = Address(**address_data)
-            db_session.add(address)
-
+        frame = map_columns(Address, df, {
+            'Street Address': 'street_address',
+            'Address Line 2': 'address_line_2',
+            'City': 'city',
+            'Postal Code': 'postal_code',
+        })
+
+        # Resolve country name to ID
+        country_names = get_csv_column(df, 'Country Name')
+        frame['id_country'] = map_ids(country_names, countries)
+        frame = skip_rows(
+            frame,
+            frame['id_country'].isna(),
+            lambda row: f"Warning: Country '{country_names[row.name]}' not found, skipping address",
+        )
+
+        # Resolve state name to ID (optional)
+        # Note: id_state is nullable, so we don't skip if state is not found
+        frame['id_state'] = map_ids(get_csv_column(df, 'State Name').loc[frame.index], states)
+
+        total_rows = bulk_insert(db_session, Address, frame)
         db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} addresses into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
+@bulk_loader(Company, 'companies', depends_on=[Address])
 def load_companies():
-    column_mapping = {
-        'Name': 'name',
-        'Registration Number': 'registration_number',
-        'ICO Number': 'ico_number',
-        'ICO Verification Status': 'ico_verification_status',
-        'ICO Verified Date': 'ico_verified_date',
-        'VAT Number': 'vat_number',
-        'VAT Verification Status': 'vat_verification_status',
-        'VAT Verified Date': 'vat_verified_date',
-        'Status': 'status',
-        'Phone': 'phone',
-        'GDPR Fines': 'gdpr_fines',
-        'Follower Count': 'follower_count',
-        'Approval Status': 'approval_status',
-        'Signed Up Date': 'signed_up_date',
-        'Address ID': 'id_address',  # Direct address ID reference
-    }
-
-    csv_path = 'data/csv/companies.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping companies load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping companies load")
-        return
+    df = read_seed_csv('companies.csv', 'companies')
+    if df is None:
+        return None
 
     db_session = SessionLocal()
     try:
         # Get addresses for validation
         address_ids = {addr.id for addr in db_session.query(Address).all()}
 
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading companies", "companies")
-
-            company_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle date fields
-                    if db_column in ['ico_verified_date', 'vat_verified_date', 'signed_up_date']:
-                        try:
-                            company_data[db_column] = pd.to_datetime(value)
-                        except:
-                            company_data[db_column] = None
-                    # Handle boolean fields
-                    elif db_column == 'gdpr_fines':
-                        company_data[db_column] = str(value).lower() in ['true', '1', 'yes', 'y']
-                    # Handle integer fields
-                    elif db_column == 'follower_count':
-                        try:
-                            company_data[db_column] = int(value)
-                        except:
-                            company_data[db_column] = 0
-                    else:
-                        company_data[db_column] = value
-
-            # Validate address ID exists
-            address_id = company_data.get('id_address')
-            if address_id and address_id not in address_ids:
-                print(f"Warning: Address ID {address_id} not found, skipping company")
-                continue
-            elif not address_id:
-                print(f"Warning: No address ID provided, skipping company")
-                continue
-
-            company = Company(**company_data)
-            db_session.add(company)
-
+        frame = map_columns(Company, df, {
+            'Name': 'name',
+            'Registration Number': 'registration_number',
+            'ICO Number': 'ico_number',
+            'ICO Verification Status': 'ico_verification_status',
+            'ICO Verified Date': 'ico_verified_date',
+            'VAT Number': 'vat_number',
+            'VAT Verification Status': 'vat_verification_status',
+            'VAT Verified Date': 'vat_verified_date',
+            'Status': 'status',
+            'Phone': 'phone',
+            'GDPR Fines': 'gdpr_fines',
+            'Follower Count': 'follower_count',
+            'Approval Status': 'approval_status',
+            'Signed Up Date': 'signed_up_date',
+            'Address ID': 'id_address',  # Direct address ID reference
+        }, {
+            'ico_verified_date': to_datetime,
+            'vat_verified_date': to_datetime,
+            'signed_up_date': to_datetime,
+            'gdpr_fines': to_bool,
+            'follower_count': partial(to_int, default=0),
+            'id_address': to_int,
+        })
+
+        # Validate address ID exists
+        frame['id_address'] = get_csv_column(frame, 'id_address')
+        frame = skip_rows(
+            frame,
+            frame['id_address'].notna() & ~frame['id_address'].isin(address_ids),
+            lambda row: f"Warning: Address ID {row['id_address']} not found, skipping company",
+        )
+        frame = skip_rows(
+            frame,
+            frame['id_address'].isna(),
+            "Warning: No address ID provided, skipping company",
+        )
+
+        total_rows = bulk_insert(db_session, Company, frame)
         db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} companies into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
+@bulk_loader(CompanyUser, 'company users', depends_on=[Company, User])
 def load_company_users():
-    column_mapping = {
-        'Position': 'position',
-        'Is Primary Contact': 'is_primary_contact',
-        'Status': 'status',
-        'Joined Date': 'joined_date',
-        'Company ID': 'id_company',  # Direct company ID reference
-        'User ID': 'id_user',        # Direct user ID reference
-    }
-
-    csv_path = 'data/csv/company_users.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping company users load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping company users load")
-        return
+    df = read_seed_csv('company_users.csv', 'company users')
+    if df is None:
+        return None
 
     db_session = SessionLocal()
     try:
         # Get companies and users for validation
         company_ids = {comp.id for comp in db_session.query(Company).all()}
+        user_ids = {user.id for user in db_session.query(User).all()}
 
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading company users", "company users")
-
-            company_user_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle date fields
-                    if db_column == 'joined_date':
-                        try:
-                            company_user_data[db_column] = pd.to_datetime(value)
-                        except:
-                            company_user_data[db_column] = None
-                    # Handle boolean fields
-                    elif db_column == 'is_primary_contact':
-                        company_user_data[db_column] = str(value).lower() in ['true', '1', 'yes', 'y']
-                    else:
-                        company_user_data[db_column] = value
-
-            # Validate company ID exists
-            company_id = company_user_data.get('id_company')
-            if company_id and company_id not in company_ids:
-                print(f"Warning: Company ID {company_id} not found, skipping company user")
-                continue
-            elif not company_id:
-                print(f"Warning: No company ID provided, skipping company user")
-                continue
-
-            # Validate user ID exists
-            user_id = company_user_data.get('id_user')
-            if user_id and user_id not in user_ids:
-                print(f"Warning: User ID {user_id} not found, skipping company user")
-                continue
-            elif not user_id:
-                print(f"Warning: No user ID provided, skipping company user")
-                continue
-
-            company_user = CompanyUser(**company_user_data)
-            db_session.add(company_user)
+        frame = map_columns(CompanyUser, df, {
+            'Position': 'position',
+            'Is Primary Contact': 'is_primary_contact',
+            'Status': 'status',
+            'Joined Date': 'joined_date',
+            'Company ID': 'id_company',  # Direct company ID reference
+            'User ID': 'id_user',        # Direct user ID reference
+        }, {
+            'joined_date': to_datetime,
+            'is_primary_contact': to_bool,
+            'id_company': to_int,
+            'id_user': to_int,
+        })
+
+        # Validate company and user IDs exist
+        id_checks = [
+            ('id_company', company_ids, 'Company', 'company'),
+            ('id_user', user_ids, 'User', 'user'),
+        ]
+        for db_column, valid_ids, entity_name, missing_name in id_checks:
+            frame[db_column] = get_csv_column(frame, db_column)
+            frame = skip_rows(
+                frame,
+                frame[db_column].notna() & ~frame[db_column].isin(valid_ids),
+                lambda row: f"Warning: {entity_name} ID {row[db_column]} not found, skipping company user",
+            )
+            frame = skip_rows(
+                frame,
+                frame[db_column].isna(),
+                f"Warning: No {missing_name} ID provided, skipping company user",
+            )
 
+        total_rows = bulk_insert(db_session, CompanyUser, frame)
         db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} company users into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
+def _skip_invalid_people(frame, company_ids, item_name):
+    # Buyers and sellers need a name, an email and an existing company
+    for db_column, field_name in [('name', 'name'), ('email', 'email')]:
+        values = get_csv_column(frame, db_column)
+        frame = skip_rows(
+            frame,
+            values.isna() | (values == ''),
+            f"Warning: No {field_name} provided, skipping {item_name}",
+        )
+    frame['id_company'] = get_csv_column(frame, 'id_company')
+    frame = skip_rows(
+        frame,
+        frame['id_company'].isna() | (frame['id_company'] == 0),
+        f"Warning: No Company ID provided, skipping {item_name}",
+    )
+    return skip_rows(
+        frame,
+        ~frame['id_company'].isin(company_ids),
+        lambda row: f"Warning: Company ID {row['id_company']} not found, skipping {item_name}",
+    )
+
+
+@bulk_loader(Buyer, 'buyers')
 def load_buyers():
-    column_mapping = {
-        'Name': 'name',
-        'Email': 'email',
-        'User Status': 'user_status',
-        'Company ID': 'id_company',
-        'Status': 'status',
-        'Total Purchases': 'total_purchases',
-        'Total Disputes': 'total_disputes',
-        'First Purchase Date': 'first_purchase_date',
-        'Last Purchase Date': 'last_purchase_date',
-        'Notes': 'notes',
-    }
-
-    csv_path = 'data/csv/buyers.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping buyers load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping buyers load")
-        return
+    df = read_seed_csv('buyers.csv', 'buyers')
+    if df is None:
+        return None
 
     db_session = SessionLocal()
     try:
         company_ids = {company.id for company in db_session.query(Company).all()}
 
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading buyers", "buyers")
-
-            buyer_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    if db_column == 'id_company':
-                        try:
-                            buyer_data[db_column] = int(value)
-                        except Exception:
-                            buyer_data[db_column] = None
-                    elif db_column in ['total_purchases', 'total_disputes']:
-                        try:
-                            buyer_data[db_column] = int(value)
-                        except Exception:
-                            buyer_data[db_column] = 0
-                    elif db_column in ['first_purchase_date', 'last_purchase_date']:
-                        try:
-                            buyer_data[db_column] = pd.to_datetime(value)
-                        except Exception:
-                            buyer_data[db_column] = None
-                    else:
-                        buyer_data[db_column] = str(value).strip()
-
-            company_id = buyer_data.get('id_company')
-            name = buyer_data.get('name')
-            email = buyer_data.get('email')
-
-            if not name:
-                print("Warning: No name provided, skipping buyer")
-                continue
-            if not email:
-                print("Warning: No email provided, skipping buyer")
-                continue
-            if not company_id:
-                print("Warning: No Company ID provided, skipping buyer")
-                continue
-            if company_id not in company_ids:
-                print(f"Warning: Company ID {company_id} not found, skipping buyer")
-                continue
-
-            buyer = Buyer(**buyer_data)
-            db_session.add(buyer)
-
+        frame = map_columns(Buyer, df, {
+            'Name': 'name',
+            'Email': 'email',
+            'User Status': 'user_status',
+            'Company ID': 'id_company',
+            'Status': 'status',
+            'Total Purchases': 'total_purchases',
+            'Total Disputes': 'total_disputes',
+            'First Purchase Date': 'first_purchase_date',
+            'Last Purchase Date': 'last_purchase_date',
+            'Notes': 'notes',
+        }, {
+            'name': to_str,
+            'email': to_str,
+            'user_status': to_str,
+            'id_company': to_int,
+            'status': to_str,
+            'total_purchases': partial(to_int, default=0),
+            'total_disputes': partial(to_int, default=0),
+            'first_purchase_date': to_datetime,
+            'last_purchase_date': to_datetime,
+            'notes': to_str,
+        })
+        frame = _skip_invalid_people(frame, company_ids, 'buyer')
+
+        total_rows = bulk_insert(db_session, Buyer, frame)
         db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} buyers into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
-
-
+@bulk_loader(Seller, 'sellers')
 def load_sellers():
-    column_mapping = {
-        'Name': 'name',
-        'Email': 'email',
-        'Position': 'position',
-        'User Status': 'user_status',
-        'Seller Status': 'seller_status',
-        'Company ID': 'id_company',
-        'Total Listings': 'total_listings',
-        'Total Sales': 'total_sales',
-        'Rating': 'rating',
-    }
-
-    csv_path = 'data/csv/sellers.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping sellers load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping sellers load")
-        return
+    df = read_seed_csv('sellers.csv', 'sellers')
+    if df is None:
+        return None
 
     db_session = SessionLocal()
     try:
         company_ids = {company.id for company in db_session.query(Company).all()}
 
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading sellers", "sellers")
-
-            seller_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    if db_column == 'id_company':
-                        try:
-                            seller_data[db_column] = int(value)
-                        except Exception:
-                            seller_data[db_column] = None
-                    elif db_column in ['total_listings', 'total_sales']:
-                        try:
-                            seller_data[db_column] = int(value)
-                        except Exception:
-                            seller_data[db_column] = 0
-                    elif db_column == 'rating':
-                        try:
-                            seller_data[db_column] = float(value)
-                        except Exception:
-                            seller_data[db_column] = None
-                    else:
-                        seller_data[db_column] = str(value).strip()
-
-            company_id = seller_data.get('id_company')
-            name = seller_data.get('name')
-            email = seller_data.get('email')
-
-            if not name:
-                print("Warning: No name provided, skipping seller")
-                continue
-            if not email:
-                print("Warning: No email provided, skipping seller")
-                continue
-            if not company_id:
-                print("Warning: No Company ID provided, skipping seller")
-                continue
-            if company_id not in company_ids:
-                print(f"Warning: Company ID {company_id} not found, skipping seller")
-                continue
-
-            seller = Seller(**seller_data)
-            db_session.add(seller)
-
+        frame = map_columns(Seller, df, {
+            'Name': 'name',
+            'Email': 'email',
+            'Position': 'position',
+            'User Status': 'user_status',
+            'Seller Status': 'seller_status',
+            'Company ID': 'id_company',
+            'Total Listings': 'total_listings',
+            'Total Sales': 'total_sales',
+            'Rating': 'rating',
+        }, {
+            'name': to_str,
+            'email': to_str,
+            'position': to_str,
+            'user_status': to_str,
+            'seller_status': to_str,
+            'id_company': to_int,
+            'total_listings': partial(to_int, default=0),
+            'total_sales': partial(to_int, default=0),
+            'rating': to_float,
+        })
+        frame = _skip_invalid_people(frame, company_ids, 'seller')
+
+        total_rows = bulk_insert(db_session, Seller, frame)
         db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} sellers into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
-
-
+@bulk_loader(DDUser, 'DD users')
 def load_dd_users():
-    column_mapping = {
+    df = read_seed_csv('dd_users.csv', 'dd users')
+    if df is None:
+        return None
+
+    frame = map_columns(DDUser, df, {
         'Name': 'name',
         'Email': 'email',
         'Role': 'role',
@@ -2900,200 +2203,29 @@ def load_dd_users():
         'Top Lead Sources': 'top_lead_sources',
         'Most Checked Source': 'most_checked_source',
         'Lowest Performing Score': 'lowest_performing_score',
-    }
-
-    csv_path = 'data/csv/dd_users.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping dd users load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping dd users load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading DD users", "dd users")
-
-            dd_user_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.isna(value):
-                    continue
-
-                if db_column in [
-                    'total_checks',
-                    'total_verifications',
-                    'total_dd_verify',
-                    'total_kyc_verify',
-                    'verified_leads',
-                    'non_compliant_leads',
-                    'rejected_leads',
-                ]:
-                    try:
-                        dd_user_data[db_column] = int(value)
-                    except Exception:
-                        dd_user_data[db_column] = 0
-                elif db_column in ['amount_spend', 'credits_remaining', 'lowest_performing_score']:
-                    try:
-                        dd_user_data[db_column] = float(value)
-                    except Exception:
-                        dd_user_data[db_column] = 0.0
-                elif db_column == 'last_kyc_verify':
-                    try:
-                        dd_user_data[db_column] = pd.to_datetime(value)
-                    except Exception:
-                        dd_user_data[db_column] = None
-                elif db_column in ['lead_source_details', 'top_lead_sources'] and isinstance(value, str):
-                    try:
-                        dd_user_data[db_column] = json.loads(value)
-                    except json.JSONDecodeError:
-                        dd_user_data[db_column] = None
-                else:
-                    dd_user_data[db_column] = value
-
-            dd_user = DDUser(**dd_user_data)
-            db_session.add(dd_user)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} DD users into the database")
-    finally:
-        db_session.close()
-    column_mapping = {
-        'Name': 'name',
-        'Email': 'email',
-        'Position': 'position',
-        'User Status': 'user_status',
-        'Seller Status': 'seller_status',
-        'Company ID': 'id_company',
-        'Total Listings': 'total_listings',
-        'Total Sales': 'total_sales',
-        'Rating': 'rating',
-    }
-
-    csv_path = 'data/csv/sellers.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping sellers load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping sellers load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        company_ids = {company.id for company in db_session.query(Company).all()}
-
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading sellers", "sellers")
-
-            seller_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    if db_column == 'id_company':
-                        try:
-                            seller_data[db_column] = int(value)
-                        except Exception:
-                            seller_data[db_column] = None
-                    elif db_column in ['total_listings', 'total_sales']:
-                        try:
-                            seller_data[db_column] = int(value)
-                        except Exception:
-                            seller_data[db_column] = 0
-                    elif db_column == 'rating':
-                        try:
-                            seller_data[db_column] = float(value)
-                        except Exception:
-                            seller_data[db_column] = None
-                    else:
-                        seller_data[db_column] = str(value).strip()
-
-            company_id = seller_data.get('id_company')
-            name = seller_data.get('name')
-            email = seller_data.get('email')
-
-            if not name:
-                print("Warning: No name provided, skipping seller")
-                continue
-            if not email:
-                print("Warning: No email provided, skipping seller")
-                continue
-            if not company_id:
-                print("Warning: No Company ID provided, skipping seller")
-                continue
-            if company_id not in company_ids:
-                print(f"Warning: Company ID {company_id} not found, skipping seller")
-                continue
-
-            seller = Seller(**seller_data)
-            db_session.add(seller)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} sellers into the database")
-    finally:
-        db_session.close()
-
-
+    }, {
+        'total_checks': partial(to_int, default=0),
+        'total_verifications': partial(to_int, default=0),
+        'total_dd_verify': partial(to_int, default=0),
+        'total_kyc_verify': partial(to_int, default=0),
+        'verified_leads': partial(to_int, default=0),
+        'non_compliant_leads': partial(to_int, default=0),
+        'rejected_leads': partial(to_int, default=0),
+        'amount_spend': partial(to_float, default=0.0),
+        'credits_remaining': partial(to_float, default=0.0),
+        'lowest_performing_score': partial(to_float, default=0.0),
+        'last_kyc_verify': to_datetime,
+        'lead_source_details': to_json,
+        'top_lead_sources': to_json,
+    })
+    return insert_frame(DDUser, frame)
+
+
+@bulk_loader(Product, 'products', depends_on=[Company])
 def load_products():
-    column_mapping = {
-        'Name': 'name',
-        'Description': 'description',
-        'Product Type': 'product_type',
-        'Price': 'price',
-        'Pricing Tiers': 'pricing_tiers',
-        'Daily Quantity': 'daily_quantity',
-        'Minimum Quantity': 'minimum_quantity',
-        'Available Leads Next 7 Days': 'available_leads_next_7_days',
-        'Lead Availability Schedule': 'lead_availability_schedule',
-        'Total Records': 'total_records',
-        'Available Records': 'available_records',
-        'Contact Methods': 'contact_methods',
-        'Replacement Policy': 'replacement_policy',
-        'Data Source Name': 'data_source_name',
-        'Listing Period Months': 'listing_period_months',
-        'License Period Months': 'license_period_months',
-        'Usage Limit Type': 'usage_limit_type',
-        'Data Type': 'data_type',
-        'Sale Type': 'sale_type',
-        'Geographic Coverage': 'geographic_coverage',
-        'Restricted Use': 'restricted_use',
-        'Source URL': 'source_url',
-        'Uploaded Date': 'uploaded_date',
-        'TPS Check Status': 'tps_check_status',
-        'MPS Check Status': 'mps_check_status',
-        'HLR Check Status': 'hlr_check_status',
-        'LLV Check Status': 'llv_check_status',
-        'Geo Validation Status': 'geo_validation_status',
-        'Suppression Check Status': 'suppression_check_status',
-        'GDPR Consent Status': 'gdpr_consent_status',
-        'View Count': 'view_count',
-        'Favorite Count': 'favorite_count',
-        'Rating Average': 'rating_average',
-        'Status': 'status',
-        'Company ID': 'id_company',
-        'Category ID': 'id_category',
-        'Sub Category ID': 'id_sub_category',
-        'Selection ID': 'id_selection',
-        'Created By User ID': 'id_created_by_user',
-        'Seller ID': 'id_seller',
-    }
-
-    csv_path = 'data/csv/products.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping products load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping products load")
-        return
+    df = read_seed_csv('products.csv', 'products')
+    if df is None:
+        return None
 
     db_session = SessionLocal()
     try:
@@ -3104,189 +2236,153 @@ def load_products():
         user_ids = {user.id for user in db_session.query(User).all()}
         seller_ids = {seller.id for seller in db_session.query(Seller).all()}
 
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading products", "products")
-
-            product_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    if db_column in ['price', 'rating_average']:
-                        try:
-                            product_data[db_column] = float(value)
-                        except Exception:
-                            product_data[db_column] = None
-                    elif db_column in [
-                        'daily_quantity',
-                        'minimum_quantity',
-                        'available_leads_next_7_days',
-                        'total_records',
-                        'available_records',
-                        'listing_period_months',
-                        'license_period_months',
-                        'view_count',
-                        'favorite_count',
-                        'id_company',
-                        'id_category',
-                        'id_sub_category',
-                        'id_selection',
-                        'id_created_by_user',
-                        'id_seller',
-                    ]:
-                        try:
-                            product_data[db_column] = int(value)
-                        except Exception:
-                            product_data[db_column] = None
-                    elif db_column == 'uploaded_date':
-                        try:
-                            product_data[db_column] = pd.to_datetime(value)
-                        except Exception:
-                            product_data[db_column] = None
-                    elif db_column in ['pricing_tiers', 'lead_availability_schedule']:
-                        if isinstance(value, str):
-                            try:
-                                product_data[db_column] = json.loads(value)
-                            except json.JSONDecodeError:
-                                product_data[db_column] = None
-                        else:
-                            product_data[db_column] = value
-                    else:
-                        product_data[db_column] = value
-
-            validation_checks = [
-                ('id_company', company_ids, 'Company', True),
-                ('id_category', category_ids, 'Category', True),
-                ('id_sub_category', sub_category_ids, 'Sub Category', True),
-                ('id_selection', selection_ids, 'Selection', True),
-                ('id_created_by_user', user_ids, 'Created By User', True),
-                ('id_seller', seller_ids, 'Seller', False),
-            ]
-
-            skip_record = False
-            for field_name, valid_ids, entity_name, is_required in validation_checks:
-                entity_id = product_data.get(field_name)
-                if entity_id is None:
-                    if is_required:
-                        print(f"Warning: No {entity_name} ID provided, skipping product")
-                        skip_record = True
-                        break
-                    continue
-                if valid_ids and entity_id not in valid_ids:
-                    print(f"Warning: {entity_name} ID {entity_id} not found, skipping product")
-                    skip_record = True
-                    break
-
-            if skip_record:
-                continue
+        int_columns = [
+            'daily_quantity',
+            'minimum_quantity',
+            'available_leads_next_7_days',
+            'total_records',
+            'available_records',
+            'listing_period_months',
+            'license_period_months',
+            'view_count',
+            'favorite_count',
+            'id_company',
+            'id_category',
+            'id_sub_category',
+            'id_selection',
+            'id_created_by_user',
+            'id_seller',
+        ]
 
-            product = Product(**product_data)
-            db_session.add(product)
+        frame = map_columns(Product, df, {
+            'Name': 'name',
+            'Description': 'description',
+            'Product Type': 'product_type',
+            'Price': 'price',
+            'Pricing Tiers': 'pricing_tiers',
+            'Daily Quantity': 'daily_quantity',
+            'Minimum Quantity': 'minimum_quantity',
+            'Available Leads Next 7 Days': 'available_leads_next_7_days',
+            'Lead Availability Schedule': 'lead_availability_schedule',
+            'Total Records': 'total_records',
+            'Available Records': 'available_records',
+            'Contact Methods': 'contact_methods',
+            'Replacement Policy': 'replacement_policy',
+            'Data Source Name': 'data_source_name',
+            'Listing Period Months': 'listing_period_months',
+            'License Period Months': 'license_period_months',
+            'Usage Limit Type': 'usage_limit_type',
+            'Data Type': 'data_type',
+            'Sale Type': 'sale_type',
+            'Geographic Coverage': 'geographic_coverage',
+            'Restricted Use': 'restricted_use',
+            'Source URL': 'source_url',
+            'Uploaded Date': 'uploaded_date',
+            'TPS Check Status': 'tps_check_status',
+            'MPS Check Status': 'mps_check_status',
+            'HLR Check Status': 'hlr_check_status',
+            'LLV Check Status': 'llv_check_status',
+            'Geo Validation Status': 'geo_validation_status',
+            'Suppression Check Status': 'suppression_check_status',
+            'GDPR Consent Status': 'gdpr_consent_status',
+            'View Count': 'view_count',
+            'Favorite Count': 'favorite_count',
+            'Rating Average': 'rating_average',
+            'Status': 'status',
+            'Company ID': 'id_company',
+            'Category ID': 'id_category',
+            'Sub Category ID': 'id_sub_category',
+            'Selection ID': 'id_selection',
+            'Created By User ID': 'id_created_by_user',
+            'Seller ID': 'id_seller',
+        }, {
+            'price': to_float,
+            'rating_average': to_float,
+            'uploaded_date': to_datetime,
+            'pricing_tiers': to_json,
+            'lead_availability_schedule': to_json,
+            **{column: to_int for column in int_columns},
+        })
+
+        validation_checks = [
+            ('id_company', company_ids, 'Company', True),
+            ('id_category', category_ids, 'Category', True),
+            ('id_sub_category', sub_category_ids, 'Sub Category', True),
+            ('id_selection', selection_ids, 'Selection', True),
+            ('id_created_by_user', user_ids, 'Created By User', True),
+            ('id_seller', seller_ids, 'Seller', False),
+        ]
+        for field_name, valid_ids, entity_name, is_required in validation_checks:
+            frame[field_name] = get_csv_column(frame, field_name)
+            frame = skip_invalid_ids(frame, field_name, valid_ids, entity_name, 'product', is_required)
 
+        total_rows = bulk_insert(db_session, Product, frame)
         db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} products into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
-
+@bulk_loader(Template, 'templates')
 def load_templates():
-    column_mapping = {
-        'Name': 'name',
-        'Description': 'description',
-        'Channel': 'channel',
-        'Status': 'status',
-        'Subject': 'subject',
-        'Body': 'body',
-        'Has Attachment': 'has_attachment',
-        'Agent Active': 'agent_active',
-        'Client View': 'client_view',
-        'Template Type': 'template_type',
-        'Character Count': 'character_count',
-        'Agent Send': 'agent_send',
-        'Marketing': 'marketing',
-        'Version': 'version',
-        'Last Published At': 'last_published_at',
-        'Created By User ID': 'id_created_by_user',
-    }
-
-    csv_path = 'data/csv/templates.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping templates load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping templates load")
-        return
+    df = read_seed_csv('templates.csv', 'templates')
+    if df is None:
+        return None
 
-    df = df.reset_index(drop=True)
+    to_template_bool = partial(to_bool, true_values=('true', '1', 'yes'))
 
     db_session = SessionLocal()
     try:
         user_ids = {user.id for user in db_session.query(User).all()}
 
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading templates", "templates")
-
-            template_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.isna(value):
-                    continue
-
-                if db_column in ['has_attachment', 'agent_active', 'client_view', 'agent_send', 'marketing']:
-                    template_data[db_column] = str(value).strip().lower() in ['true', '1', 'yes']
-                elif db_column in ['character_count', 'version', 'id_created_by_user']:
-                    try:
-                        template_data[db_column] = int(value)
-                    except Exception:
-                        template_data[db_column] = None
-                elif db_column == 'last_published_at':
-                    try:
-                        template_data[db_column] = pd.to_datetime(value)
-                    except Exception:
-                        template_data[db_column] = None
-                else:
-                    template_data[db_column] = value
-
-            created_by = template_data.get('id_created_by_user')
-            if not created_by or created_by not in user_ids:
-                print('Warning: Invalid created by user ID, skipping template')
-                continue
-
-            template = Template(**template_data)
-            db_session.add(template)
-
+        frame = map_columns(Template, df, {
+            'Name': 'name',
+            'Description': 'description',
+            'Channel': 'channel',
+            'Status': 'status',
+            'Subject': 'subject',
+            'Body': 'body',
+            'Has Attachment': 'has_attachment',
+            'Agent Active': 'agent_active',
+            'Client View': 'client_view',
+            'Template Type': 'template_type',
+            'Character Count': 'character_count',
+            'Agent Send': 'agent_send',
+            'Marketing': 'marketing',
+            'Version': 'version',
+            'Last Published At': 'last_published_at',
+            'Created By User ID': 'id_created_by_user',
+        }, {
+            'has_attachment': to_template_bool,
+            'agent_active': to_template_bool,
+            'client_view': to_template_bool,
+            'agent_send': to_template_bool,
+            'marketing': to_template_bool,
+            'character_count': to_int,
+            'version': to_int,
+            'id_created_by_user': to_int,
+            'last_published_at': to_datetime,
+        })
+
+        created_by = get_csv_column(frame, 'id_created_by_user')
+        frame = skip_rows(
+            frame,
+            created_by.isna() | ~created_by.isin(user_ids),
+            'Warning: Invalid created by user ID, skipping template',
+        )
+
+        total_rows = bulk_insert(db_session, Template, frame)
         db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} templates into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
+@bulk_loader(OffensiveWord, 'offensive words', depends_on=[User])
 def load_offensive_words():
-    column_mapping = {
-        'Word': 'word',
-        'Severity': 'severity',
-        'Active': 'is_active',
-        'Added Date': 'added_date',
-        'Usage Count': 'usage_count',
-        'Description': 'description',
-        'Created By User ID': 'id_created_by_user',
-    }
-
-    csv_path = 'data/csv/offensive_words.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping offensive words load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping offensive words load")
-        return
-
-    df = df.reset_index(drop=True)
+    df = read_seed_csv('offensive_words.csv', 'offensive words')
+    if df is None:
+        return None
 
     valid_severities = {'LOW', 'MEDIUM', 'HIGH', 'CRITICAL'}
 
@@ -3294,57 +2390,54 @@ def load_offensive_words():
     try:
         user_ids = {user.id for user in db_session.query(User).all()}
 
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading offensive words", "offensive words")
-
-            offensive_word_data = {}
-            skip_record = False
-
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.isna(value):
-                    continue
-
-                if db_column == 'severity':
-                    normalized_value = str(value).strip().upper()
-                    if normalized_value not in valid_severities:
-                        print(f"Warning: Invalid severity '{value}', skipping offensive word")
-                        skip_record = True
-                        break
-                    offensive_word_data[db_column] = normalized_value
-                elif db_column == 'is_active':
-                    offensive_word_data[db_column] = str(value).strip().lower() in ['true', '1', 'yes']
-                elif db_column in ['usage_count', 'id_created_by_user']:
-                    try:
-                        offensive_word_data[db_column] = int(value)
-                    except Exception:
-                        offensive_word_data[db_column] = None
-                elif db_column == 'added_date':
-                    try:
-                        offensive_word_data[db_column] = pd.to_datetime(value)
-                    except Exception:
-                        offensive_word_data[db_column] = None
-                else:
-                    offensive_word_data[db_column] = str(value).strip()
-
-            if skip_record:
-                continue
-
-            user_id = offensive_word_data.get('id_created_by_user')
-            if user_id is None or user_id not in user_ids:
-                print(f"Warning: User ID {user_id} not found, skipping offensive word")
-                continue
+        frame = map_columns(OffensiveWord, df, {
+            'Word': 'word',
+            'Severity': 'severity',
+            'Active': 'is_active',
+            'Added Date': 'added_date',
+            'Usage Count': 'usage_count',
+            'Description': 'description',
+            'Created By User ID': 'id_created_by_user',
+        }, {
+            'word': to_str,
+            'severity': to_upper,
+            'is_active': partial(to_bool, true_values=('true', '1', 'yes')),
+            'added_date': to_datetime,
+            'usage_count': to_int,
+            'description': to_str,
+            'id_created_by_user': to_int,
+        })
+
+        if 'severity' in frame.columns:
+            severities = df['Severity']
+            frame = skip_rows(
+                frame,
+                severities.notna() & ~frame['severity'].isin(valid_severities),
+                lambda row: f"Warning: Invalid severity '{severities[row.name]}', skipping offensive word",
+            )
 
-            offensive_word = OffensiveWord(**offensive_word_data)
-            db_session.add(offensive_word)
+        frame['id_created_by_user'] = get_csv_column(frame, 'id_created_by_user')
+        frame = skip_rows(
+            frame,
+            frame['id_created_by_user'].isna() | ~frame['id_created_by_user'].isin(user_ids),
+            lambda row: "Warning: User ID {} not found, skipping offensive word".format(
+                row['id_created_by_user'] if pd.notna(row['id_created_by_user']) else None
+            ),
+        )
 
+        total_rows = bulk_insert(db_session, OffensiveWord, frame)
         db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} offensive words into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
+@bulk_loader(Review, 'reviews')
 def load_reviews():
+    df = read_seed_csv('reviews.csv', 'reviews')
+    if df is None:
+        return None
+
     column_mapping = {
         'Title': 'title',
         'Review Text': 'review_text',
@@ -3365,17 +2458,6 @@ def load_reviews():
         'Order ID': 'id_order',
     }
 
-    csv_path = 'data/csv/reviews.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping reviews load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping reviews load")
-        return
-
     db_session = SessionLocal()
     try:
         product_ids = {product.id for product in db_session.query(Product).all()}
@@ -3393,94 +2475,65 @@ def load_reviews():
             'id_reviewer_company',
         ]
 
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading reviews", "reviews")
-
-            review_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.isna(value):
-                    continue
-
-                if db_column == 'review_date':
-                    try:
-                        review_data[db_column] = pd.to_datetime(value)
-                    except Exception:
-                        review_data[db_column] = None
-                elif db_column in ['accuracy_rating', 'receptivity_rating', 'contact_rate_rating', 'overall_rating']:
-                    try:
-                        review_data[db_column] = float(value)
-                    except Exception:
-                        review_data[db_column] = None
-                elif db_column == 'reported_count':
-                    try:
-                        review_data[db_column] = int(value)
-                    except Exception:
-                        review_data[db_column] = 0
-                elif db_column in ['is_recommended', 'is_flagged', 'contains_offensive_words']:
-                    review_data[db_column] = str(value).strip().lower() in ['true', '1', 'yes', 'y']
-                elif db_column in ['id_product', 'id_reviewer_user', 'id_reviewer_company', 'id_order']:
-                    try:
-                        review_data[db_column] = int(value)
-                    except Exception:
-                        review_data[db_column] = None
-                else:
-                    review_data[db_column] = value
-
-            missing_fields = []
-            for field in required_fields:
-                if field not in review_data or review_data[field] is None:
-                    missing_fields.append(field)
-                elif isinstance(review_data[field], str) and not review_data[field].strip():
-                    missing_fields.append(field)
-
-            if missing_fields:
-                print(
-                    "Warning: Missing required fields {} for review, skipping".format(
-                        ', '.join(sorted(set(missing_fields)))
-                    )
-                )
-                continue
-
-            if review_data.get('reported_count') is None:
-                review_data['reported_count'] = 0
-
-            validation_checks = [
-                ('id_product', product_ids, 'Product', True),
-                ('id_reviewer_user', user_ids, 'Reviewer User', True),
-                ('id_reviewer_company', company_ids, 'Reviewer Company', True),
-                ('id_order', order_ids, 'Order', False),
-            ]
-
-            skip_record = False
-            for field_name, valid_ids, entity_name, is_required in validation_checks:
-                entity_id = review_data.get(field_name)
-
-                if entity_id is None:
-                    if is_required:
-                        print(f"Warning: No {entity_name} ID provided, skipping review")
-                        skip_record = True
-                    continue
-
-                if valid_ids and entity_id not in valid_ids:
-                    print(f"Warning: {entity_name} ID {entity_id} not found, skipping review")
-                    skip_record = True
-                    break
-
-            if skip_record:
-                continue
-
-            review = Review(**review_data)
-            db_session.add(review)
+        frame = map_columns(Review, df, column_mapping, {
+            'review_date': to_datetime,
+            'accuracy_rating': to_float,
+            'receptivity_rating': to_float,
+            'contact_rate_rating': to_float,
+            'overall_rating': to_float,
+            'reported_count': partial(to_int, default=0),
+            'is_recommended': to_bool,
+            'is_flagged': to_bool,
+            'contains_offensive_words': to_bool,
+            'id_product': to_int,
+            'id_reviewer_user': to_int,
+            'id_reviewer_company': to_int,
+            'id_order': to_int,
+        })
+
+        # A required field is missing if the CSV has no value for it (before
+        # the model defaults), or one that doesn't convert, or a blank string
+        csv_columns = {db_column: csv_column for csv_column, db_column in column_mapping.items()}
+        missing = pd.DataFrame({
+            field: get_csv_column(df, csv_columns[field]).isna() | (
+                get_csv_column(frame, field)
+                .map(lambda value: pd.isna(value) or (isinstance(value, str) and not value.strip()))
+                .astype(bool)
+            )
+            for field in required_fields
+        })
+        frame = skip_rows(
+            frame,
+            missing.any(axis=1),
+            lambda row: "Warning: Missing required fields {} for review, skipping".format(
+                ', '.join(sorted(field for field in required_fields if missing.at[row.name, field]))
+            ),
+        )
+
+        validation_checks = [
+            ('id_product', product_ids, 'Product', True),
+            ('id_reviewer_user', user_ids, 'Reviewer User', True),
+            ('id_reviewer_company', company_ids, 'Reviewer Company', True),
+            ('id_order', order_ids, 'Order', False),
+        ]
+        for field_name, valid_ids, entity_name, is_required in validation_checks:
+            frame[field_name] = get_csv_column(frame, field_name)
+            frame = skip_invalid_ids(frame, field_name, valid_ids, entity_name, 'review', is_required)
 
+        total_rows = bulk_insert(db_session, Review, frame)
         db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} reviews into the database")
+        return total_rows
     finally:
         db_session.close()
 
 
+@bulk_loader(BuyerReport, 'buyer reports')
 def load_buyer_reports():
-    column_mapping = {
+    df = read_seed_csv('buyer_reports.csv', 'buyer reports')
+    if df is None:
+        return None
+
+    frame = map_columns(BuyerReport, df, {
         'ID Buyer': 'id_buyer',
         'User Name': 'user_name',
         'User Email': 'user_email',
@@ -3489,59 +2542,22 @@ def load_buyer_reports():
         'Product Orders': 'product_orders',
         'Total Spent': 'total_spent',
         'Status': 'status',
-    }
-
-    csv_path = 'data/csv/buyer_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping buyer reports load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping buyer reports load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading buyer reports", "reports")
-
-            buyer_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle date fields
-                    if db_column == 'signed_up_date':
-                        try:
-                            buyer_report_data[db_column] = pd.to_datetime(value)
-                        except:
-                            buyer_report_data[db_column] = None
-                    # Handle numeric fields
-                    elif db_column in ['leads_orders', 'product_orders']:
-                        try:
-                            buyer_report_data[db_column] = int(value)
-                        except:
-                            buyer_report_data[db_column] = 0
-                    elif db_column == 'total_spent':
-                        try:
-                            buyer_report_data[db_column] = float(value)
-                        except:
-                            buyer_report_data[db_column] = 0.00
-                    else:
-                        buyer_report_data[db_column] = value
-
-            buyer_report = BuyerReport(**buyer_report_data)
-            db_session.add(buyer_report)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} buyer reports into the database")
-    finally:
-        db_session.close()
+    }, {
+        'signed_up_date': to_datetime,
+        'leads_orders': partial(to_int, default=0),
+        'product_orders': partial(to_int, default=0),
+        'total_spent': partial(to_float, default=0.0),
+    })
+    return insert_frame(BuyerReport, frame)
 
 
+@bulk_loader(BuyerDisputeReport, 'buyer dispute reports')
 def load_buyer_dispute_reports():
-    column_mapping = {
+    df = read_seed_csv('buyer_dispute_reports.csv', 'buyer dispute reports')
+    if df is None:
+        return None
+
+    frame = map_columns(BuyerDisputeReport, df, {
         'ID Buyer': 'id_buyer',
         'User Name': 'user_name',
         'User Email': 'user_email',
@@ -3550,54 +2566,22 @@ def load_buyer_dispute_reports():
         'Product Orders': 'product_orders',
         'Disputes': 'disputes',
         'Status': 'status',
-    }
-
-    csv_path = 'data/csv/buyer_dispute_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping buyer dispute reports load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping buyer dispute reports load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading buyer dispute reports", "reports")
-
-            buyer_dispute_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle date fields
-                    if db_column == 'signed_up_date':
-                        try:
-                            buyer_dispute_report_data[db_column] = pd.to_datetime(value)
-                        except:
-                            buyer_dispute_report_data[db_column] = None
-                    # Handle numeric fields
-                    elif db_column in ['leads_orders', 'product_orders', 'disputes']:
-                        try:
-                            buyer_dispute_report_data[db_column] = int(value)
-                        except:
-                            buyer_dispute_report_data[db_column] = 0
-                    else:
-                        buyer_dispute_report_data[db_column] = value
-
-            buyer_dispute_report = BuyerDisputeReport(**buyer_dispute_report_data)
-            db_session.add(buyer_dispute_report)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} buyer dispute reports into the database")
-    finally:
-        db_session.close()
+    }, {
+        'signed_up_date': to_datetime,
+        'leads_orders': partial(to_int, default=0),
+        'product_orders': partial(to_int, default=0),
+        'disputes': partial(to_int, default=0),
+    })
+    return insert_frame(BuyerDisputeReport, frame)
 
 
+@bulk_loader(BuyerPurchaseActivityReport, 'buyer purchase activity reports')
 def load_buyer_purchase_activity_reports():
-    column_mapping = {
+    df = read_seed_csv('buyer_purchase_activity_reports.csv', 'buyer purchase activity reports')
+    if df is None:
+        return None
+
+    frame = map_columns(BuyerPurchaseActivityReport, df, {
         'ID Buyer': 'id_buyer',
         'User Name': 'user_name',
         'User Email': 'user_email',
@@ -3606,56 +2590,22 @@ def load_buyer_purchase_activity_reports():
         'Last 30 Days': 'last_30_days',
         'Total YTD': 'total_ytd',
         'Status': 'status',
-    }
-
-    csv_path = 'data/csv/buyer_purchase_activity_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping buyer purchase activity reports load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping buyer purchase activity reports load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading buyer purchase activity reports", "reports")
-
-            buyer_purchase_activity_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle date fields
-                    if db_column == 'signed_up_date':
-                        try:
-                            buyer_purchase_activity_report_data[db_column] = pd.to_datetime(value)
-                        except:
-                            buyer_purchase_activity_report_data[db_column] = None
-                    # Handle currency fields
-                    elif db_column in ['last_7_days', 'last_30_days', 'total_ytd']:
-                        try:
-                            # Remove currency symbols and commas if present
-                            clean_value = str(value).replace('£', '').replace(',', '').strip()
-                            buyer_purchase_activity_report_data[db_column] = float(clean_value)
-                        except:
-                            buyer_purchase_activity_report_data[db_column] = 0.00
-                    else:
-                        buyer_purchase_activity_report_data[db_column] = value
-
-            buyer_purchase_activity_report = BuyerPurchaseActivityReport(**buyer_purchase_activity_report_data)
-            db_session.add(buyer_purchase_activity_report)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} buyer purchase activity reports into the database")
-    finally:
-        db_session.close()
+    }, {
+        'signed_up_date': to_datetime,
+        'last_7_days': partial(to_float, default=0.0, strip='£,'),
+        'last_30_days': partial(to_float, default=0.0, strip='£,'),
+        'total_ytd': partial(to_float, default=0.0, strip='£,'),
+    })
+    return insert_frame(BuyerPurchaseActivityReport, frame)
 
 
+@bulk_loader(BuyerReviewActivityReport, 'buyer review activity reports')
 def load_buyer_review_activity_reports():
-    column_mapping = {
+    df = read_seed_csv('buyer_review_activity_reports.csv', 'buyer review activity reports')
+    if df is None:
+        return None
+
+    frame = map_columns(BuyerReviewActivityReport, df, {
         'ID Buyer': 'id_buyer',
         'User Name': 'user_name',
         'User Email': 'user_email',
@@ -3665,66 +2615,23 @@ def load_buyer_review_activity_reports():
         'Negative Reviews': 'negative_reviews',
         'Last Review Date': 'last_review_date',
         'Status': 'status',
-    }
-
-    csv_path = 'data/csv/buyer_review_activity_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping buyer review activity reports load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping buyer review activity reports load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading buyer review activity reports", "reports")
-
-            buyer_review_activity_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle datetime fields
-                    if db_column == 'signed_up_date':
-                        try:
-                            buyer_review_activity_report_data[db_column] = pd.to_datetime(value)
-                        except:
-                            buyer_review_activity_report_data[db_column] = None
-                    # Handle date fields
-                    elif db_column == 'last_review_date':
-                        try:
-                            buyer_review_activity_report_data[db_column] = pd.to_datetime(value).date()
-                        except:
-                            buyer_review_activity_report_data[db_column] = None
-                    # Handle integer fields
-                    elif db_column in ['reviews_left', 'negative_reviews']:
-                        try:
-                            buyer_review_activity_report_data[db_column] = int(value)
-                        except:
-                            buyer_review_activity_report_data[db_column] = 0
-                    # Handle rating field
-                    elif db_column == 'avg_rating_given':
-                        try:
-                            buyer_review_activity_report_data[db_column] = float(value)
-                        except:
-                            buyer_review_activity_report_data[db_column] = 0.0
-                    else:
-                        buyer_review_activity_report_data[db_column] = value
-
-            buyer_review_activity_report = BuyerReviewActivityReport(**buyer_review_activity_report_data)
-            db_session.add(buyer_review_activity_report)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} buyer review activity reports into the database")
-    finally:
-        db_session.close()
+    }, {
+        'signed_up_date': to_datetime,
+        'reviews_left': partial(to_int, default=0),
+        'avg_rating_given': partial(to_float, default=0.0),
+        'negative_reviews': partial(to_int, default=0),
+        'last_review_date': to_date,
+    })
+    return insert_frame(BuyerReviewActivityReport, frame)
 
 
+@bulk_loader(BuyerPurchaseBreakdownReport, 'buyer purchase breakdown reports')
 def load_buyer_purchase_breakdown_reports():
-    column_mapping = {
+    df = read_seed_csv('buyer_purchase_breakdown_reports.csv', 'buyer purchase breakdown reports')
+    if df is None:
+        return None
+
+    frame = map_columns(BuyerPurchaseBreakdownReport, df, {
         'ID Buyer': 'id_buyer',
         'User Name': 'user_name',
         'User Email': 'user_email',
@@ -3734,54 +2641,23 @@ def load_buyer_purchase_breakdown_reports():
         'Home Improvement': 'home_improvement',
         'Others': 'others',
         'Status': 'status',
-    }
-
-    csv_path = 'data/csv/buyer_purchase_breakdown_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping buyer purchase breakdown reports load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping buyer purchase breakdown reports load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading buyer purchase breakdown reports", "reports")
-
-            buyer_purchase_breakdown_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle datetime fields
-                    if db_column == 'signed_up_date':
-                        try:
-                            buyer_purchase_breakdown_report_data[db_column] = pd.to_datetime(value)
-                        except:
-                            buyer_purchase_breakdown_report_data[db_column] = None
-                    # Handle integer count fields
-                    elif db_column in ['solar_leads', 'finance_leads', 'home_improvement', 'others']:
-                        try:
-                            buyer_purchase_breakdown_report_data[db_column] = int(value)
-                        except:
-                            buyer_purchase_breakdown_report_data[db_column] = 0
-                    else:
-                        buyer_purchase_breakdown_report_data[db_column] = value
-
-            buyer_purchase_breakdown_report = BuyerPurchaseBreakdownReport(**buyer_purchase_breakdown_report_data)
-            db_session.add(buyer_purchase_breakdown_report)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} buyer purchase breakdown reports into the database")
-    finally:
-        db_session.close()
+    }, {
+        'signed_up_date': to_datetime,
+        'solar_leads': partial(to_int, default=0),
+        'finance_leads': partial(to_int, default=0),
+        'home_improvement': partial(to_int, default=0),
+        'others': partial(to_int, default=0),
+    })
+    return insert_frame(BuyerPurchaseBreakdownReport, frame)
 
 
+@bulk_loader(SellerReport, 'seller reports')
 def load_seller_reports():
-    column_mapping = {
+    df = read_seed_csv('seller_reports.csv', 'seller reports')
+    if df is None:
+        return None
+
+    frame = map_columns(SellerReport, df, {
         'ID Seller': 'id_seller',
         'User Name': 'user_name',
         'User Email': 'user_email',
@@ -3794,70 +2670,26 @@ def load_seller_reports():
         'Avg CPL': 'avg_cpl',
         'Total Sales': 'total_sales',
         'Status': 'status',
-    }
-
-    csv_path = 'data/csv/seller_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping seller reports load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping seller reports load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading seller reports", "reports")
-
-            seller_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle datetime fields
-                    if db_column == 'signed_up_date':
-                        try:
-                            seller_report_data[db_column] = pd.to_datetime(value)
-                        except:
-                            seller_report_data[db_column] = None
-                    # Handle integer fields
-                    elif db_column in ['total_listing', 'total_orders', 'leads_sold']:
-                        try:
-                            seller_report_data[db_column] = int(value)
-                        except:
-                            seller_report_data[db_column] = 0
-                    # Handle percentage fields
-                    elif db_column in ['delivery_rate', 'dispute_rate']:
-                        try:
-                            # Remove percentage symbol if present
-                            clean_value = str(value).replace('%', '').strip()
-                            seller_report_data[db_column] = float(clean_value)
-                        except:
-                            seller_report_data[db_column] = 0.00
-                    # Handle currency fields
-                    elif db_column in ['avg_cpl', 'total_sales']:
-                        try:
-                            # Remove currency symbols and commas if present
-                            clean_value = str(value).replace('£', '').replace(',', '').strip()
-                            seller_report_data[db_column] = float(clean_value)
-                        except:
-                            seller_report_data[db_column] = 0.00
-                    else:
-                        seller_report_data[db_column] = value
-
-            seller_report = SellerReport(**seller_report_data)
-            db_session.add(seller_report)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} seller reports into the database")
-    finally:
-        db_session.close()
-
-
+    }, {
+        'signed_up_date': to_datetime,
+        'total_listing': partial(to_int, default=0),
+        'total_orders': partial(to_int, default=0),
+        'leads_sold': partial(to_int, default=0),
+        'delivery_rate': partial(to_float, default=0.0, strip='%'),
+        'dispute_rate': partial(to_float, default=0.0, strip='%'),
+        'avg_cpl': partial(to_float, default=0.0, strip='£,'),
+        'total_sales': partial(to_float, default=0.0, strip='£,'),
+    })
+    return insert_frame(SellerReport, frame)
+
+
+@bulk_loader(SellerRatingReport, 'seller rating reports')
 def load_seller_rating_reports():
-    column_mapping = {
+    df = read_seed_csv('seller_rating_reports.csv', 'seller rating reports')
+    if df is None:
+        return None
+
+    frame = map_columns(SellerRatingReport, df, {
         'ID Seller': 'id_seller',
         'User Name': 'user_name',
         'User Email': 'user_email',
@@ -3868,60 +2700,23 @@ def load_seller_rating_reports():
         'Avg Rating': 'avg_rating',
         'Last Reviewed Product': 'last_reviewed_product',
         'Status': 'status',
-    }
-
-    csv_path = 'data/csv/seller_rating_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping seller rating reports load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping seller rating reports load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading seller rating reports", "reports")
-
-            seller_rating_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle datetime fields
-                    if db_column == 'signed_up_date':
-                        try:
-                            seller_rating_report_data[db_column] = pd.to_datetime(value)
-                        except:
-                            seller_rating_report_data[db_column] = None
-                    # Handle integer fields
-                    elif db_column in ['total_listing', 'total_orders', 'review_count']:
-                        try:
-                            seller_rating_report_data[db_column] = int(value)
-                        except:
-                            seller_rating_report_data[db_column] = 0
-                    # Handle rating field
-                    elif db_column == 'avg_rating':
-                        try:
-                            seller_rating_report_data[db_column] = float(value)
-                        except:
-                            seller_rating_report_data[db_column] = 0.0
-                    else:
-                        seller_rating_report_data[db_column] = value
-
-            seller_rating_report = SellerRatingReport(**seller_rating_report_data)
-            db_session.add(seller_rating_report)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} seller rating reports into the database")
-    finally:
-        db_session.close()
+    }, {
+        'signed_up_date': to_datetime,
+        'total_listing': partial(to_int, default=0),
+        'total_orders': partial(to_int, default=0),
+        'review_count': partial(to_int, default=0),
+        'avg_rating': partial(to_float, default=0.0),
+    })
+    return insert_frame(SellerRatingReport, frame)
 
 
+@bulk_loader(SellerDisputeReport, 'seller dispute reports')
 def load_seller_dispute_reports():
-    column_mapping = {
+    df = read_seed_csv('seller_dispute_reports.csv', 'seller dispute reports')
+    if df is None:
+        return None
+
+    frame = map_columns(SellerDisputeReport, df, {
         'ID Seller': 'id_seller',
         'User Name': 'user_name',
         'User Email': 'user_email',
@@ -3933,62 +2728,25 @@ def load_seller_dispute_reports():
         'Dispute Rate': 'dispute_rate',
         'Resolved Percentage': 'resolved_percentage',
         'Status': 'status',
-    }
-
-    csv_path = 'data/csv/seller_dispute_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping seller dispute reports load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping seller dispute reports load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading seller dispute reports", "reports")
-
-            seller_dispute_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle datetime fields
-                    if db_column == 'signed_up_date':
-                        try:
-                            seller_dispute_report_data[db_column] = pd.to_datetime(value)
-                        except:
-                            seller_dispute_report_data[db_column] = None
-                    # Handle integer fields
-                    elif db_column in ['total_listing', 'total_orders', 'dispute_received']:
-                        try:
-                            seller_dispute_report_data[db_column] = int(value)
-                        except:
-                            seller_dispute_report_data[db_column] = 0
-                    # Handle percentage fields
-                    elif db_column in ['delivery_rate', 'dispute_rate', 'resolved_percentage']:
-                        try:
-                            # Remove percentage symbol if present
-                            clean_value = str(value).replace('%', '').strip()
-                            seller_dispute_report_data[db_column] = float(clean_value)
-                        except:
-                            seller_dispute_report_data[db_column] = 0.00
-                    else:
-                        seller_dispute_report_data[db_column] = value
-
-            seller_dispute_report = SellerDisputeReport(**seller_dispute_report_data)
-            db_session.add(seller_dispute_report)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} seller dispute reports into the database")
-    finally:
-        db_session.close()
-
-
+    }, {
+        'signed_up_date': to_datetime,
+        'total_listing': partial(to_int, default=0),
+        'total_orders': partial(to_int, default=0),
+        'delivery_rate': partial(to_float, default=0.0, strip='%'),
+        'dispute_received': partial(to_int, default=0),
+        'dispute_rate': partial(to_float, default=0.0, strip='%'),
+        'resolved_percentage': partial(to_float, default=0.0, strip='%'),
+    })
+    return insert_frame(SellerDisputeReport, frame)
+
+
+@bulk_loader(SellerDisputeBreakdownReport, 'seller dispute breakdown reports')
 def load_seller_dispute_breakdown_reports():
-    column_mapping = {
+    df = read_seed_csv('seller_dispute_breakdown_reports.csv', 'seller dispute breakdown reports')
+    if df is None:
+        return None
+
+    frame = map_columns(SellerDisputeBreakdownReport, df, {
         'ID Seller': 'id_seller',
         'User Name': 'user_name',
         'User Email': 'user_email',
@@ -3999,54 +2757,24 @@ def load_seller_dispute_breakdown_reports():
         'Criteria Mismatch': 'criteria_mismatch',
         'Others': 'others',
         'Status': 'status',
-    }
-
-    csv_path = 'data/csv/seller_dispute_breakdown_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping seller dispute breakdown reports load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping seller dispute breakdown reports load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading seller dispute breakdown reports", "reports")
-
-            seller_dispute_breakdown_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle datetime fields
-                    if db_column == 'signed_up_date':
-                        try:
-                            seller_dispute_breakdown_report_data[db_column] = pd.to_datetime(value)
-                        except:
-                            seller_dispute_breakdown_report_data[db_column] = None
-                    # Handle integer count fields
-                    elif db_column in ['dispute_received', 'bad_contact', 'invalid_data', 'criteria_mismatch', 'others']:
-                        try:
-                            seller_dispute_breakdown_report_data[db_column] = int(value)
-                        except:
-                            seller_dispute_breakdown_report_data[db_column] = 0
-                    else:
-                        seller_dispute_breakdown_report_data[db_column] = value
-
-            seller_dispute_breakdown_report = SellerDisputeBreakdownReport(**seller_dispute_breakdown_report_data)
-            db_session.add(seller_dispute_breakdown_report)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} seller dispute breakdown reports into the database")
-    finally:
-        db_session.close()
-
-
+    }, {
+        'signed_up_date': to_datetime,
+        'dispute_received': partial(to_int, default=0),
+        'bad_contact': partial(to_int, default=0),
+        'invalid_data': partial(to_int, default=0),
+        'criteria_mismatch': partial(to_int, default=0),
+        'others': partial(to_int, default=0),
+    })
+    return insert_frame(SellerDisputeBreakdownReport, frame)
+
+
+@bulk_loader(SellerListingReport, 'seller listing reports')
 def load_seller_listing_reports():
-    column_mapping = {
+    df = read_seed_csv('seller_listing_reports.csv', 'seller listing reports')
+    if df is None:
+        return None
+
+    frame = map_columns(SellerListingReport, df, {
         'ID Seller': 'id_seller',
         'User Name': 'user_name',
         'User Email': 'user_email',
@@ -4058,62 +2786,25 @@ def load_seller_listing_reports():
         'Cap Hit Rate': 'cap_hit_rate',
         'Last Uploaded On': 'last_uploaded_on',
         'Status': 'status',
-    }
-
-    csv_path = 'data/csv/seller_listing_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping seller listing reports load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping seller listing reports load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading seller listing reports", "reports")
-
-            seller_listing_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle datetime fields
-                    if db_column in ['signed_up_date', 'last_uploaded_on']:
-                        try:
-                            seller_listing_report_data[db_column] = pd.to_datetime(value)
-                        except:
-                            seller_listing_report_data[db_column] = None
-                    # Handle integer count fields
-                    elif db_column in ['total_listing', 'live_leads', 'dataset']:
-                        try:
-                            seller_listing_report_data[db_column] = int(value)
-                        except:
-                            seller_listing_report_data[db_column] = 0
-                    # Handle percentage fields
-                    elif db_column in ['delivery_rate', 'cap_hit_rate']:
-                        try:
-                            # Remove percentage symbol if present
-                            clean_value = str(value).replace('%', '').strip()
-                            seller_listing_report_data[db_column] = float(clean_value)
-                        except:
-                            seller_listing_report_data[db_column] = 0.00
-                    else:
-                        seller_listing_report_data[db_column] = value
-
-            seller_listing_report = SellerListingReport(**seller_listing_report_data)
-            db_session.add(seller_listing_report)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} seller listing reports into the database")
-    finally:
-        db_session.close()
-
-
+    }, {
+        'signed_up_date': to_datetime,
+        'total_listing': partial(to_int, default=0),
+        'live_leads': partial(to_int, default=0),
+        'dataset': partial(to_int, default=0),
+        'delivery_rate': partial(to_float, default=0.0, strip='%'),
+        'cap_hit_rate': partial(to_float, default=0.0, strip='%'),
+        'last_uploaded_on': to_datetime,
+    })
+    return insert_frame(SellerListingReport, frame)
+
+
+@bulk_loader(SellerProductPerformanceReport, 'seller product performance reports')
 def load_seller_product_performance_reports():
-    column_mapping = {
+    df = read_seed_csv('seller_product_performance_reports.csv', 'seller product performance reports')
+    if df is None:
+        return None
+
+    frame = map_columns(SellerProductPerformanceReport, df, {
         'ID Seller': 'id_seller',
         'User Name': 'user_name',
         'User Email': 'user_email',
@@ -4125,62 +2816,23 @@ def load_seller_product_performance_reports():
         'Refund Rate': 'refund_rate',
         'Avg Rating': 'avg_rating',
         'Status': 'status',
-    }
-
-    csv_path = 'data/csv/seller_product_performance_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping seller product performance reports load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping seller product performance reports load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading seller product performance reports", "reports")
-
-            seller_product_performance_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle integer count fields
-                    if db_column == 'leads_sold':
-                        try:
-                            seller_product_performance_report_data[db_column] = int(value)
-                        except:
-                            seller_product_performance_report_data[db_column] = 0
-                    # Handle percentage fields
-                    elif db_column in ['dispute_rate', 'cap_hit_rate', 'refund_rate']:
-                        try:
-                            # Remove percentage symbol if present
-                            clean_value = str(value).replace('%', '').strip()
-                            seller_product_performance_report_data[db_column] = float(clean_value)
-                        except:
-                            seller_product_performance_report_data[db_column] = 0.00
-                    # Handle rating field
-                    elif db_column == 'avg_rating':
-                        try:
-                            seller_product_performance_report_data[db_column] = float(value)
-                        except:
-                            seller_product_performance_report_data[db_column] = 0.0
-                    else:
-                        seller_product_performance_report_data[db_column] = value
-
-            seller_product_performance_report = SellerProductPerformanceReport(**seller_product_performance_report_data)
-            db_session.add(seller_product_performance_report)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} seller product performance reports into the database")
-    finally:
-        db_session.close()
+    }, {
+        'leads_sold': partial(to_int, default=0),
+        'dispute_rate': partial(to_float, default=0.0, strip='%'),
+        'cap_hit_rate': partial(to_float, default=0.0, strip='%'),
+        'refund_rate': partial(to_float, default=0.0, strip='%'),
+        'avg_rating': partial(to_float, default=0.0),
+    })
+    return insert_frame(SellerProductPerformanceReport, frame)
 
 
+@bulk_loader(TopCreditsUsageReport, 'top credits usage reports')
 def load_top_credits_usage_reports():
-    column_mapping = {
+    df = read_seed_csv('top_credits_usage_reports.csv', 'top credits usage reports')
+    if df is None:
+        return None
+
+    frame = map_columns(TopCreditsUsageReport, df, {
         'ID User': 'id_user',
         'User Name': 'user_name',
         'User Email': 'user_email',
@@ -4190,62 +2842,23 @@ def load_top_credits_usage_reports():
         'Spent On Credits': 'spent_on_credits',
         'Last Top Up': 'last_top_up',
         'Status': 'status',
-    }
-
-    csv_path = 'data/csv/top_credits_usage_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping top credits usage reports load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping top credits usage reports load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading top credits usage reports", "reports")
-
-            top_credits_usage_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle date fields
-                    if db_column == 'last_top_up':
-                        try:
-                            top_credits_usage_report_data[db_column] = pd.to_datetime(value).date()
-                        except:
-                            top_credits_usage_report_data[db_column] = None
-                    # Handle integer credit fields
-                    elif db_column in ['credit_used', 'credit_purchased', 'remaining_credits']:
-                        try:
-                            top_credits_usage_report_data[db_column] = int(value)
-                        except:
-                            top_credits_usage_report_data[db_column] = 0
-                    # Handle currency field
-                    elif db_column == 'spent_on_credits':
-                        try:
-                            # Remove currency symbols and commas if present
-                            clean_value = str(value).replace('£', '').replace(',', '').strip()
-                            top_credits_usage_report_data[db_column] = float(clean_value)
-                        except:
-                            top_credits_usage_report_data[db_column] = 0.00
-                    else:
-                        top_credits_usage_report_data[db_column] = value
-
-            top_credits_usage_report = TopCreditsUsageReport(**top_credits_usage_report_data)
-            db_session.add(top_credits_usage_report)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} top credits usage reports into the database")
-    finally:
-        db_session.close()
+    }, {
+        'credit_used': partial(to_int, default=0),
+        'credit_purchased': partial(to_int, default=0),
+        'remaining_credits': partial(to_int, default=0),
+        'spent_on_credits': partial(to_float, default=0.0, strip='£,'),
+        'last_top_up': to_date,
+    })
+    return insert_frame(TopCreditsUsageReport, frame)
 
 
+@bulk_loader(CheckTypeReport, 'check type reports')
 def load_check_type_reports():
-    column_mapping = {
+    df = read_seed_csv('check_type_reports.csv', 'check type reports')
+    if df is None:
+        return None
+
+    frame = map_columns(CheckTypeReport, df, {
         'Check Type': 'check_type',
         'Total Checks': 'total_checks',
         'Successful Checks': 'successful_checks',
@@ -4253,111 +2866,128 @@ def load_check_type_reports():
         'Success Rate(%)': 'success_rate',
         'Most Common Error': 'most_common_error',
         'Status': 'status',
-    }
-
-    csv_path = 'data/csv/check_type_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping check type reports load")
-        return
-
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping check type reports load")
-        return
-
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading check type reports", "reports")
-
-            check_type_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle integer fields
-                    if db_column in ['total_checks', 'successful_checks', 'failed_checks']:
-                        try:
-                            check_type_report_data[db_column] = int(value)
-                        except:
-                            check_type_report_data[db_column] = 0
-                    # Handle percentage field
-                    elif db_column == 'success_rate':
-                        try:
-                            # Remove percentage symbol if present
-                            clean_value = str(value).replace('%', '').strip()
-                            check_type_report_data[db_column] = float(clean_value)
-                        except:
-                            check_type_report_data[db_column] = 0.00
-                    else:
-                        check_type_report_data[db_column] = value
-
-            check_type_report = CheckTypeReport(**check_type_report_data)
-            db_session.add(check_type_report)
-
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} check type reports into the database")
-    finally:
-        db_session.close()
+    }, {
+        'total_checks': partial(to_int, default=0),
+        'successful_checks': partial(to_int, default=0),
+        'failed_checks': partial(to_int, default=0),
+        'success_rate': partial(to_float, default=0.0, strip='%'),
+    })
+    return insert_frame(CheckTypeReport, frame)
 
 
+@bulk_loader(RevenueTrendReport, 'revenue trend reports')
 def load_revenue_trend_reports():
-    column_mapping = {
+    df = read_seed_csv('revenue_trend_reports.csv', 'revenue trend reports')
+    if df is None:
+        return None
+
+    frame = map_columns(RevenueTrendReport, df, {
         'Date': 'date',
         'Revenue': 'revenue',
         'Seller ID': 'id_seller',
-    }
+    }, {
+        'date': to_date,
+        'revenue': partial(to_float, default=0.0, strip='£,'),
+        'id_seller': to_int,
+    })
+    return insert_frame(RevenueTrendReport, frame)
+
+SEED_LOADERS = [
+    load_roles,
+    load_users,
+    load_event_types,
+    load_data_types,
+    load_categories,
+    load_sub_categories,
+    load_selections,
+    load_activity_logs,
+    load_countries,
+    load_states,
+    load_addresses,
+    load_companies,
+    load_company_users,
+    load_buyers,
+    load_sellers,
+    load_dd_users,
+    load_products,
+    load_templates,
+    load_offensive_words,
+    load_blogs,
+    load_orders,
+    load_dataset_orders,
+    load_dataset_order_deliveries,
+    load_live_lead_orders,
+    load_live_lead_delivery_schedules,
+    load_live_lead_order_status_history,
+    load_daily_lead_delivery_logs,
+    load_reviews,
+    load_transactions,
+    load_disputes,
+    load_buyer_reports,
+    load_buyer_dispute_reports,
+    load_buyer_purchase_activity_reports,
+    load_buyer_review_activity_reports,
+    load_buyer_purchase_breakdown_reports,
+    load_seller_reports,
+    load_seller_rating_reports,
+    load_seller_dispute_reports,
+    load_seller_dispute_breakdown_reports,
+    load_seller_listing_reports,
+    load_seller_product_performance_reports,
+    load_top_credits_usage_reports,
+    load_credit_purchased_reports,
+    load_most_verified_reports,
+    load_api_usage_reports,
+    load_check_type_reports,
+    load_revenue_trend_reports,
+    load_dispute_insights_reports,
+    load_top_dispute_reasons_reports,
+    load_top_categories_by_purchase_reports,
+    load_lead_delivery_trend_reports,
+    load_stats_layouts,
+]
+
+
+def load_seed_data(workers=SEED_LOAD_WORKERS):
+    """
+    Load the seed data of every table from the CSV files. Up to `workers`
+    tables are loaded at the same time, each one after the tables it
+    depends on.
 
-    csv_path = 'data/csv/revenue_trend_reports.csv'
-    if not os.path.exists(csv_path):
-        print(f"Info: {csv_path} not found, skipping revenue trend reports load")
-        return
+    Returns:
+        float: The wall-clock seconds of the load
+    """
 
-    try:
-        df = pd.read_csv(csv_path)
-    except Exception:
-        print(f"Warning: Failed to read {csv_path}, skipping revenue trend reports load")
-        return
+    return run_loaders(SEED_LOADERS, workers)
 
-    db_session = SessionLocal()
-    try:
-        for index, row in df.iterrows():
-            ProgressDisplay.show_progress(index + 1, len(df), "Loading revenue trend reports", "reports")
-
-            revenue_trend_report_data = {}
-            for csv_column, db_column in column_mapping.items():
-                value = row.get(csv_column)
-                if pd.notna(value):
-                    # Handle date field
-                    if db_column == 'date':
-                        try:
-                            revenue_trend_report_data[db_column] = pd.to_datetime(value).date()
-                        except:
-                            revenue_trend_report_data[db_column] = None
-                    # Handle revenue amount
-                    elif db_column == 'revenue':
-                        try:
-                            # Remove currency symbols and commas if present
-                            clean_value = str(value).replace('£', '').replace(',', '').strip()
-                            revenue_trend_report_data[db_column] = float(clean_value)
-                        except:
-                            revenue_trend_report_data[db_column] = 0.00
-                    # Handle seller ID (nullable)
-                    elif db_column == 'id_seller':
-                        try:
-                            revenue_trend_report_data[db_column] = int(value) if value else None
-                        except:
-                            revenue_trend_report_data[db_column] = None
-                    else:
-                        revenue_trend_report_data[db_column] = value
-
-            revenue_trend_report = RevenueTrendReport(**revenue_trend_report_data)
-            db_session.add(revenue_trend_report)
 
-        db_session.commit()
-        ProgressDisplay.finalize_line(f"Loaded {len(df)} revenue trend reports into the database")
-    finally:
-        db_session.close()
+def save_seed_hashes(csv_hashes, workbook_hashes):
+    """
+    Record what the database was loaded from, for `incremental`.
+
+    Args:
+        csv_hashes (dict): CSV file name -> content hash
+        workbook_hashes (dict): Path -> content hash of the Excel files the
+        CSV files were exported from
+    """
+
+    write_seed_hashes({
+        'schema': get_schema_hash(Base.metadata),
+        'csv': csv_hashes,
+        'workbooks': workbook_hashes,
+    })
+
+
+def get_workbook_hashes():
+    return {path: hash_file(path) for path in SEED_EXCEL_FILES if os.path.exists(path)}
+
+
+def get_model_classes():
+    return [
+        mapper.class_ for mapper in Base.registry.mappers
+        if issubclass(mapper.class_, BaseModel)
+    ]
+
 
 def run_rebuild(export_csv: bool):
     """
@@ -4371,85 +3001,55 @@ def run_rebuild(export_csv: bool):
     try:
         step = 1
 
+        workbook_hashes = {}
         if export_csv:
             print(f"\nStep {step}: Preparing data files")
             print('-' * 30)
+            workbook_hashes = get_workbook_hashes()
             export_sheets_to_csv()
             step += 1
 
         # Reset database
         print(f"\nStep {step}: Resetting database")
         print('-' * 30)
+        # Until the load is done, the tables match no files
+        write_seed_hashes({})
         print('Dropping existing tables...')
         Base.metadata.drop_all(bind=engine)
         print('Dropped all tables')
         print('Creating fresh tables...')
         Base.metadata.create_all(bind=engine)
-        print('Created all tables')
+        total_indexes = sum(len(table.indexes) for table in Base.metadata.sorted_tables)
+        print(f'Created all tables with {total_indexes} indexes')
+        step += 1
+
+        # Indexes for the global search (`q`) of every model
+        print(f"\nStep {step}: Creating search indexes")
+        print('-' * 30)
+        total_indexes = create_search_indexes(engine, get_model_classes())
+        print(f'Created {total_indexes} search indexes')
         step += 1
 
 
         # Load base data (conditionally based on available CSVs)
         print("\nStep {step}: Loading base data")
         print("-" * 30)
-        load_roles()
-        load_users()
-        load_event_types()
-        load_data_types()
-        load_categories()
-        load_sub_categories()
-        load_selections()
-        load_activity_logs()
-        load_countries()
-        load_states()
-        load_addresses()
-        load_companies()
-        load_company_users()
-        load_buyers()
-        load_sellers()
-        load_dd_users()
-        load_products()
-        load_templates()
-        load_offensive_words()
-        load_blogs()
-        load_orders()
-        load_dataset_orders()
-        load_dataset_order_deliveries()
-        load_live_lead_orders()
-        load_live_lead_delivery_schedules()
-        load_live_lead_order_status_history()
-        load_daily_lead_delivery_logs()
-        load_reviews()
-        load_transactions()
-        load_disputes()
-        load_buyer_reports()
-        load_buyer_dispute_reports()
-        load_buyer_purchase_activity_reports()
-        load_buyer_review_activity_reports()
-        load_buyer_purchase_breakdown_reports()
-        load_seller_reports()
-        load_seller_rating_reports()
-        load_seller_dispute_reports()
-        load_seller_dispute_breakdown_reports()
-        load_seller_listing_reports()
-        load_seller_product_performance_reports()
-        load_top_credits_usage_reports()
-        load_credit_purchased_reports()
-        load_most_verified_reports()
-        load_api_usage_reports()
-        load_check_type_reports()
-        load_revenue_trend_reports()
-        load_dispute_insights_reports()
-        load_top_dispute_reasons_reports()
-        load_top_categories_by_purchase_reports()
-        load_lead_delivery_trend_reports()
-        load_stats_layouts()
+        csv_hashes = get_csv_hashes()
+        wall_time = load_seed_data()
+        print_load_summary(wall_time)
 
         # Generate metadata
         print("\nStep {step}: Generating metadata tables")
         print("-" * 30)
         populate_metadata_tables()
 
+        # The API generates its routes from this file instead of the tables
+        print(f"\nStep {step}: Compiling route registry")
+        print("-" * 30)
+        compile_route_registry()
+
+        save_seed_hashes(csv_hashes, workbook_hashes)
+
         print("\n" + "=" * 60)
         print("Database rebuild completed successfully!")
         print("=" * 60)
@@ -4462,6 +3062,152 @@ def run_rebuild(export_csv: bool):
         raise
 
 
+def get_reload_plan(changed_loaders):
+    """
+    What reloading the tables of `changed_loaders` takes: the tables that
+    reference them are emptied with them, so their loaders run again too.
+
+    Returns:
+        tuple: (loaders to run, tables emptied without a loader to refill
+        them, apart from the regenerated metadata tables)
+    """
+
+    loaders = get_dependent_loaders(SEED_LOADERS, changed_loaders)
+    while True:
+        tables = get_referencing_tables([loader.model_class.__table__ for loader in loaders])
+        referencing_loaders = [
+            loader for loader in SEED_LOADERS
+            if loader.model_class.__table__ in tables and loader not in loaders
+        ]
+        if not referencing_loaders:
+            break
+        loaders = get_dependent_loaders(SEED_LOADERS, [*loaders, *referencing_loaders])
+
+    seeded_tables = {
+        loader.model_class.__table__ for loader in SEED_LOADERS
+    } | {MetadataObject.__table__, MetadataField.__table__, MetadataRelationship.__table__}
+    unseeded_tables = [table for table in tables if table not in seeded_tables]
+    return loaders, unseeded_tables
+
+
+def run_incremental(empty_unseeded=False):
+    """
+    Reload only the tables whose CSV files changed since the last rebuild,
+    and the tables that depend on them. The sheets of the Excel files that
+    changed since the last export are exported first (none after a plain
+    `rebuild`, which doesn't export, so that edits to the CSV files are
+    kept). Falls back to a full rebuild when there is no record of the last
+    one, or the tables changed since.
+
+    Args:
+        empty_unseeded (bool): Empty the tables that reference the reloaded
+        ones but have no seed data, instead of stopping
+    """
+
+    seed_hashes = read_seed_hashes()
+    if seed_hashes.get('schema') != get_schema_hash(Base.metadata):
+        print('The tables changed since the last rebuild (or there was none), rebuilding everything')
+        # Without exporting if the last rebuild didn't either
+        run_rebuild(export_csv=seed_hashes.get('workbooks') != {})
+        return
+
+    print('Starting incremental rebuild...')
+    print('=' * 60)
+
+    try:
+        print("\nStep 1: Exporting changed sheets")
+        print('-' * 30)
+        # Only the workbooks the CSV files were exported from (a recorded
+        # hash) are exported again, the others would overwrite the CSV files
+        exported_hashes = seed_hashes.get('workbooks', {})
+        workbook_hashes = {
+            path: file_hash for path, file_hash in get_workbook_hashes().items()
+            if path in exported_hashes
+        }
+        changed_workbooks = [
+            path for path, file_hash in workbook_hashes.items()
+            if exported_hashes[path] != file_hash
+        ]
+        if changed_workbooks:
+            export_sheets_to_csv(changed_workbooks)
+        elif not exported_hashes:
+            print('The CSV files were not exported by the last rebuild, not exporting any Excel file')
+        else:
+            print('No Excel file changed')
+
+        print("\nStep 2: Finding changed CSV files")
+        print('-' * 30)
+        csv_hashes = get_csv_hashes()
+        loaded_hashes = seed_hashes.get('csv', {})
+        changed_files = sorted(
+            file_name for file_name in set(csv_hashes) | set(loaded_hashes)
+            if csv_hashes.get(file_name) != loaded_hashes.get(file_name)
+        )
+        changed_loaders = [
+            loader for loader in SEED_LOADERS
+            if set(loader.csv_files) & set(changed_files)
+        ]
+        loaders, unseeded_tables = get_reload_plan(changed_loaders)
+        print(f"Changed: {', '.join(changed_files) or 'none'}")
+        if not loaders:
+            save_seed_hashes(csv_hashes, workbook_hashes)
+            print("\n" + "=" * 60)
+            print("Nothing to reload, the database is up to date")
+            print("=" * 60)
+            return
+        print(f"Reloading {len(loaders)} tables: {', '.join(loader.model_class.__tablename__ for loader in loaders)}")
+        if unseeded_tables:
+            table_names = ', '.join(table.name for table in unseeded_tables)
+            print(f"These tables reference them and have no seed data, they would be emptied: {table_names}")
+            if not empty_unseeded:
+                raise click.ClickException(
+                    'Not emptying tables without seed data. Run with --empty-unseeded to empty them anyway'
+                )
+
+        # The tables no longer match the stored hashes until the reload is done
+        write_seed_hashes({})
+
+        print("\nStep 3: Emptying tables")
+        print('-' * 30)
+        db_session = SessionLocal()
+        try:
+            truncated = truncate_tables(db_session, [loader.model_class.__table__ for loader in loaders])
+        finally:
+            db_session.close()
+        print(f"Emptied {len(truncated)} tables")
+
+        print("\nStep 4: Loading changed data")
+        print('-' * 30)
+        wall_time = run_loaders(loaders)
+        print_load_summary(wall_time)
+
+        # The metadata fields and relationships reference users, and were
+        # emptied with them: generate them again, with the same ids as a
+        # rebuild would
+        metadata_tables = {MetadataObject.__table__, MetadataField.__table__, MetadataRelationship.__table__}
+        if metadata_tables & set(truncated):
+            print("\nStep 5: Generating metadata tables")
+            print('-' * 30)
+            db_session = SessionLocal()
+            try:
+                truncate_tables(db_session, [MetadataObject.__table__])
+            finally:
+                db_session.close()
+            populate_metadata_tables()
+            compile_route_registry()
+
+        save_seed_hashes(csv_hashes, workbook_hashes)
+
+        print("\n" + "=" * 60)
+        print("Incremental rebuild completed successfully!")
+        print("=" * 60)
+    except Exception:
+        print("\n" + "=" * 60)
+        print("Incremental rebuild failed.")
+        print("=" * 60)
+        raise
+
+
 @cli.command()
 def rebuild():
     """
@@ -4479,5 +3225,46 @@ def rebuild_with_export():
 
     run_rebuild(export_csv=True)
 
+
+@cli.command()
+@click.option(
+    '--empty-unseeded',
+    is_flag=True,
+    help='Also empty the tables that reference the reloaded ones but have no seed data',
+)
+def incremental(empty_unseeded):
+    """
+    Reload only the seed data of the CSV files and sheets that changed
+    since the last rebuild, and of the tables that depend on it.
+    """
+
+    run_incremental(empty_unseeded=empty_unseeded)
+
+
+@cli.command(name='create-search-extensions')
+def create_search_extensions_command():
+    """
+    Create the Postgres extensions of the search backends (pg_trgm for
+    trigram), then their indexes. Run it once per database, as a role
+    allowed to create extensions.
+    """
+
+    model_classes = get_model_classes()
+    extensions = create_search_extensions(engine, model_classes)
+    print(f'Created extensions: {", ".join(extensions) or "none needed"}')
+    total_indexes = create_search_indexes(engine, model_classes)
+    print(f'Created {total_indexes} search indexes')
+
+
+@cli.command(name='compile-routes')
+def compile_routes():
+    """
+    Compile the route registry from the metadata tables, without rebuilding
+    the database.
+    """
+
+    compile_route_registry()
+
+
 if __name__ == '__main__':
     cli()
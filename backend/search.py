@@ -0,0 +1,265 @@
+"""
+Search backends for the global `q` parameter of `BaseModel.get_items`.
+
+The backend of a model comes from `__table__.info['search']['backend']`
+(set through the model's `_info`), falling back to the SEARCH_BACKEND
+environment variable:
+
+- ilike (default): `column ILIKE '%q%'` on every searchable column. Needs no
+  index but always scans the table.
+- trigram: Same ILIKE conditions, served by pg_trgm GIN indexes, and ranked
+  by `word_similarity()`.
+- fulltext: A tsvector built from the searchable columns, matched with
+  `websearch_to_tsquery()` and ranked by `ts_rank()`. Matches whole words
+  instead of substrings.
+
+trigram and fulltext order the results of a search by rank (when no
+`sort_by` is given) instead of by id, so a model opts in explicitly, e.g.
+`_info = {'search': {'backend': 'trigram'}}`.
+
+The indexes are created by `create_search_indexes()`, which the `rebuild`
+CLI runs after creating the tables. The extensions they need (pg_trgm) are
+not created there, since that takes more privileges than the application
+role usually has: run the `create-search-extensions` CLI once per database
+as a role allowed to create them. Until then, the models of the trigram
+backend are searched with ilike and their indexes are skipped.
+"""
+
+import os
+import logging
+
+from sqlalchemy import or_, func, literal_column, text, String
+from sqlalchemy.dialects import postgresql
+
+from backend.helpers import TTLCache
+
+
+logger = logging.getLogger(__name__)
+
+SEARCH_BACKEND = os.getenv('SEARCH_BACKEND', 'ilike')
+
+# How long whether an extension is installed is trusted, so that one created
+# while the API runs is picked up
+SEARCH_EXTENSION_CHECK_TTL = float(os.getenv('SEARCH_EXTENSION_CHECK_TTL', '60'))
+
+# Text search configuration of the fulltext backend. `simple` doesn't stem,
+# which suits names, codes and emails better than a language configuration.
+FULLTEXT_CONFIG = os.getenv('SEARCH_FULLTEXT_CONFIG', 'simple')
+
+
+def get_searchable_columns(model_class):
+    """
+    The string columns of the model's own `searchable_fields`. Fields of
+    joined models (`role_details.name`) aren't part of the model's index.
+    """
+
+    columns = []
+    for field in getattr(model_class, 'searchable_fields', []):
+        if '.' in field:
+            continue
+        column = getattr(model_class, field)
+        if isinstance(column.type, String):
+            columns.append(column)
+    return columns
+
+
+def _get_partial_index_clause(model_class):
+    # Every listing filters out soft deleted rows, so the indexes can skip them
+    if 'deleted_at' in model_class.__table__.columns:
+        return ' WHERE deleted_at IS NULL'
+    return ''
+
+
+def is_extension_installed(connection, extension):
+    return bool(connection.execute(
+        text('SELECT 1 FROM pg_extension WHERE extname = :extension'),
+        {'extension': extension},
+    ).scalar())
+
+
+class IlikeSearchBackend:
+    name = 'ilike'
+    extension = None
+
+    def is_available(self, db_session):
+        return True
+
+    def get_condition(self, model_class, columns, q):
+        return or_(*[column.ilike(f'%{q}%') for column in columns])
+
+    def get_rank(self, model_class, columns, q):
+        return None
+
+    def get_index_statements(self, model_class, columns):
+        return []
+
+
+class TrigramSearchBackend(IlikeSearchBackend):
+    name = 'trigram'
+    extension = 'pg_trgm'
+
+    def __init__(self):
+        # Database URL -> whether pg_trgm is installed
+        self._is_installed = TTLCache(ttl=SEARCH_EXTENSION_CHECK_TTL)
+
+    def is_available(self, db_session):
+        key = str(db_session.get_bind().url)
+        is_installed = self._is_installed.get(key)
+        if is_installed is None:
+            is_installed = is_extension_installed(db_session, self.extension)
+            self._is_installed.set(key, is_installed)
+        return is_installed
+
+    def reset(self):
+        self._is_installed.clear()
+
+    def get_rank(self, model_class, columns, q):
+        return func.greatest(*[func.word_similarity(q, column) for column in columns])
+
+    def get_index_statements(self, model_class, columns):
+        table_name = model_class.__tablename__
+        where = _get_partial_index_clause(model_class)
+        statements = []
+        for column in columns:
+            statements.append(
+                f'CREATE INDEX IF NOT EXISTS ix_{table_name}_{column.key}_trgm '
+                f'ON {table_name} USING gin ({column.key} gin_trgm_ops){where}'
+            )
+        return statements
+
+
+class FullTextSearchBackend:
+    name = 'fulltext'
+    extension = None
+
+    def is_available(self, db_session):
+        return True
+
+    @staticmethod
+    def _get_config():
+        # Inlined (not a bind parameter) so the expression matches the index
+        return literal_column(f"'{FULLTEXT_CONFIG}'::regconfig")
+
+    def get_document(self, columns):
+        """
+        The tsvector of the searchable columns. The index is created on the
+        exact same expression, so everything in it is rendered inline.
+        """
+
+        document = None
+        for column in columns:
+            value = func.coalesce(column, literal_column("''", String))
+            document = value if document is None else document + literal_column("' '", String) + value
+        return func.to_tsvector(self._get_config(), document)
+
+    def get_condition(self, model_class, columns, q):
+        query = func.websearch_to_tsquery(self._get_config(), q)
+        return self.get_document(columns).op('@@')(query)
+
+    def get_rank(self, model_class, columns, q):
+        query = func.websearch_to_tsquery(self._get_config(), q)
+        return func.ts_rank(self.get_document(columns), query)
+
+    def get_index_statements(self, model_class, columns):
+        table_name = model_class.__tablename__
+        document_sql = self.get_document(columns).compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={'literal_binds': True},
+        )
+        where = _get_partial_index_clause(model_class)
+        return [
+            f'CREATE INDEX IF NOT EXISTS ix_{table_name}_search_tsv '
+            f'ON {table_name} USING gin (({document_sql})){where}'
+        ]
+
+
+SEARCH_BACKENDS = {
+    backend.name: backend
+    for backend in (
+        IlikeSearchBackend(),
+        TrigramSearchBackend(),
+        FullTextSearchBackend(),
+    )
+}
+
+
+def get_search_backend_name(model_class):
+    search_info = model_class.__table__.info.get('search', {})
+    name = search_info.get('backend', SEARCH_BACKEND)
+    return name if name in SEARCH_BACKENDS else 'ilike'
+
+
+def get_search_backend(model_class, db_session):
+    """
+    The search backend to use for a model on this database. Anything but
+    ilike needs Postgres (and pg_trgm for trigram).
+    """
+
+    backend = SEARCH_BACKENDS[get_search_backend_name(model_class)]
+    if backend.name == 'ilike':
+        return backend
+    if db_session.get_bind().dialect.name != 'postgresql' or not backend.is_available(db_session):
+        return SEARCH_BACKENDS['ilike']
+    return backend
+
+
+def _get_search_model_backends(model_classes):
+    for model_class in model_classes:
+        columns = get_searchable_columns(model_class)
+        if columns:
+            yield model_class, columns, SEARCH_BACKENDS[get_search_backend_name(model_class)]
+
+
+def create_search_extensions(engine, model_classes):
+    """
+    Create the extensions needed by the search backends of these models.
+    Needs a role allowed to create them (a superuser, or the owner of the
+    database for trusted extensions like pg_trgm).
+
+    Returns:
+        list: Names of the extensions
+    """
+
+    extensions = sorted({
+        backend.extension
+        for _, _, backend in _get_search_model_backends(model_classes)
+        if backend.extension
+    })
+    with engine.begin() as connection:
+        for extension in extensions:
+            connection.execute(text(f'CREATE EXTENSION IF NOT EXISTS {extension}'))
+    for backend in SEARCH_BACKENDS.values():
+        if hasattr(backend, 'reset'):
+            backend.reset()
+    return extensions
+
+
+def create_search_indexes(engine, model_classes):
+    """
+    Create the search indexes of every model, based on its searchable
+    fields and search backend. The indexes of a backend whose extension
+    isn't installed are skipped (see `create_search_extensions`).
+
+    Returns:
+        int: Number of indexes created
+    """
+
+    total_indexes = 0
+    with engine.begin() as connection:
+        installed_extensions = {}
+        for model_class, columns, backend in _get_search_model_backends(model_classes):
+            if backend.extension:
+                if backend.extension not in installed_extensions:
+                    installed_extensions[backend.extension] = is_extension_installed(connection, backend.extension)
+                if not installed_extensions[backend.extension]:
+                    logger.warning(
+                        f'Skipping the search indexes of {model_class.__tablename__}: '
+                        f'the {backend.extension} extension is not installed '
+                        f'(run the create-search-extensions command)'
+                    )
+                    continue
+
+            for statement in backend.get_index_statements(model_class, columns):
+                connection.execute(text(statement))
+                total_indexes += 1
+    return total_indexes
@@ -0,0 +1,26 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+
+@pytest.fixture
+def make_session():
+    """
+    Open a session on a fresh in-memory SQLite database with the given
+    tables created, e.g. `make_session(OffensiveWord.__table__)`.
+    """
+
+    sessions = []
+
+    def make(*tables):
+        engine = create_engine('sqlite://')
+        for table in tables:
+            table.create(engine)
+        db_session = Session(engine)
+        sessions.append(db_session)
+        return db_session
+
+    yield make
+
+    for db_session in sessions:
+        db_session.close()
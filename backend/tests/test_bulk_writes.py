@@ -0,0 +1,146 @@
+from datetime import datetime
+from typing import Optional
+
+import pydantic
+import pytest
+from sqlalchemy import Column, DateTime, Integer, String, select
+from sqlalchemy.orm import declarative_base
+
+from backend.actions import DynamicActions
+from backend.exceptions import InvalidRequestData
+
+
+Base = declarative_base()
+
+
+class BulkItem(Base):
+    __tablename__ = 'bulk_items'
+    __table_args__ = {'info': {'name': 'Bulk Item'}}
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, unique=True, nullable=False, info={'is_initializable': True})
+    quantity = Column(Integer, info={'is_initializable': True})
+    deleted_at = Column(DateTime)
+
+    updateable_fields = ['name', 'quantity']
+
+
+class BulkItemCreate(pydantic.BaseModel):
+    name: str
+    quantity: Optional[int] = None
+
+
+class BulkItemUpdate(pydantic.BaseModel):
+    name: Optional[str] = None
+    quantity: Optional[int] = None
+
+
+@pytest.fixture
+def db_session(make_session):
+    db_session = make_session(BulkItem.__table__)
+    db_session.add_all([BulkItem(name='first', quantity=1), BulkItem(name='second', quantity=2)])
+    db_session.commit()
+    return db_session
+
+
+def bulk_create(db_session, items, atomic):
+    return DynamicActions.bulk_create(
+        BulkItem, items, db_session, BulkItemCreate, atomic=atomic, return_mode='minimal',
+    )
+
+
+def bulk_update(db_session, items, atomic):
+    return DynamicActions.bulk_update(
+        BulkItem, items, db_session, BulkItemUpdate, atomic=atomic, return_mode='minimal',
+    )
+
+
+def get_names(db_session):
+    return db_session.scalars(
+        select(BulkItem.name).where(BulkItem.deleted_at == None).order_by(BulkItem.id)
+    ).all()
+
+
+def test_bulk_create_returns_the_items_in_request_order(db_session):
+    created_items, errors = bulk_create(db_session, [{'name': 'third'}, {'name': 'fourth', 'quantity': 4}], atomic=True)
+
+    assert errors == []
+    assert [item['id'] for item in created_items] == [3, 4]
+    assert get_names(db_session) == ['first', 'second', 'third', 'fourth']
+
+
+def test_atomic_bulk_create_fails_on_any_invalid_item(db_session):
+    with pytest.raises(InvalidRequestData):
+        bulk_create(db_session, [{'name': 'third'}, {'quantity': 'many'}], atomic=True)
+    # A duplicate only fails in the database
+    with pytest.raises(InvalidRequestData):
+        bulk_create(db_session, [{'name': 'third'}, {'name': 'first'}], atomic=True)
+
+    assert get_names(db_session) == ['first', 'second']
+
+
+def test_non_atomic_bulk_create_skips_the_failing_items(db_session):
+    items = [
+        {'name': 'third'},
+        {'quantity': 5},
+        {'name': 'first'},
+        {'name': 'fourth', 'quantity': 'many'},
+        {'name': 'fifth'},
+    ]
+    created_items, errors = bulk_create(db_session, items, atomic=False)
+
+    assert len(created_items) == 2
+    assert [(error['index'], error['field']) for error in errors] == [
+        (1, 'name'),
+        (2, 'item'),
+        (3, 'quantity'),
+    ]
+    assert get_names(db_session) == ['first', 'second', 'third', 'fifth']
+
+
+def test_bulk_update(db_session):
+    updated_items, errors = bulk_update(db_session, [{'id': 2, 'quantity': 20}, {'id': 1, 'name': 'one'}], atomic=True)
+
+    assert errors == []
+    assert [item['id'] for item in updated_items] == [2, 1]
+    assert db_session.scalars(select(BulkItem.quantity).order_by(BulkItem.id)).all() == [1, 20]
+    assert get_names(db_session) == ['one', 'second']
+
+
+def test_atomic_bulk_update_fails_on_a_missing_item(db_session):
+    with pytest.raises(InvalidRequestData):
+        bulk_update(db_session, [{'id': 1, 'quantity': 10}, {'id': 99, 'quantity': 10}], atomic=True)
+
+    assert db_session.scalars(select(BulkItem.quantity).order_by(BulkItem.id)).all() == [1, 2]
+
+
+def test_non_atomic_bulk_update_skips_the_failing_items(db_session):
+    items = [
+        {'quantity': 10},
+        {'id': 99, 'quantity': 10},
+        {'id': 1, 'name': 'second'},
+        {'id': 2, 'quantity': 20},
+    ]
+    updated_items, errors = bulk_update(db_session, items, atomic=False)
+
+    assert [item['id'] for item in updated_items] == [2]
+    assert [(error['index'], error['field']) for error in errors] == [
+        (0, 'id'),
+        (1, 'id'),
+        (2, 'item'),
+    ]
+    assert get_names(db_session) == ['first', 'second']
+    assert db_session.scalars(select(BulkItem.quantity).order_by(BulkItem.id)).all() == [1, 20]
+
+
+def test_bulk_delete_soft_deletes(db_session):
+    with pytest.raises(InvalidRequestData):
+        DynamicActions.bulk_delete(BulkItem, [1, 99], db_session, atomic=True)
+    assert get_names(db_session) == ['first', 'second']
+
+    deleted_items, errors = DynamicActions.bulk_delete(BulkItem, [1, 99], db_session, atomic=False)
+
+    assert [item['id'] for item in deleted_items] == [1]
+    assert [error['index'] for error in errors] == [1]
+    assert get_names(db_session) == ['second']
+    assert isinstance(db_session.get(BulkItem, 1).deleted_at, datetime)
@@ -0,0 +1,102 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from backend.exceptions import InvalidRequestData
+from backend.helpers import decode_cursor, encode_cursor
+from backend.models import OffensiveWord
+
+
+@pytest.fixture
+def db_session(make_session):
+    db_session = make_session(OffensiveWord.__table__)
+    # last_updated_at is nullable, usage_count isn't
+    days = [3, None, 1, 3, None, 2, 1]
+    db_session.add_all(
+        OffensiveWord(
+            word=f'word{index}',
+            usage_count=day or 0,
+            last_updated_at=datetime(2024, 1, day) if day else None,
+            id_created_by_user=1,
+        )
+        for index, day in enumerate(days)
+    )
+    db_session.commit()
+    return db_session
+
+
+@pytest.mark.parametrize('value', [
+    datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc),
+    date(2024, 1, 15),
+    Decimal('1500.50'),
+    42,
+    'word',
+    None,
+])
+def test_cursor_round_trip(value):
+    cursor = encode_cursor('field', True, value, 7)
+    assert '=' not in cursor
+    assert decode_cursor(cursor) == {
+        'field': 'field',
+        'reverse': True,
+        'value': value,
+        'id': 7,
+    }
+
+
+@pytest.mark.parametrize('cursor', ['', 'not a cursor', encode_cursor('id', False, 1, 1)[:-4]])
+def test_malformed_cursor_decodes_to_none(cursor):
+    assert decode_cursor(cursor) is None
+
+
+@pytest.mark.parametrize('cursor', [
+    'not a cursor',
+    # Issued for another sort
+    encode_cursor('word', False, 'word1', 1),
+    encode_cursor('last_updated_at', True, None, 1),
+])
+def test_mismatching_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidRequestData):
+        OffensiveWord.get_seek_condition(OffensiveWord.last_updated_at, False, cursor)
+
+
+def get_ordered_ids(db_session, sort_column, reverse, page_size=2):
+    """
+    Walk the whole table page by page with the seek condition, ordered the
+    way Postgres orders NULLs by default.
+    """
+
+    if reverse:
+        order_by = [sort_column.desc().nulls_first(), OffensiveWord.id.desc()]
+    else:
+        order_by = [sort_column.asc().nulls_last(), OffensiveWord.id.asc()]
+
+    ids = []
+    cursor = None
+    while True:
+        query = select(OffensiveWord).order_by(*order_by).limit(page_size)
+        if cursor is not None:
+            query = query.where(OffensiveWord.get_seek_condition(sort_column, reverse, cursor))
+        items = db_session.scalars(query).all()
+        if not items:
+            return ids
+        ids.extend(item.id for item in items)
+        last_item = items[-1]
+        cursor = encode_cursor(sort_column.key, reverse, getattr(last_item, sort_column.key), last_item.id)
+
+
+@pytest.mark.parametrize('field', ['id', 'word', 'usage_count', 'last_updated_at'])
+@pytest.mark.parametrize('reverse', [False, True])
+def test_seek_pages_match_the_full_listing(db_session, field, reverse):
+    sort_column = getattr(OffensiveWord, field)
+    items = db_session.scalars(select(OffensiveWord)).all()
+    # NULLs last in ascending order, first in descending order
+    expected_items = sorted(
+        items,
+        key=lambda item: (getattr(item, field) is None, getattr(item, field) or 0, item.id),
+        reverse=reverse,
+    )
+
+    assert get_ordered_ids(db_session, sort_column, reverse) == [item.id for item in expected_items]
@@ -0,0 +1,94 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from backend.helpers import FilterPlan
+from backend.models import OffensiveWord, Product
+
+
+@pytest.fixture
+def plan():
+    return FilterPlan(OffensiveWord, {})
+
+
+def get_operations(filter_dict):
+    return {key: value for key, value in filter_dict.items() if key not in ('model', 'field')}
+
+
+def test_value_kinds_follow_the_column_types(plan):
+    kinds = {field_path: kind for field_path, (_, _, kind) in plan.filter_fields.items()}
+    assert kinds['id'] == 'integer'
+    assert kinds['word'] == 'string'
+    assert kinds['is_active'] == 'boolean'
+    assert kinds['added_date'] == 'datetime'
+    assert FilterPlan(Product, {}).filter_fields['price'][2] == 'number'
+
+
+@pytest.mark.parametrize('value, operations', [
+    ('5', {'equal_to': 5}),
+    ('in:1,2,3', {'in': [1, 2, 3]}),
+    ('between:1,10', {'greater_than_or_equal_to': 1, 'lesser_than_or_equal_to': 10}),
+    ('<=10', {'lesser_than_or_equal_to': 10}),
+    ('>=10', {'greater_than_or_equal_to': 10}),
+    ('<10', {'lesser_than': 10}),
+    ('>10', {'greater_than': 10}),
+    ('is:null', {'is_null': True}),
+    ('is:not_null', {'is_null': False}),
+])
+def test_integer_operations(plan, value, operations):
+    filter_dict = plan.parse_filter('usage_count', value)
+    assert filter_dict['model'] is OffensiveWord
+    assert filter_dict['field'] == 'usage_count'
+    assert get_operations(filter_dict) == operations
+
+
+def test_string_wildcards(plan):
+    assert get_operations(plan.parse_filter('word', '~bad')) == {'contains': 'bad'}
+    assert get_operations(plan.parse_filter('word', '^bad')) == {'starts_with': 'bad'}
+    # Wildcards only apply to strings
+    assert plan.parse_filter('usage_count', '~1') is None
+
+
+def test_plain_date_on_datetime_field_is_the_whole_day(plan):
+    assert get_operations(plan.parse_filter('added_date', '2024-01-31')) == {
+        'greater_than_or_equal_to': datetime(2024, 1, 31),
+        'lesser_than_or_equal_to': datetime.combine(datetime(2024, 1, 31), datetime.max.time()),
+    }
+    operations = get_operations(plan.parse_filter('added_date', 'between:2024-01-01,2024-01-31'))
+    assert operations['greater_than_or_equal_to'] == datetime(2024, 1, 1)
+    assert operations['lesser_than_or_equal_to'] == datetime.combine(datetime(2024, 1, 31), datetime.max.time())
+    assert get_operations(plan.parse_filter('added_date', '>=2024-01-31T10:30:00')) == {
+        'greater_than_or_equal_to': datetime(2024, 1, 31, 10, 30),
+    }
+
+
+def test_numeric_values_are_decimals():
+    plan = FilterPlan(Product, {})
+    assert get_operations(plan.parse_filter('price', '1500.5')) == {'equal_to': Decimal('1500.5')}
+    assert get_operations(plan.parse_filter('price', 'between:100,1500')) == {
+        'greater_than_or_equal_to': Decimal('100'),
+        'lesser_than_or_equal_to': Decimal('1500'),
+    }
+    assert plan.parse_filter('price', 'nan') is None
+    assert plan.parse_filter('price', '>=abc') is None
+
+
+def test_booleans_only_take_equality(plan):
+    assert get_operations(plan.parse_filter('is_active', 'true')) == {'equal_to': True}
+    assert get_operations(plan.parse_filter('is_active', 'FALSE')) == {'equal_to': False}
+    assert get_operations(plan.parse_filter('is_active', 'in:true,false')) == {'in': [True, False]}
+    assert plan.parse_filter('is_active', 'yes') is None
+    assert plan.parse_filter('is_active', '>false') is None
+    assert plan.parse_filter('is_active', 'between:false,true') is None
+
+
+@pytest.mark.parametrize('field_path, value', [
+    ('usage_count', 'abc'),
+    ('usage_count', 'between:1'),
+    ('added_date', 'not a date'),
+    ('unknown', '1'),
+    ('role_details.id', '1'),
+])
+def test_invalid_filters_are_dropped(plan, field_path, value):
+    assert plan.parse_filter(field_path, value) is None
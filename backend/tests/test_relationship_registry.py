@@ -0,0 +1,58 @@
+import pytest
+from sqlalchemy import update
+
+import backend.actions as actions_module
+from backend.models import MetadataRelationship
+
+
+@pytest.fixture
+def invalidations(monkeypatch):
+    invalidations = []
+    monkeypatch.setattr(actions_module.relationship_registry, 'invalidate', lambda: invalidations.append(1))
+    return invalidations
+
+
+@pytest.fixture
+def db_session(make_session):
+    return make_session(MetadataRelationship.__table__)
+
+
+def make_relationship(name):
+    return MetadataRelationship(
+        name=name,
+        display_name=name,
+        relationship_type='many_to_one',
+        source_object_type='User',
+        target_object_type='Role',
+        id_metadata_object_source=1,
+        id_metadata_object_target=2,
+    )
+
+
+def test_flushed_relationship_invalidates_on_outer_commit(db_session, invalidations):
+    db_session.add(make_relationship('role'))
+    db_session.flush()
+    assert invalidations == []
+
+    with db_session.begin_nested():
+        db_session.add(make_relationship('company'))
+    # Releasing the savepoint doesn't commit anything yet
+    assert invalidations == []
+
+    db_session.commit()
+    assert invalidations == [1]
+
+
+def test_rolled_back_relationship_statement_does_not_invalidate(db_session, invalidations):
+    db_session.add(make_relationship('role'))
+    db_session.commit()
+    invalidations.clear()
+
+    db_session.execute(update(MetadataRelationship).values(display_name='Role'))
+    db_session.rollback()
+    assert invalidations == []
+
+    # The mark of the rolled back transaction is gone
+    db_session.add(make_relationship('company'))
+    db_session.commit()
+    assert invalidations == [1]
@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy import Column, Integer, String, insert
+from sqlalchemy.orm import declarative_base
+
+import backend.response_cache as response_cache_module
+from backend.actions import _write_bulk
+from backend.response_cache import MemoryCacheBackend, ResponseCache
+
+
+Base = declarative_base()
+
+
+class CachedItem(Base):
+    __tablename__ = 'cached_items'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, unique=True, nullable=False)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ResponseCache(MemoryCacheBackend())
+    monkeypatch.setattr(response_cache_module, 'response_cache', cache)
+    return cache
+
+
+@pytest.fixture
+def db_session(make_session):
+    return make_session(CachedItem.__table__)
+
+
+def get_generation(cache):
+    return cache.backend.get_generations(['cached_items'])[0]
+
+
+def write(db_session, payloads):
+    return db_session.scalars(insert(CachedItem).returning(CachedItem), payloads).all()
+
+
+def test_bulk_write_with_failing_item_invalidates_on_outer_commit(db_session, cache):
+    db_session.add(CachedItem(name='first'))
+    db_session.flush()
+
+    rows = [(0, {'name': 'second'}), (1, {'name': 'first'}), (2, {'name': 'third'})]
+    written_items, errors = _write_bulk(db_session, rows, lambda payloads: write(db_session, payloads), atomic=False)
+
+    assert [item.name for item in written_items] == ['second', 'third']
+    assert [error['index'] for error in errors] == [1]
+    # Neither the released nor the failed savepoints invalidate anything
+    assert get_generation(cache) == 0
+
+    db_session.commit()
+    assert get_generation(cache) == 1
+
+
+def test_outer_rollback_forgets_the_changed_tables(db_session, cache):
+    with db_session.begin_nested():
+        db_session.add(CachedItem(name='first'))
+    db_session.rollback()
+    db_session.commit()
+
+    assert get_generation(cache) == 0
@@ -0,0 +1,77 @@
+"""
+Measure the cold start of the API (importing backend.main, which generates
+the routes), with the routes generated from the compiled route registry vs
+from the metadata tables. Every run is a fresh interpreter.
+
+Compile the registry first (`python -m backend.scripts compile-routes`),
+then e.g.
+
+    python dev/benchmark_cold_start.py --repeat 5
+"""
+
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+from pathlib import Path
+
+# Ensure project root on path
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from backend.meta.route_registry import ROUTE_REGISTRY_PATH
+
+
+IMPORT_SCRIPT = '''
+import time
+start_time = time.perf_counter()
+import backend.main
+print(f'{(time.perf_counter() - start_time) * 1000:.2f} {len(backend.main.app.routes)}')
+'''
+
+
+def run(registry_path, repeat):
+    env = {**os.environ, 'ROUTE_REGISTRY_PATH': registry_path}
+    timings = []
+    total_routes = None
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, '-c', IMPORT_SCRIPT],
+            cwd=root,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        duration, total_routes = result.stdout.strip().splitlines()[-1].split()
+        timings.append(float(duration))
+    return timings, int(total_routes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the cold start of the API')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if not Path(ROUTE_REGISTRY_PATH).exists():
+        print(f'{ROUTE_REGISTRY_PATH} does not exist, run `python -m backend.scripts compile-routes` first')
+        sys.exit(1)
+
+    variants = (
+        ('route registry', ROUTE_REGISTRY_PATH),
+        # A path that doesn't exist, so the tables are read
+        ('metadata tables', f'{ROUTE_REGISTRY_PATH}.missing'),
+    )
+    for name, registry_path in variants:
+        timings, total_routes = run(registry_path, args.repeat)
+        print(
+            f'{name:20} median {statistics.median(timings):8.2f} ms, '
+            f'min {min(timings):8.2f} ms, {total_routes} routes'
+        )
+
+
+if __name__ == '__main__':
+    main()
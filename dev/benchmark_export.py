@@ -0,0 +1,132 @@
+"""
+Time the export of the Excel sheets to CSV files (`rebuild-with-export`) on
+a generated workbook, e.g. 50 sheets of 10,000 rows:
+
+    python dev/benchmark_export.py --sheets 50 --rows 500000
+
+Compares reading every sheet with its own `pd.read_excel` call, which opens
+the workbook again each time, with `export_sheets_to_csv`, which opens it
+once, for every engine installed (openpyxl, and calamine with the
+python-calamine package). The CSV files of all the runs must be the same.
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import importlib.util
+from pathlib import Path
+from datetime import datetime, timedelta
+
+import pandas as pd
+from openpyxl import Workbook
+
+# Ensure project root on path
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+
+COLUMNS = ['ID', 'Name', 'Email', 'Status', 'Amount', 'Created At', 'Active', 'Notes']
+STATUSES = ['Active', 'Pending', 'Suspended', 'Closed']
+
+
+def write_workbook(path, sheets, rows):
+    """A workbook of `sheets` sheets sharing `rows` rows, with repeated and unique strings."""
+
+    workbook = Workbook(write_only=True)
+    start_date = datetime(2024, 1, 1)
+    rows_per_sheet = max(1, rows // sheets)
+    for sheet_index in range(sheets):
+        sheet = workbook.create_sheet(f'Sheet {sheet_index + 1}')
+        sheet.append(COLUMNS)
+        for row_index in range(rows_per_sheet):
+            number = sheet_index * rows_per_sheet + row_index
+            sheet.append([
+                number + 1,
+                f'Company {number % 500}',
+                f'user{number}@example.com',
+                STATUSES[number % len(STATUSES)],
+                round(number * 1.37 % 10000, 2),
+                start_date + timedelta(minutes=number),
+                number % 3 != 0,
+                f'Note {number}' if number % 7 == 0 else None,
+            ])
+    workbook.save(path)
+    return rows_per_sheet * sheets
+
+
+def export_per_sheet(excel_file, csv_dir):
+    """The export before: the sheet names, then one `pd.read_excel` per sheet."""
+
+    from backend.helpers import to_snake_case
+
+    for sheet_name in pd.ExcelFile(excel_file).sheet_names:
+        df = pd.read_excel(excel_file, sheet_name=sheet_name)
+        df.to_csv(os.path.join(csv_dir, f'{to_snake_case(sheet_name)}.csv'), index=False)
+
+
+def read_csv_files(csv_dir):
+    return {path.name: path.read_bytes() for path in sorted(Path(csv_dir).glob('*.csv'))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the export of Excel sheets to CSV files')
+    parser.add_argument('--sheets', type=int, default=50)
+    parser.add_argument('--rows', type=int, default=500000, help='Rows of all the sheets together')
+    parser.add_argument('--workbook', help='Existing workbook to export instead of a generated one')
+    parser.add_argument('--skip-per-sheet', action='store_true', help="Don't time the export with one read per sheet")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        excel_file = args.workbook
+        if not excel_file:
+            excel_file = os.path.join(work_dir, 'benchmark.xlsx')
+            start_time = time.perf_counter()
+            total_rows = write_workbook(excel_file, args.sheets, args.rows)
+            print(
+                f'Generated {args.sheets} sheets, {total_rows:,} rows '
+                f'({os.path.getsize(excel_file) / 1e6:.1f} MB) in {time.perf_counter() - start_time:.1f} s'
+            )
+
+        csv_dir = os.path.join(work_dir, 'csv')
+        os.makedirs(csv_dir)
+        # Read by backend.bulk_load when it's imported
+        os.environ['SEED_CSV_DIR'] = csv_dir
+        from backend.scripts import export_sheets_to_csv
+
+        runs = []
+        if not args.skip_per_sheet:
+            runs.append(('read_excel per sheet', lambda: export_per_sheet(excel_file, csv_dir)))
+        for excel_engine in ['openpyxl', 'calamine']:
+            if excel_engine == 'calamine' and importlib.util.find_spec('python_calamine') is None:
+                print('Skipping calamine, python-calamine is not installed')
+                continue
+            runs.append((
+                f'single pass ({excel_engine})',
+                lambda excel_engine=excel_engine: export_sheets_to_csv([excel_file], excel_engine),
+            ))
+
+        results = []
+        expected = None
+        for name, export in runs:
+            shutil.rmtree(csv_dir)
+            os.makedirs(csv_dir)
+            start_time = time.perf_counter()
+            export()
+            duration = time.perf_counter() - start_time
+            csv_files = read_csv_files(csv_dir)
+            if expected is None:
+                expected = csv_files
+            same = 'same CSV files' if csv_files == expected else 'DIFFERENT CSV files'
+            results.append((name, duration, same))
+
+        print()
+        for name, duration, same in results:
+            print(f'{name:30} {duration:>8.2f} s  {same}')
+
+
+if __name__ == '__main__':
+    main()
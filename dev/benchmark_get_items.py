@@ -0,0 +1,116 @@
+"""
+Compare the loading paths of `get_items(details=True)`:
+
+- entities + window: ORM entities, list joins outer joined in the main query
+- projection + window: plain columns, list joins outer joined
+- projection + select_in: plain columns, one `WHERE fk IN (...)` query per
+  list join
+
+Runs against the database in POSTGRES_URL, using the join plan from the
+metadata relationships (or the metadata fields list join for
+MetadataObject), e.g.
+
+    python dev/benchmark_get_items.py --model Transaction --page-size 10000
+    python dev/benchmark_get_items.py --model MetadataObject --page-size 100
+"""
+
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+# Ensure project root on path
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from backend.database import SessionLocal
+from backend.models import MetadataObject, MetadataField
+from backend.actions import get_model_relationships, relationship_registry
+
+
+VARIANTS = (
+    ('entities + window', False, 'window'),
+    ('projection + window', True, 'window'),
+    ('projection + select_in', True, 'select_in'),
+)
+
+
+def get_relationships(model_class, db_session):
+    if model_class is MetadataObject:
+        # Same list join as MetadataActions.get_all_metadata_objects
+        return {
+            'joins': [],
+            'list_joins': [{
+                'model': MetadataField,
+                'column': 'id_metadata_object',
+                'as_': 'metadata_fields_details',
+                'sort_by': 'id',
+                'reverse': True,
+                'limit': 500,
+            }],
+        }
+    return get_model_relationships(model_class, db_session)
+
+
+def run(model_class, page_size, repeat, projection, list_join_strategy):
+    timings = []
+    returned_items = 0
+    for _ in range(repeat):
+        db_session = SessionLocal()
+        try:
+            relationships = get_relationships(model_class, db_session)
+            start = time.perf_counter()
+            items, pagination = model_class.get_items(
+                db_session=db_session,
+                details=True,
+                pagination={'page': 1, 'page_size': page_size, 'count_mode': 'none'},
+                joins=relationships['joins'],
+                list_joins=relationships['list_joins'],
+                projection=projection,
+                list_join_strategy=list_join_strategy,
+            )
+            timings.append(time.perf_counter() - start)
+            returned_items = len(items)
+        finally:
+            db_session.close()
+    return timings, returned_items
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--model', default='Transaction', help='Model class name')
+    parser.add_argument('--page-size', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    model_class = relationship_registry.model_map.get(args.model)
+    if model_class is None:
+        parser.error(f'Unknown model {args.model}')
+
+    # Warm up the connection pool and the relationship registry
+    run(model_class, 1, 1, projection=False, list_join_strategy='window')
+
+    baseline = None
+    for label, projection, list_join_strategy in VARIANTS:
+        timings, returned_items = run(
+            model_class,
+            args.page_size,
+            args.repeat,
+            projection,
+            list_join_strategy,
+        )
+        median = statistics.median(timings)
+        baseline = baseline or median
+        print(
+            f'{label:<24} {returned_items} rows  '
+            f'median {median * 1000:.1f} ms  '
+            f'min {min(timings) * 1000:.1f} ms  '
+            f'max {max(timings) * 1000:.1f} ms  '
+            f'speedup {baseline / median:.2f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
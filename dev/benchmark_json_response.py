@@ -0,0 +1,101 @@
+"""
+Compare the serialization of a `responsify` page:
+
+- jsonable_encoder + JSONResponse: what FastAPI does with a returned dict
+- FastJSONResponse: orjson on the dict as is (what the generated routes use)
+
+The page looks like a get_all page with joined `*_details` dicts, e.g.
+
+    python dev/benchmark_json_response.py --rows 1000 --repeat 20
+"""
+
+import sys
+import json
+import time
+import argparse
+import statistics
+from enum import Enum
+from pathlib import Path
+from decimal import Decimal
+from datetime import date, datetime, UTC
+
+# Ensure project root on path
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from backend.helpers import responsify, FastJSONResponse
+
+
+class Status(Enum):
+    ACTIVE = 'active'
+    PAUSED = 'paused'
+
+
+def build_page(rows):
+    items = []
+    for i in range(rows):
+        items.append({
+            'id': i,
+            'created_at': datetime(2024, 1, 1, tzinfo=UTC).isoformat(),
+            'order_code': f'LLO{i:06d}',
+            'amount': Decimal('1234.56') + i,
+            'quantity': Decimal('10'),
+            'delivery_date': date(2024, 2, 1),
+            'status': Status.ACTIVE if i % 2 else Status.PAUSED,
+            'notes': None,
+            'buyer_details': {
+                'id': i % 50,
+                'name': f'Buyer {i % 50}',
+                'email': f'buyer{i % 50}@example.com',
+                'credit_balance': Decimal('99.90'),
+                'created_at': datetime(2023, 6, 1, tzinfo=UTC).isoformat(),
+            },
+            'product_details': {
+                'id': i % 20,
+                'name': f'Product {i % 20}',
+                'price': Decimal('0.35'),
+            },
+        })
+    pagination = {'page': 1, 'page_size': rows, 'returned_items': rows, 'total_items': rows * 10}
+    return responsify((items, pagination))
+
+
+def run(render, page, repeat):
+    timings = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        body = render(page)
+        timings.append((time.perf_counter() - start_time) * 1000)
+    return body, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the JSON response classes')
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    page = build_page(args.rows)
+    variants = (
+        ('jsonable_encoder + JSONResponse', lambda content: JSONResponse(jsonable_encoder(content)).body),
+        ('FastJSONResponse', lambda content: FastJSONResponse(content).body),
+    )
+
+    bodies = []
+    for name, render in variants:
+        body, timings = run(render, page, args.repeat)
+        bodies.append(body)
+        print(f'{name:35} median {statistics.median(timings):8.2f} ms, min {min(timings):8.2f} ms')
+
+    # Same JSON, only the whitespace differs
+    if json.loads(bodies[0]) != json.loads(bodies[1]):
+        print('The responses differ')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Time `parse_request_params` on a request carrying many `f_` filters, the
+way the list routes call it, e.g.
+
+    python dev/benchmark_parse_request_params.py --model Product --repeat 2000
+
+Every filterable field of the model gets a filter, cycling through the
+operators (equal, <, >, ~) with values of the right type.
+"""
+
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+# Ensure project root on path
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from sqlalchemy import DateTime, Date, String
+
+import backend.models as models
+from backend.helpers import parse_request_params
+
+
+def build_request_args(model_class):
+    request_args = {'page': '2', 'page_size': '50', 'sort_by': '-id'}
+    for index, field in enumerate(model_class.filterable_fields):
+        column_type = getattr(getattr(model_class, field, None), 'type', None)
+        if isinstance(column_type, (DateTime, Date)):
+            value = ('2024-01-31', '<2024-06-30', '>2024-01-01T10:30:00', '2024-01-31')[index % 4]
+        elif isinstance(column_type, String):
+            value = ('active', '~act', 'pending', '~pen')[index % 4]
+        else:
+            value = ('42', '<100', '>1', '7')[index % 4]
+        request_args[f'f_{field}'] = value
+    return request_args
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark parse_request_params')
+    parser.add_argument('--model', default='Product', help='Model class name')
+    parser.add_argument('--repeat', type=int, default=2000)
+    args = parser.parse_args()
+
+    model_class = getattr(models, args.model)
+    request_args = build_request_args(model_class)
+    total_filters = sum(1 for param in request_args if param.startswith('f_'))
+
+    # The first call builds the per model caches
+    parse_request_params(request_args, model_class)
+
+    timings = []
+    for _ in range(args.repeat):
+        start_time = time.perf_counter()
+        parse_request_params(request_args, model_class)
+        timings.append((time.perf_counter() - start_time) * 1_000_000)
+
+    print(
+        f'{args.model} with {total_filters} f_ params: '
+        f'median {statistics.median(timings):.1f} us, min {min(timings):.1f} us per request'
+    )
+
+
+if __name__ == '__main__':
+    main()
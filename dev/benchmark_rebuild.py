@@ -0,0 +1,110 @@
+"""
+Time the seed data load of `rebuild` on the CSV files scaled up, e.g. 100
+times the rows of data/csv:
+
+    python dev/benchmark_rebuild.py --scale 100 --workers 4
+
+The scaled copies are written to a temporary SEED_CSV_DIR. The reference
+tables (roles, users, categories, countries...) are kept as they are, since
+the other rows look them up by name, and the unique columns of the scaled
+tables get a suffix per copy.
+
+This drops and recreates the tables of the configured database
+(POSTGRES_URL), only run it against a development database.
+"""
+
+import os
+import sys
+import shutil
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+
+import pandas as pd
+
+# Ensure project root on path
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+
+REFERENCE_CSV_FILES = {
+    'roles.csv',
+    'users.csv',
+    'event_types.csv',
+    'data_types.csv',
+    'categories.csv',
+    'sub_categories.csv',
+    'selections.csv',
+    'countries.csv',
+    'states.csv',
+}
+
+# Unique columns, and the columns that reference them
+SUFFIXED_COLUMNS = {
+    'dd_users.csv': ['Email'],
+    'offensive_words.csv': ['Word'],
+    'dataset_orders.csv': ['Order Code'],
+    'dataset_order_deliveries.csv': ['Delivery Code', 'Order Code'],
+}
+
+
+def write_scaled_csv_files(source_dir, target_dir, scale):
+    total_rows = 0
+    for csv_path in sorted(Path(source_dir).glob('*.csv')):
+        target_path = Path(target_dir) / csv_path.name
+        if csv_path.name in REFERENCE_CSV_FILES:
+            shutil.copy(csv_path, target_path)
+            continue
+
+        df = pd.read_csv(csv_path)
+        copies = []
+        for index in range(scale):
+            copy = df.copy()
+            for column in SUFFIXED_COLUMNS.get(csv_path.name, []):
+                if column in copy.columns and index:
+                    copy[column] = copy[column].astype(str) + f'-{index}'
+            copies.append(copy)
+        scaled = pd.concat(copies, ignore_index=True)
+        scaled.to_csv(target_path, index=False)
+        total_rows += len(scaled)
+    return total_rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the seed data load of rebuild')
+    parser.add_argument('--scale', type=int, default=100, help='Copies of the rows of every CSV file')
+    parser.add_argument('--source', default=str(root / 'data' / 'csv'), help='Directory of the seed CSV files')
+    parser.add_argument('--workers', type=int, default=None, help='Tables loaded at the same time (SEED_LOAD_WORKERS by default)')
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as csv_dir:
+        total_rows = write_scaled_csv_files(args.source, csv_dir, args.scale)
+        print(f'Scaled the CSV files of {args.source} {args.scale}x ({total_rows:,} rows)')
+
+        # Read by backend.bulk_load when it's imported
+        os.environ['SEED_CSV_DIR'] = csv_dir
+        from backend.database import engine, Base
+        from backend.bulk_load import SEED_LOAD_WORKERS, load_stats, print_load_summary
+        from backend.scripts import load_seed_data
+
+        workers = args.workers or SEED_LOAD_WORKERS
+        timings = []
+        for _ in range(args.repeat):
+            Base.metadata.drop_all(bind=engine)
+            Base.metadata.create_all(bind=engine)
+            load_stats.clear()
+            timings.append(load_seed_data(workers))
+
+        print_load_summary(timings[-1])
+        loaded_rows = sum(rows for _, _, rows, _ in load_stats)
+        print(
+            f'Loaded {loaded_rows:,} rows with {workers} workers: median {statistics.median(timings):.2f} s, '
+            f'min {min(timings):.2f} s ({loaded_rows / min(timings):,.0f} rows/s)'
+        )
+
+
+if __name__ == '__main__':
+    main()
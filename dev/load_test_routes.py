@@ -0,0 +1,82 @@
+"""
+Load test a generated route with many concurrent clients, e.g. to compare
+two versions or configurations of the API.
+
+Start the API, then run this against it from another machine (sharing the
+CPU with the server skews the numbers), e.g.
+
+    uvicorn backend.main:app --host 0.0.0.0 --port 9999
+    python dev/load_test_routes.py --url http://<host>:9999/api/v1/admin/transactions --clients 200
+
+Reports the throughput, the latency percentiles and the errors.
+"""
+
+import time
+import asyncio
+import argparse
+import statistics
+
+import httpx
+
+
+async def run_client(client, url, deadline, latencies, errors):
+    while time.perf_counter() < deadline:
+        start_time = time.perf_counter()
+        try:
+            response = await client.get(url)
+            if response.status_code >= 400:
+                errors[str(response.status_code)] = errors.get(str(response.status_code), 0) + 1
+                continue
+        except httpx.HTTPError as e:
+            errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+            continue
+        latencies.append((time.perf_counter() - start_time) * 1000)
+
+
+def percentile(values, percent):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, int(len(values) * percent / 100))
+    return values[index]
+
+
+async def run(url, clients, duration):
+    latencies = []
+    errors = {}
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(limits=limits, timeout=60) as client:
+        # One request first, so that the route is warm
+        await client.get(url)
+
+        start_time = time.perf_counter()
+        deadline = start_time + duration
+        await asyncio.gather(*[
+            run_client(client, url, deadline, latencies, errors)
+            for _ in range(clients)
+        ])
+        elapsed = time.perf_counter() - start_time
+
+    print(f'{url} with {clients} clients for {elapsed:.1f}s')
+    print(f'  requests:   {len(latencies)} ({len(latencies) / elapsed:.1f}/s)')
+    if latencies:
+        print(f'  latency:    mean {statistics.mean(latencies):.1f} ms, '
+              f'p50 {percentile(latencies, 50):.1f} ms, '
+              f'p95 {percentile(latencies, 95):.1f} ms, '
+              f'p99 {percentile(latencies, 99):.1f} ms')
+    if errors:
+        print(f'  errors:     {errors}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test a route with concurrent clients')
+    parser.add_argument('--url', required=True, help='Full URL of the route')
+    parser.add_argument('--clients', type=int, default=200)
+    parser.add_argument('--duration', type=float, default=30, help='Seconds')
+    args = parser.parse_args()
+
+    asyncio.run(run(args.url, args.clients, args.duration))
+
+
+if __name__ == '__main__':
+    main()